@@ -0,0 +1,62 @@
+"""
+Measure the memory used by the CRS Section models.
+
+Usage:
+
+    python -m benchmarks.crs_memory
+
+Parses every section of the largest CRS fixture, then compares building
+them as slotted, interned `Section`s with building them as plain
+`__dict__`-backed dataclasses holding their own copy of every string.
+"""
+
+import tracemalloc
+from dataclasses import astuple, fields, make_dataclass
+from typing import Any, Callable
+
+from public_law.legal_texts.models.crs import Section
+from public_law.legal_texts.parsers.usa.colorado.crs_sections import parse_sections
+from public_law.test_util import null_logger, xml_fixture
+
+FIXTURE = "usa/crs/title42.xml"
+
+# The Section model as it would be without slots.
+DictSection = make_dataclass(
+    "DictSection", [(f.name, f.type) for f in fields(Section)], frozen=True
+)
+
+
+def measure(build: Callable[[], list[Any]]) -> tuple[list[Any], int, int]:
+    """The built objects, with the net and the peak bytes allocated."""
+    tracemalloc.start()
+    objects = build()
+    net, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return objects, net, peak
+
+
+def copied(value: Any) -> Any:
+    """A new string object equal to `value`, as an uninterned parse would make."""
+    return None if value is None else type(value)("".join(value))
+
+
+def main() -> None:
+    sections, _, parse_peak = measure(lambda: parse_sections(xml_fixture(FIXTURE, FIXTURE), null_logger))
+    values = [astuple(s) for s in sections]
+    count  = len(values)
+
+    _, slotted, slotted_peak = measure(
+        lambda: [Section(*[copied(v) for v in row]) for row in values]
+    )
+    _, plain, plain_peak = measure(
+        lambda: [DictSection(*[copied(v) for v in row]) for row in values]
+    )
+
+    print(f"{count} sections from {FIXTURE}; parsing peaked at {parse_peak / 1024:,.0f} KiB")
+    print(f"  __dict__, not interned: {plain / count:6.0f} B/section, peak {plain_peak / 1024:7,.0f} KiB")
+    print(f"  slots, interned:        {slotted / count:6.0f} B/section, peak {slotted_peak / 1024:7,.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
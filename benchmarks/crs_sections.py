@@ -0,0 +1,53 @@
+"""
+Benchmark building CRS Sections from parsed strings.
+
+Usage:
+
+    python -m benchmarks.crs_sections
+
+Compares the cost per section of building a `Section` from five
+`NonemptyString(...)` calls with that of `Section.from_parsed()`, for
+every section of the largest CRS fixture.
+"""
+
+import timeit
+
+from public_law.legal_texts.models.crs import Section
+from public_law.legal_texts.parsers.usa.colorado.crs_sections import parse_sections
+from public_law.shared.utils.text import NonemptyString
+from public_law.test_util import null_logger, xml_fixture
+
+FIXTURE = "usa/crs/title42.xml"
+
+
+def build_validated(rows: list[tuple[str, str, str]]) -> list[Section]:
+    return [
+        Section(
+            name           = NonemptyString(name),
+            number         = NonemptyString(number),
+            text           = NonemptyString(text),
+            article_number = NonemptyString(number.split('-')[1]),
+            part_number    = None,
+            title_number   = NonemptyString(number.split('-')[0])
+        )
+        for name, number, text in rows
+    ]
+
+
+def build_from_parsed(rows: list[tuple[str, str, str]]) -> list[Section]:
+    return [Section.from_parsed(name, number, text) for name, number, text in rows]
+
+
+def main() -> None:
+    sections = parse_sections(xml_fixture(FIXTURE, FIXTURE), null_logger)
+    rows     = [(str(s.name), str(s.number), str(s.text)) for s in sections]
+
+    assert build_validated(rows) == build_from_parsed(rows)
+
+    for label, build in (("NonemptyString(...)", build_validated), ("Section.from_parsed", build_from_parsed)):
+        seconds = min(timeit.repeat(lambda: build(rows), number=20, repeat=5)) / 20
+        print(f"{label:<20} {seconds / len(rows) * 1e6:5.2f} µs/section")
+
+
+if __name__ == "__main__":
+    main()
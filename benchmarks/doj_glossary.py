@@ -0,0 +1,50 @@
+"""
+Benchmark the Canada DOJ glossary parser.
+
+Usage:
+
+    python -m benchmarks.doj_glossary
+
+Parses the laws-lois.justice.gc.ca glossary fixture, and copies of it with
+its <dl> repeated to grow the number of entries. With linear pairing of
+<dt>s and <dd>s, the time per entry stays about the same as the glossary
+grows.
+"""
+
+import re
+import timeit
+
+from scrapy.http.response.html import HtmlResponse
+
+from public_law.glossaries.parsers.can.doj_glossaries import parse_entries
+from public_law.test_util import fixture_text
+
+FIXTURE = "can/index.html"
+URL     = "https://laws-lois.justice.gc.ca/eng/glossary/"
+SCALES  = (1, 10, 100, 1000)
+
+
+def scaled_response(scale: int) -> HtmlResponse:
+    """The fixture, with the contents of its first <dl> repeated `scale` times."""
+    html  = fixture_text(FIXTURE)
+    match = re.search(r"(<dl[^>]*>)(.*?)(</dl>)", html, re.DOTALL)
+    assert match is not None
+
+    body = html[:match.start(2)] + match.group(2) * scale + html[match.end(2):]
+    return HtmlResponse(url=URL, body=body.encode("utf-8"), encoding="utf-8")
+
+
+def main() -> None:
+    for scale in SCALES:
+        response = scaled_response(scale)
+        _ = response.selector  # Build the lxml tree outside the timing.
+
+        entry_count = len(parse_entries(response))
+        runs        = max(1, 1000 // scale)
+        seconds     = min(timeit.repeat(lambda: parse_entries(response), number=runs, repeat=3)) / runs
+
+        print(f"{entry_count:>7} entries: {seconds * 1000:9.2f} ms, {seconds / entry_count * 1e6:6.1f} µs/entry")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""
+Benchmark creating repeated subject URLs.
+
+Usage:
+
+    python -m benchmarks.subjects
+
+The same Library of Congress subject is created again and again, as when
+every glossary's metadata names it. It's built without the interning and
+with it.
+"""
+
+import timeit
+
+from public_law.shared.utils import text
+from public_law.shared.utils.text import LoCSubject
+
+ID = "sh85034952"
+
+
+def main() -> None:
+    build = text._subject_url.__wrapped__  # type: ignore
+
+    timings = {
+        "built":    lambda: build(LoCSubject, ID),
+        "interned": lambda: LoCSubject(ID),
+    }
+
+    for label, run in timings.items():
+        seconds = min(timeit.repeat(run, number=2_000, repeat=5)) / 2_000
+        print(f"  {label:<10} {seconds * 1e6:7.2f} µs/subject")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Benchmark titleizing repeated names.
+
+Usage:
+
+    python -m benchmarks.titleize
+
+The workload is every CRS division name in the fixtures, each repeated
+once per article after it. This approximates the repetition when each
+article's division name is worked out.
+It's titleized without the memoization, with it, and with `titleize_all()`.
+"""
+
+import timeit
+
+from public_law.legal_texts.parsers.usa.colorado.crs_articles import div_name_text
+from public_law.shared.utils.text import normalize_whitespace, titleize, titleize_all
+from public_law.test_util import xml_fixture
+
+TITLES = ("01", "04", "07", "16", "42")
+
+
+def workload() -> list[str]:
+    names: list[str] = []
+
+    for number in TITLES:
+        dom = xml_fixture(f"usa/crs/title{number}.xml", f"title{number}.xml").selector
+        for div_node in dom.xpath("//T-DIV"):
+            match div_name_text(div_node):
+                case str(name) if name:
+                    article_count = len(div_node.xpath("following-sibling::TA-LIST"))
+                    names.extend([normalize_whitespace(name)] * max(1, article_count))
+                case _:
+                    pass
+
+    return names
+
+
+def main() -> None:
+    names     = workload()
+    uncached  = titleize.__wrapped__  # type: ignore
+
+    timings = {
+        "titleize, not memoized": lambda: [uncached(n) for n in names],
+        "titleize, memoized":     lambda: [titleize(n) for n in names],
+        "titleize_all":           lambda: titleize_all(names),
+    }
+
+    print(f"{len(names)} names, {len(set(names))} distinct")
+    for label, run in timings.items():
+        seconds = min(timeit.repeat(run, number=5, repeat=3)) / 5
+        print(f"  {label:<24} {seconds / len(names) * 1e6:7.2f} µs/name")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""
+A streaming JSON Lines feed exporter, optionally compressed.
+
+Scrapy's `json` format is one JSON array, which consumers have to read
+whole. JSON Lines can be read one item at a time, as it's written. These
+formats are registered in `FEED_EXPORTERS`:
+
+    jsonl      One JSON object per line.
+    jsonl.gz   The same, gzip-compressed.
+    jsonl.zst  The same, zstd-compressed. Needs the `zstandard` package.
+
+For example:
+
+    scrapy crawl -O tmp/crs.jsonl.gz:jsonl.gz usa_colorado_crs
+
+Lines are collected in a write buffer of `FEED_EXPORT_BUFFER_SIZE` bytes,
+and written out when it's full. `FEED_EXPORT_FSYNC` says when the file is
+synced to disk:
+
+    "never"   Leave it to the OS.
+    "close"   Once, when the feed is finished. The default.
+    "flush"   Every time the buffer is written out. Readers of a
+              compressed stream can then decode everything up to that point.
+
+Both can be set per feed, too, in its `item_export_kwargs`.
+"""
+
+import gzip
+import io
+import os
+from typing import IO, Any, Literal, Protocol, TypeAlias
+
+from scrapy.crawler import Crawler
+from scrapy.exceptions import NotConfigured
+from scrapy.exporters import JsonLinesItemExporter
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+Compression: TypeAlias = Literal["gzip", "zstd"]
+FsyncPolicy: TypeAlias = Literal["never", "close", "flush"]
+
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+FSYNC_POLICIES: tuple[FsyncPolicy, ...] = ("never", "close", "flush")
+
+
+class _Stream(Protocol):
+    def write(self, data: bytes, /) -> int: ...
+    def flush(self) -> Any: ...
+    def close(self) -> None: ...
+
+
+class JsonLinesStreamExporter(JsonLinesItemExporter):
+    """JSON Lines, written through a bounded buffer and an optional compressor."""
+
+    compression: Compression | None = None
+
+    def __init__(
+        self,
+        file: IO[bytes],
+        *,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        fsync: FsyncPolicy = "close",
+        **kwargs: Any,
+    ):
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"Unknown fsync policy {fsync!r}; expected one of {FSYNC_POLICIES}")
+
+        # Scrapy's exporter writes each line into the buffer.
+        self.buffer = io.BytesIO()
+        super().__init__(self.buffer, **kwargs)  # type: ignore
+        self.target      = file
+        self.stream      = _compressor(file, self.compression)
+        self.buffer_size = buffer_size
+        self.fsync       = fsync
+
+    @classmethod
+    def from_crawler(cls, crawler: Crawler, file: IO[bytes], **kwargs: Any):
+        settings = crawler.settings
+        _ = kwargs.setdefault("buffer_size", settings.getint("FEED_EXPORT_BUFFER_SIZE", DEFAULT_BUFFER_SIZE))
+        _ = kwargs.setdefault("fsync", settings.get("FEED_EXPORT_FSYNC", "close"))
+
+        return cls(file, **kwargs)
+
+    def export_item(self, item: Any) -> None:
+        super().export_item(item)
+
+        if self.buffer.tell() >= self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write out the buffer, and sync it to disk if the policy says so."""
+        self._write_buffer()
+
+        if self.fsync == "flush":
+            _ = self.stream.flush()
+            _sync(self.target)
+
+    def finish_exporting(self) -> None:
+        self._write_buffer()
+
+        if self.stream is not self.target:
+            self.stream.close()
+
+        if self.fsync != "never":
+            _sync(self.target)
+
+    def _write_buffer(self) -> None:
+        _ = self.stream.write(self.buffer.getvalue())
+        _ = self.buffer.seek(0)
+        _ = self.buffer.truncate()
+
+
+class GzipJsonLinesExporter(JsonLinesStreamExporter):
+    compression = "gzip"
+
+
+class ZstdJsonLinesExporter(JsonLinesStreamExporter):
+    compression = "zstd"
+
+
+def exporter_class(path: str | os.PathLike[str]) -> type[JsonLinesStreamExporter]:
+    """The exporter for a file name ending in .gz, .zst, or anything else."""
+    match os.path.splitext(path)[1]:
+        case ".gz":
+            return GzipJsonLinesExporter
+        case ".zst":
+            return ZstdJsonLinesExporter
+        case _:
+            return JsonLinesStreamExporter
+
+
+def _compressor(file: IO[bytes], compression: Compression | None) -> _Stream:
+    """A stream compressing into the file, which is left open when it's closed."""
+    match compression:
+        case None:
+            return file
+        case "gzip":
+            # No timestamp in the header, so that equal feeds are equal files.
+            return gzip.GzipFile(fileobj=file, mode="wb", mtime=0)
+        case "zstd":
+            if zstandard is None:
+                raise NotConfigured("The jsonl.zst feed format needs the zstandard package")
+            return zstandard.ZstdCompressor().stream_writer(file, closefd=False)
+
+
+def _sync(file: IO[bytes]) -> None:
+    """Flush the file and fsync it, if it's a real file."""
+    file.flush()
+    try:
+        os.fsync(file.fileno())
+    except (AttributeError, OSError, ValueError):
+        pass
@@ -0,0 +1,18 @@
+"""
+Scrapy extensions.
+
+See https://docs.scrapy.org/en/latest/topics/extensions.html
+"""
+
+from scrapy.crawler import Crawler
+
+from public_law.shared.utils import dates
+
+
+class RunClock:
+    """Set the run's clock to the `TIMEZONE` setting."""
+
+    @classmethod
+    def from_crawler(cls, crawler: Crawler) -> "RunClock":
+        _ = dates.use_timezone(crawler.settings.get("TIMEZONE", dates.DEFAULT_TIMEZONE))
+        return cls()
@@ -0,0 +1,59 @@
+"""
+A directory of archived glossary pages, for re-parsing without a crawl.
+
+The layout is one directory per spider, and one HTML file per page. The
+file name is the page's URL, percent-encoded:
+
+    CORPUS_DIR/
+      usa_courts_glossary/
+        https%3A%2F%2Fwww.uscourts.gov%2Fglossary.html
+      can_doj_glossary/
+        https%3A%2F%2Flaws-lois.justice.gc.ca%2Feng%2Fglossary%2F.html
+        ...
+
+Pages are stored as UTF-8, whatever the encoding of the original response.
+"""
+
+from pathlib import Path
+from typing import NamedTuple
+from urllib.parse import quote, unquote
+
+from scrapy.http.response.html import HtmlResponse
+
+SUFFIX = ".html"
+
+
+class ArchivedPage(NamedTuple):
+    """One stored page of a spider's glossary."""
+
+    spider_name: str
+    url:         str
+    path:        Path
+
+    def response(self) -> HtmlResponse:
+        return HtmlResponse(url=self.url, body=self.path.read_bytes(), encoding="utf-8")
+
+
+def page_path(corpus_dir: Path, spider_name: str, url: str) -> Path:
+    return corpus_dir / spider_name / (quote(url, safe="") + SUFFIX)
+
+
+def archive_response(corpus_dir: Path, spider_name: str, response: HtmlResponse) -> Path:
+    """Store the response in the corpus, replacing any earlier copy."""
+    path = page_path(corpus_dir, spider_name, response.url)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _ = path.write_bytes(response.text.encode("utf-8"))
+
+    return path
+
+
+def archived_pages(corpus_dir: Path, spider_name: str) -> list[ArchivedPage]:
+    """All of a spider's stored pages, sorted by URL."""
+    spider_dir = corpus_dir / spider_name
+    if not spider_dir.is_dir():
+        return []
+
+    return sorted(
+        ArchivedPage(spider_name, unquote(path.name.removesuffix(SUFFIX)), path)
+        for path in spider_dir.glob(f"*{SUFFIX}")
+    )
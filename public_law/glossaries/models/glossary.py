@@ -1,5 +1,7 @@
 import dataclasses
 from dataclasses import dataclass
+from functools import cached_property
+from types import MappingProxyType
 from typing import Any, Callable, TypeAlias
 
 from scrapy.http.response.html import HtmlResponse
@@ -8,7 +10,7 @@ from public_law.shared.models.metadata import Metadata
 from public_law.shared.utils.text import NonemptyString, Sentence
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GlossaryEntry:
     """Represents one term and its definition in a particular Glossary"""
 
@@ -32,50 +34,62 @@ class GlossaryParseResult:
             "entries": [entry.asdict() for entry in self.entries],
         }
 
+    @cached_property
+    def _mapping(self) -> MappingProxyType[str, Any]:
+        """
+        A read-only view of `asdict()`, built at most once per instance.
+
+        The mapping methods below all use it, so e.g. `result["entries"]`
+        doesn't convert every entry again. Its values are shared between
+        calls, so don't modify them. `asdict()`, `copy()` and `|` build
+        private copies, nested values included.
+        """
+        return MappingProxyType(self.asdict())
+
     def __contains__(self, item: Any) -> bool:
-        return self.asdict().__contains__(item)
+        return self._mapping.__contains__(item)
 
     def __getitem__(self, item: Any) -> Any:
-        return self.asdict().__getitem__(item)
+        return self._mapping.__getitem__(item)
 
     def __eq__(self, __t: Any):
-        return self.asdict().__eq__(__t)
+        return self._mapping.__eq__(__t)
 
     def __ne__(self, __t: Any):
-        return self.asdict().__ne__(__t)
+        return self._mapping.__ne__(__t)
 
     def __iter__(self):
-        return self.asdict().__iter__()
+        return self._mapping.__iter__()
 
     def __len__(self):
-        return self.asdict().__len__()
+        return self._mapping.__len__()
 
     def __or__(self, __t: Any):
         return self.asdict().__or__(__t)
 
     def __ior__(self, __t: Any):
-        return self.asdict().__ior__(__t)
+        return self.asdict().__or__(__t)
 
     def __reversed__(self):
-        return self.asdict().__reversed__()
+        return self._mapping.__reversed__()
 
     def __ror__(self, __t: Any):
         return self.asdict().__ror__(__t)
 
     def copy(self):
-        return self.asdict().copy()
+        return self.asdict()
 
     def get(self, item: Any, default: Any = None):
-        return self.asdict().get(item, default)
+        return self._mapping.get(item, default)
 
     def items(self):
-        return self.asdict().items()
+        return self._mapping.items()
 
     def keys(self):
-        return self.asdict().keys()
+        return self._mapping.keys()
 
     def values(self):
-        return self.asdict().values()
+        return self._mapping.values()
 
 
 ParseFunction: TypeAlias = Callable[[HtmlResponse], GlossaryParseResult]
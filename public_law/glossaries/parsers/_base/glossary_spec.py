@@ -0,0 +1,171 @@
+# pyright: reportUnknownVariableType=false
+# pyright: reportUnknownMemberType=false
+# pyright: reportUnknownArgumentType=false
+
+"""
+A declarative extraction engine for simply structured glossaries.
+
+Many glossaries are either a definition list, where the <dt> terms and <dd>
+definitions can be paired up in order, or a table with one term and its
+definition per row. For these, a `GlossarySpec` describes where the terms
+and definitions are and how to clean them up, and `compile_glossary()` turns
+it into a `parse_entries()` function:
+
+    SPEC = GlossarySpec(terms="//dt", definitions="//dd")
+
+    parse_entries = compile_glossary(SPEC)
+
+The XPath expressions are compiled once, and run directly against the lxml
+tree which Scrapy has already built for the response. No BeautifulSoup tree
+is created.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Literal, TypeAlias
+
+from lxml import etree
+from scrapy.http.response.html import HtmlResponse
+from toolz.functoolz import compose_left
+
+from public_law.glossaries.models.glossary import GlossaryEntry
+from public_law.shared.exceptions import ParseException
+from public_law.shared.utils.text import NonemptyString, Sentence, cleanup
+
+# How terms are matched up with definitions:
+#   "zip": the n-th term goes with the n-th definition.
+#   "row": each row holds one term and its definition.
+Pairing: TypeAlias = Literal["zip", "row"]
+
+# How a node's text is read:
+#   "string":   all the text inside it, like BeautifulSoup's `.text`.
+#   "stripped": each piece of text stripped, then joined, like `.get_text(strip=True)`.
+TextMode: TypeAlias = Literal["string", "stripped"]
+
+# With "zip" pairing, what to do when there are more terms than
+# definitions, or vice versa:
+#   "zip":   pair them up as far as both go.
+#   "raise": raise a ParseException.
+#   "empty": return no entries at all.
+Mismatch: TypeAlias = Literal["zip", "raise", "empty"]
+
+Cleanup: TypeAlias = Callable[[Any], Any]
+ParseEntries: TypeAlias = Callable[[HtmlResponse], tuple[GlossaryEntry, ...]]
+
+
+@dataclass(frozen=True)
+class GlossarySpec:
+    """
+    Where a glossary's terms and definitions are, and how to clean them up.
+
+    With "zip" pairing, `terms` and `definitions` select nodes in the whole
+    document. With "row" pairing, `rows` selects the rows and `terms` and
+    `definitions` are relative to each row; the first match is used.
+
+    `term_text` and `definition_text` optionally select, relative to the
+    term or definition node, the first node to take the text from.
+
+    A pair is skipped when any of its nodes is missing or its text is blank.
+    The cleanup functions are then applied in order to the remaining texts.
+    """
+
+    terms:       str
+    definitions: str
+    pairing:     Pairing = "zip"
+    rows:        str | None = None
+
+    term_text:       str | None = None
+    definition_text: str | None = None
+    text:            TextMode = "string"
+
+    phrase_cleanup:     tuple[Cleanup, ...] = (cleanup,)
+    definition_cleanup: tuple[Cleanup, ...] = (Sentence,)
+
+    on_mismatch: Mismatch = "zip"
+
+    def __post_init__(self):
+        if self.pairing == "row" and self.rows is None:
+            raise ValueError("A 'row' GlossarySpec needs a `rows` selector")
+
+
+def compile_glossary(spec: GlossarySpec) -> ParseEntries:
+    """Compile the spec into a `parse_entries()` function."""
+    terms       = etree.XPath(spec.terms)
+    definitions = etree.XPath(spec.definitions)
+    rows        = etree.XPath(spec.rows) if spec.rows else None
+
+    term_text       = _text_reader(spec.term_text, spec.text)
+    definition_text = _text_reader(spec.definition_text, spec.text)
+
+    clean_phrase     = compose_left(*spec.phrase_cleanup)
+    clean_definition = compose_left(*spec.definition_cleanup)
+
+    def raw_pairs(root: Any) -> Iterable[tuple[Any, Any]]:
+        match rows:
+            case None:
+                term_nodes, definition_nodes = terms(root), definitions(root)
+                match spec.on_mismatch:
+                    case _ if len(term_nodes) == len(definition_nodes):
+                        pass
+                    case "raise":
+                        raise ParseException(
+                            f"Found {len(term_nodes)} terms but {len(definition_nodes)} definitions"
+                        )
+                    case "empty":
+                        return ()
+                    case "zip":
+                        pass
+                return zip(term_nodes, definition_nodes)
+            case _:
+                return (
+                    (_first(terms(row)), _first(definitions(row)))
+                    for row in rows(root)
+                )
+
+    def parse_entries(response: HtmlResponse) -> tuple[GlossaryEntry, ...]:
+        entries: list[GlossaryEntry] = []
+
+        for term, definition in raw_pairs(response.selector.root):
+            match term_text(term), definition_text(definition):
+                case str(phrase), str(defn) if phrase.strip() and defn.strip():
+                    entries.append(
+                        GlossaryEntry(NonemptyString(clean_phrase(phrase)), Sentence(clean_definition(defn)))
+                    )
+                case _:
+                    continue
+
+        return tuple(entries)
+
+    return parse_entries
+
+
+_string_value = etree.XPath("string()", smart_strings=False)
+_text_nodes   = etree.XPath(".//text()", smart_strings=False)
+
+
+def _stripped_text(node: Any) -> str:
+    return "".join(s.strip() for s in _text_nodes(node))
+
+
+def _text_reader(selector: str | None, mode: TextMode) -> Callable[[Any], str | None]:
+    """A function returning the text of a node, or of its first match of the selector."""
+    sub_node  = etree.XPath(selector) if selector else None
+    read_text = _string_value if mode == "string" else _stripped_text
+
+    def text_of(node: Any) -> str | None:
+        match node, sub_node:
+            case None, _:
+                return None
+            case _, None:
+                return read_text(node)
+            case _, xpath:
+                match _first(xpath(node)):
+                    case None:
+                        return None
+                    case inner:
+                        return read_text(inner)
+
+    return text_of
+
+
+def _first(nodes: list[Any]) -> Any:
+    return nodes[0] if nodes else None
@@ -1,7 +1,12 @@
 from scrapy.http.response.html import HtmlResponse
 
 from public_law.glossaries.models.glossary import GlossaryEntry
-from public_law.shared.utils.text import Sentence, make_soup, cleanup
+from public_law.glossaries.parsers._base.glossary_spec import GlossarySpec, compile_glossary
+
+# The entries are <dt>/<dd> pairs.
+SPEC = GlossarySpec(terms="//dt", definitions="//dd")
+
+_parse_entries = compile_glossary(SPEC)
 
 
 def parse_entries(html: HtmlResponse) -> tuple[GlossaryEntry, ...]:
@@ -10,13 +15,4 @@ def parse_entries(html: HtmlResponse) -> tuple[GlossaryEntry, ...]:
     
     Returns a tuple of GlossaryEntry objects with cleaned phrases and definitions.
     """
-    soup = make_soup(html)
-    raw_entries = zip(soup("dt"), soup("dd"))
-
-    return tuple(
-        GlossaryEntry(
-            phrase=cleanup(phrase.text),
-            definition=Sentence(defn.text),
-        )
-        for phrase, defn in raw_entries
-    )
+    return _parse_entries(html)
@@ -1,10 +1,19 @@
-from typing import List
-
 from scrapy.http.response.html import HtmlResponse
-from typed_soup import from_response
 
 from public_law.glossaries.models.glossary import GlossaryEntry
-from public_law.shared.utils.text import NonemptyString as String, Sentence
+from public_law.glossaries.parsers._base.glossary_spec import GlossarySpec, compile_glossary
+from public_law.shared.utils.text import NonemptyString as String
+
+SPEC = GlossarySpec(
+    terms           = "//dt",
+    definitions     = "//dd[contains(concat(' ', normalize-space(@class), ' '), ' glossdef ')]",
+    term_text       = ".//span[contains(concat(' ', normalize-space(@class), ' '), ' glossterm ')]",
+    definition_text = ".//p",
+    text            = "stripped",
+    phrase_cleanup  = (String,),
+)
+
+_parse_entries = compile_glossary(SPEC)
 
 
 def parse_entries(html: HtmlResponse) -> tuple[GlossaryEntry, ...]:
@@ -13,37 +22,6 @@ def parse_entries(html: HtmlResponse) -> tuple[GlossaryEntry, ...]:
     
     Returns a tuple of GlossaryEntry objects with cleaned phrases and definitions.
     The entries are in a definition list (<dl>) with <dt> containing <span class="glossterm"> for terms 
-    and <dd class="glossdef"> containing <p> for definitions.
+    and <dd class="glossdef"> containing <p> for definitions. Source order is preserved.
     """
-    entries: List[GlossaryEntry] = []
-    soup = from_response(html)
-
-    # Find all dt/dd pairs in the glossary
-    dts = soup("dt")
-    dds = soup("dd", class_="glossdef")
-
-    for dt, dd in zip(dts, dds):
-        # Extract the text content from the span.glossterm element
-        phrase_elem = dt.find("span", class_="glossterm")
-        if not phrase_elem:
-            continue
-
-        phrase = phrase_elem.get_text(strip=True)
-
-        # Find the definition paragraph
-        p_elem = dd.find("p")
-        if not p_elem:
-            continue
-
-        definition = p_elem.get_text(strip=True)
-
-        if phrase and definition:
-            entries.append(
-                GlossaryEntry(
-                    phrase=String(phrase),
-                    definition=Sentence(definition),
-                )
-            )
-
-    # Do not sort; preserve source order
-    return tuple(entries)
+    return _parse_entries(html)
@@ -1,8 +1,9 @@
 import re
-from typing import Any, TypeAlias
+from typing import Any, Iterable, TypeAlias
 
+from lxml import etree
 from scrapy.http.response.html import HtmlResponse
-from scrapy.selector.unified import Selector, SelectorList
+from scrapy.selector.unified import SelectorList
 
 from public_law.shared.exceptions import ParseException
 from public_law.shared.models.metadata import Subject
@@ -109,44 +110,62 @@ def configured_urls() -> list[str]:
 
 def parse_entries(html: HtmlResponse) -> tuple[GlossaryEntry, ...]:
     """Parse entries from the HTML response."""
-    entries: list[GlossaryEntry] = []
-
     match html.selector.css("main dl"):
         case [first, *_]:
-            first_dl_list = first
+            first_dl_list = first.root
         case _:
             raise ParseException("Expected a <dl>")
 
-    prop: Any
-    for prop in first_dl_list.xpath("dt"):
-        assert isinstance(prop, Selector)
-
-        match prop.xpath("./following-sibling::dd").get():
-            case str(result):
-                # Get the inner text and preserve inner HTML.
-                definition = capitalize_first_char(
-                    (result.replace("<dd>", "").replace(
-                        "</dd>", "").replace("  ", " "))
-                )
-            case _:
-                raise ParseException("Could not parse the definition")
+    return tuple(
+        GlossaryEntry(
+            phrase=_parse_phrase(term),
+            definition=Sentence(
+                ensure_ends_with_period(cleanup(capitalize_first_char(definition)))
+            ),
+        )
+        for term, definition in _pair_terms_with_definitions(first_dl_list)
+    )
 
-        match prop.xpath("normalize-space(descendant::text())").get():
-            case str(result):
-                phrase = NonemptyString(re.sub(r":$", "", result))
+
+def _pair_terms_with_definitions(dl: Any) -> Iterable[tuple[Any, str]]:
+    """
+    Pair each <dt> with the inner HTML of the <dd>s after it, in one pass.
+
+    Consecutive <dt>s share the <dd>s which follow them, and consecutive
+    <dd>s are joined into one definition.
+    """
+    terms: list[Any] = []
+    definitions: list[str] = []
+
+    for child in dl.iterchildren("dt", "dd"):
+        match child.tag:
+            case "dt":
+                if definitions:
+                    yield from ((t, " ".join(definitions)) for t in terms)
+                    terms, definitions = [], []
+                terms.append(child)
             case _:
-                raise ParseException("Could not parse the phrase")
-
-        entries.append(
-            GlossaryEntry(
-                phrase=phrase,
-                definition=Sentence(
-                    ensure_ends_with_period(cleanup(definition))
-                ),
-            )
-        )
+                definitions.append(_inner_html(child))
+
+    if terms and not definitions:
+        raise ParseException("Could not parse the definition")
+    yield from ((t, " ".join(definitions)) for t in terms)
+
+
+def _inner_html(element: Any) -> str:
+    outer: str = etree.tostring(element, method="html", encoding="unicode", with_tail=False)
+    return outer[outer.index(">") + 1:].removesuffix(f"</{element.tag}>").replace("  ", " ")
+
+
+def _parse_phrase(term: Any) -> NonemptyString:
+    match _first_text(term):
+        case str(result) if result:
+            return NonemptyString(re.sub(r":$", "", result))
+        case _:
+            raise ParseException("Could not parse the phrase")
+
 
-    return tuple(entries)
+_first_text = etree.XPath("normalize-space(descendant::text())", smart_strings=False)
 
 
 def parse_name(html: SelectorLike) -> str:
@@ -1,28 +1,26 @@
 from scrapy.http.response.html import HtmlResponse
 
 from public_law.glossaries.models.glossary import GlossaryEntry
-from public_law.shared.utils.text import NonemptyString as String, Sentence
-from public_law.shared.utils.text import make_soup, normalize_whitespace
+from public_law.glossaries.parsers._base.glossary_spec import GlossarySpec, compile_glossary
+from public_law.shared.utils.text import NonemptyString as String
+from public_law.shared.utils.text import normalize_whitespace
 
 
-def parse_entries(html: HtmlResponse) -> tuple[GlossaryEntry, ...]:
-    """Parse entries from the HTML response."""
-    soup = make_soup(html)
+def _fix_usher(phrase: str) -> str:
+    """Fix the "Usher..." entry."""
+    return "Usher of the Black Rod" if phrase.startswith("Usher") else phrase
 
+
+SPEC = GlossarySpec(
     # Skip the "Committees" entry.
-    terms = [t for t in soup("dt") if t.text != 'Committees']
-
-    # Fix the "Usher..." entry.
-    raw_phrases = [t.text for t in terms]
-    phrases = ["Usher of the Black Rod" if p.startswith(
-        "Usher") else p for p in raw_phrases]
-
-    raw_entries = zip(phrases, soup("dd"))
-
-    return tuple(
-        GlossaryEntry(
-            phrase=String(normalize_whitespace(phrase)),
-            definition=Sentence(defn.text),
-        )
-        for phrase, defn in raw_entries
-    )
+    terms       = "//dt[string() != 'Committees']",
+    definitions = "//dd",
+    phrase_cleanup = (_fix_usher, normalize_whitespace, String),
+)
+
+_parse_entries = compile_glossary(SPEC)
+
+
+def parse_entries(html: HtmlResponse) -> tuple[GlossaryEntry, ...]:
+    """Parse entries from the HTML response."""
+    return _parse_entries(html)
@@ -1,40 +1,33 @@
 from datetime import date, datetime
 
-from bs4 import Tag
 from scrapy.http.response.html import HtmlResponse
 
 from public_law.glossaries.models.glossary import GlossaryEntry
+from public_law.glossaries.parsers._base.glossary_spec import GlossarySpec, compile_glossary
 from public_law.shared.utils.text import Sentence, ensure_ends_with_period, make_soup, cleanup, normalize_quotes
 
+_DEFINITION_LIST = "(//dl[contains(concat(' ', normalize-space(@class), ' '), ' wp-block-simple-definition-list-blocks-list ')])[1]"
+
+
+SPEC = GlossarySpec(
+    # Skip the header row (first dt/dd pair)
+    terms       = f"({_DEFINITION_LIST}//dt)[position() > 1]",
+    definitions = f"({_DEFINITION_LIST}//dd)[position() > 1]",
+    # As before the spec, a page whose terms and definitions don't pair
+    # up gives no entries.
+    on_mismatch = "empty",
+    definition_cleanup = (normalize_quotes, cleanup, ensure_ends_with_period, Sentence),
+)
+
+_parse_entries = compile_glossary(SPEC)
+
 
 def parse_entries(html: HtmlResponse) -> tuple[GlossaryEntry, ...]:
     """
     Parse the glossary entries from the HTML response.
     The entries are in a definition list (<dl>) with <dt> for terms and <dd> for definitions.
     """
-    soup = make_soup(html)
-    dl = soup.find("dl", class_="wp-block-simple-definition-list-blocks-list")
-    if not dl or not isinstance(dl, Tag):
-        return tuple()
-
-    # Skip the header row (first dt/dd pair)
-    terms = list(dl("dt"))[1:]  # Skip first dt
-    definitions = list(dl("dd"))[1:]  # Skip first dd
-
-    if not terms or not definitions or len(terms) != len(definitions):
-        return tuple()
-
-    return tuple(
-        GlossaryEntry(
-            phrase=cleanup(term.text),
-            definition=Sentence(
-                ensure_ends_with_period(
-                    cleanup(normalize_quotes(defn.text))
-                )
-            ),
-        )
-        for term, defn in zip(terms, definitions)
-    )
+    return _parse_entries(html)
 
 
 def parse_mod_date(html: HtmlResponse) -> date:
@@ -17,8 +17,22 @@
 from scrapy.http.response.html import HtmlResponse
 
 from ...models.glossary    import GlossaryEntry
+from .._base.glossary_spec import GlossarySpec, compile_glossary
 
-from ....shared.utils.text import make_soup, cleanup, Sentence
+from ....shared.utils.text import cleanup, Sentence
+
+
+# Declare where the terms and definitions are, and how to clean them up.
+SPEC = GlossarySpec(
+    terms              = "//dt",       # Every <dt> is a term
+    definitions        = "//dd",       # and every <dd> is its definition.
+    on_mismatch        = "raise",      # Ensure each term has a definition.
+    phrase_cleanup     = (cleanup,),   # Normalize the whitespace of the terms.
+    definition_cleanup = (Sentence,),  # Make each definition a proper sentence.
+)
+
+# Compile the spec once, into a fast function which reads Scrapy's own HTML tree.
+_parse_entries = compile_glossary(SPEC)
 
 
 def parse_entries(response: HtmlResponse) -> tuple[GlossaryEntry, ...]:
@@ -38,13 +52,4 @@ def parse_entries(response: HtmlResponse) -> tuple[GlossaryEntry, ...]:
     This function parses the <dl> definition list into a tuple of
     GlossaryEntry objects.
     """
-    soup = make_soup(response)                 # Parse the HTML response into a BeautifulSoup object
-    dt_list, dd_list = soup("dt"), soup("dd")  # Extract all <dt> (terms) and <dd> (definitions)
-    assert len(dt_list) == len(dd_list)        # Ensure each term has a definition
-    list_of_pairs = zip(dt_list, dd_list)      # Pair each <dt> with its corresponding <dd>
-
-    # Convert the list of pairs into a tuple of GlossaryEntry objects
-    return tuple(
-        GlossaryEntry(phrase=cleanup(dt.text), definition=Sentence(dd.text))
-        for dt, dd in list_of_pairs
-    )
+    return _parse_entries(response)
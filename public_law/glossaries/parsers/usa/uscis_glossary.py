@@ -1,7 +1,6 @@
 from typing import Any, Iterable
 
 from scrapy.http.response.html import HtmlResponse
-from toolz.functoolz import pipe  # type: ignore
 
 from ...models.glossary import GlossaryEntry
 
@@ -23,17 +22,6 @@ def _parse_entries(html: HtmlResponse) -> Iterable[GlossaryEntry]:
     functions for cleaning up the definitions and phrases.
     """
 
-    def cleanup_definition(defn: str) -> text.Sentence:
-        assert isinstance(defn, str)
-
-        return pipe(
-            defn,
-            text.cleanup,
-            text.cleanup,
-            text.capitalize_first_char,
-            text.Sentence,
-        ) # type: ignore
-
     def cleanup_phrase(phrase: str) -> String:
         assert isinstance(phrase, str)
 
@@ -48,10 +36,13 @@ def _parse_entries(html: HtmlResponse) -> Iterable[GlossaryEntry]:
         
         yield GlossaryEntry(
             phrase=cleanup_phrase(phrase),
-            definition=cleanup_definition(defn),
+            definition=_cleanup_definition(defn),
         )
 
 
+_cleanup_definition = text.Normalizer(capitalize=True).to_sentence
+
+
 def _raw_entries(html: HtmlResponse) -> Iterable[tuple[Any, Any]]:
     """
     The core of this parser.
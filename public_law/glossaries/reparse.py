@@ -0,0 +1,86 @@
+"""
+Regenerate the glossary datasets from an archived corpus, without a crawl.
+
+Usage:
+
+    python -m public_law.glossaries.reparse CORPUS_DIR [OUTPUT_DIR]
+
+Every glossary spider's archived pages (see `public_law.glossaries.corpus`)
+are run through its `parse_glossary` in parallel worker processes. Each
+spider's results are written to `OUTPUT_DIR/{spider name}.json` in the same
+JSON format as `scrapy crawl --output`. The items don't go through the
+`ITEM_PIPELINES`, though, so e.g. repeated phrases aren't dropped. Spiders
+without archived pages are skipped.
+
+Build the corpus by crawling once with the `GLOSSARY_CORPUS_DIR` setting:
+
+    scrapy crawl -s GLOSSARY_CORPUS_DIR=corpus usa_courts_glossary
+"""
+
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+from scrapy.exporters import JsonItemExporter
+
+from public_law.glossaries.corpus import ArchivedPage, archived_pages
+from public_law.glossaries.run_spiders import DEFAULT_OUTPUT_DIR, output_file
+from public_law.glossaries.spiders._base.utils import discover_glossary_spiders
+
+
+def reparse_all(corpus_dir: Path, output_dir: Path, max_workers: int | None = None) -> list[Path]:
+    """Re-parse every spider's archived pages. Return the files written."""
+    pages_by_spider = {
+        spider.name: pages
+        for spider in discover_glossary_spiders()
+        if (pages := archived_pages(corpus_dir, spider.name))
+    }
+    all_pages = [page for pages in pages_by_spider.values() for page in pages]
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        items = iter(executor.map(parse_page, all_pages))
+
+        output_dir.mkdir(parents=True, exist_ok=True)
+        return [
+            write_items(output_file(output_dir, name), [next(items) for _ in pages])
+            for name, pages in pages_by_spider.items()
+        ]
+
+
+def parse_page(page: ArchivedPage) -> dict[str, Any]:
+    """Parse one archived page into the item its spider would yield."""
+    return _spider(page.spider_name).parse_glossary(page.response()).asdict()
+
+
+def write_items(path: Path, items: list[dict[str, Any]]) -> Path:
+    with open(path, "wb") as f:
+        # FEED_EXPORT_INDENT's default, as with `scrapy crawl --output`.
+        exporter = JsonItemExporter(f, indent=0)  # type: ignore
+        exporter.start_exporting()
+        for item in items:
+            exporter.export_item(item)
+        exporter.finish_exporting()
+
+    return path
+
+
+@cache
+def _spider(name: str) -> Any:
+    """One spider instance per name, per worker process."""
+    spiders = {spider.name: spider for spider in discover_glossary_spiders()}
+    return spiders[name]()
+
+
+if __name__ == "__main__":
+    match sys.argv[1:]:
+        case [corpus_dir]:
+            files = reparse_all(Path(corpus_dir), Path(DEFAULT_OUTPUT_DIR))
+        case [corpus_dir, output_dir]:
+            files = reparse_all(Path(corpus_dir), Path(output_dir))
+        case _:
+            sys.exit(__doc__)
+
+    for f in files:
+        print(f"Wrote {f}")
@@ -0,0 +1,64 @@
+"""
+Run every glossary spider concurrently in a single Scrapy process.
+
+Usage:
+
+    python -m public_law.glossaries.run_spiders [OUTPUT_DIR]
+
+Each spider writes to `OUTPUT_DIR/{spider name}.json`. Spiders whose
+output file already exists are skipped.
+"""
+
+import sys
+from pathlib import Path
+from typing import Any
+
+from scrapy.crawler import CrawlerProcess
+from scrapy.utils.project import get_project_settings
+
+from public_law.glossaries.spiders._base.utils import (
+    discover_glossary_spiders, prewarm_glossary_parsers)
+
+DEFAULT_OUTPUT_DIR = "../glossary-datasets"
+
+
+def output_file(output_dir: Path, spider_name: str) -> Path:
+    return output_dir / f"{spider_name}.json"
+
+
+def pending_spiders(output_dir: Path) -> list[type[Any]]:
+    """The glossary spiders which don't yet have an output file."""
+    pending: list[type[Any]] = []
+
+    for spider in discover_glossary_spiders():
+        if output_file(output_dir, spider.name).exists():
+            print(f"Skipping {spider.name} because it already exists.")
+            continue
+        pending.append(spider)
+
+    return pending
+
+
+def crawl_all(output_dir: Path) -> None:
+    """Crawl all the pending spiders at once, one output file per spider."""
+    spiders = pending_spiders(output_dir)
+    if not spiders:
+        return
+
+    prewarm_glossary_parsers()
+
+    settings = get_project_settings()
+    settings.set("FEEDS", {
+        str(output_file(output_dir, "%(name)s")): {"format": "json"},
+    })
+
+    process = CrawlerProcess(settings)
+    for spider in spiders:
+        print(f"Running {spider.name}...")
+        _ = process.crawl(spider)
+
+    process.start()
+
+
+if __name__ == "__main__":
+    crawl_all(Path(sys.argv[1] if len(sys.argv) > 1 else DEFAULT_OUTPUT_DIR))
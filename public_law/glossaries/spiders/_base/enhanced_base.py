@@ -1,12 +1,19 @@
 import importlib
-from typing import Any, Generator
+from pathlib import Path
+from typing import Any, Callable, ClassVar, Generator, TypeAlias
 
 from scrapy import Spider
 from scrapy.http.response.html import HtmlResponse
 
+from public_law.glossaries.corpus import archive_response
 from public_law.glossaries.models.glossary import GlossaryParseResult
 from public_law.shared.models.metadata import Metadata
 
+ParserFunction: TypeAlias = Callable[[HtmlResponse], Any]
+
+# The resolved parser function for each spider class.
+_PARSERS: dict[type["AutoGlossarySpider"], ParserFunction] = {}
+
 
 class AutoGlossarySpider(Spider):
     """
@@ -24,9 +31,18 @@ class AutoGlossarySpider(Spider):
             start_urls = ["https://example.com/glossary"]
 
     This class validates required attributes at class definition time, providing
-    immediate feedback for missing or invalid configurations.
+    immediate feedback for missing or invalid configurations. The parser function
+    is imported and validated once per spider class, when the first spider is
+    created, so a missing parser fails before the crawl starts.
     """
 
+    # The function in the parser module which this spider calls.
+    parser_function_name: ClassVar[str] = "parse_glossary"
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        _ = self.parser()
+
     def __init_subclass__(cls, **kwargs: Any) -> None:
         """Validate required attributes at class definition time."""
         super().__init_subclass__(**kwargs)
@@ -69,28 +85,66 @@ class AutoGlossarySpider(Spider):
         return len(parts) == 2 and all(part for part in parts)
 
     def parse(self, response: HtmlResponse, **_: dict[str, Any]) -> Generator[dict[str, Any], None, None]:
-        """Parse the response and yield the result in Dublin Core format."""
+        """Parse the response and yield the result in Dublin Core format.
+
+        With the `GLOSSARY_CORPUS_DIR` setting, the response is also archived
+        there for later offline re-parsing.
+        """
+        match self._corpus_dir():
+            case None:
+                pass
+            case corpus_dir:
+                archive_response(Path(corpus_dir), self.name, response)
+
         result = self.parse_glossary(response)
         yield result.asdict()
 
+    def _corpus_dir(self) -> str | None:
+        """The GLOSSARY_CORPUS_DIR setting, when run by a crawler."""
+        if not hasattr(self, "settings"):
+            return None
+        return self.settings.get("GLOSSARY_CORPUS_DIR")
+
     def parse_glossary(self, response: HtmlResponse) -> GlossaryParseResult:
         """
         Parse the glossary page using the automatically resolved parser.
 
-        This method automatically imports and calls the appropriate parser based on
-        the spider's name.
+        This method calls the appropriate parser based on the spider's name.
         """
-        parser_module_path = self._resolve_parser_module()
-        parser_module = importlib.import_module(parser_module_path)
+        return self.parser()(response)
 
-        if not hasattr(parser_module, 'parse_glossary'):
-            raise AttributeError(
-                f"Parser module {parser_module_path} must have a 'parse_glossary' function"
-            )
+    @classmethod
+    def parser(cls) -> ParserFunction:
+        """
+        The parser function for this spider class.
+
+        It's resolved, imported and validated on the first call and cached
+        afterwards. Tooling can call this up front to pre-warm every parser.
+        """
+        match _PARSERS.get(cls):
+            case None:
+                parser = _PARSERS[cls] = cls._import_parser()
+                return parser
+            case parser:
+                return parser
 
-        return parser_module.parse_glossary(response)
+    @classmethod
+    def _import_parser(cls) -> ParserFunction:
+        """Import the parser module and look up its parser function."""
+        parser_module_path = cls._resolve_parser_module()
+        parser_module = importlib.import_module(parser_module_path)
 
-    def _resolve_parser_module(self) -> str:
+        match getattr(parser_module, cls.parser_function_name, None):
+            case None:
+                raise AttributeError(
+                    f"Parser module {parser_module_path} must have a "
+                    + f"'{cls.parser_function_name}' function"
+                )
+            case parser:
+                return parser
+
+    @classmethod
+    def _resolve_parser_module(cls) -> str:
         """
         Resolve the parser module path based on the spider name.
 
@@ -98,13 +152,13 @@ class AutoGlossarySpider(Spider):
         "public_law.glossaries.parsers.aus.dv_glossary".
         """
         # Remove "_glossary" suffix if present
-        name_without_suffix = self.name.removesuffix("_glossary")
+        name_without_suffix = cls.name.removesuffix("_glossary")
 
         # Split into country and topic
         parts = name_without_suffix.split("_", 1)
         if len(parts) != 2:
             raise ValueError(
-                f"Spider name '{self.name}' must follow pattern '{{country}}_{{topic}}_glossary'"
+                f"Spider name '{cls.name}' must follow pattern '{{country}}_{{topic}}_glossary'"
             )
 
         country, topic = parts
@@ -135,23 +189,17 @@ class EnhancedAutoGlossarySpider(AutoGlossarySpider):
     
     Use this for new spiders or when migrating existing ones.
     """
-    
+
+    parser_function_name: ClassVar[str] = "parse_entries"
+
     def parse_glossary(self, response: HtmlResponse) -> GlossaryParseResult:
         """
         Parse the glossary page using the automatically resolved parser and spider metadata.
 
-        This method automatically imports the appropriate parser based on the spider's name,
-        calls it to extract entries, gets metadata from the spider, and combines them.
+        This method calls the parser resolved from the spider's name to extract
+        entries, gets metadata from the spider, and combines them.
         """
-        parser_module_path = self._resolve_parser_module()
-        parser_module = importlib.import_module(parser_module_path)
-
-        if not hasattr(parser_module, 'parse_entries'):
-            raise AttributeError(
-                f"Parser module {parser_module_path} must have a 'parse_entries' function"
-            )
-
-        entries = parser_module.parse_entries(response)
+        entries = self.parser()(response)
         metadata = self.get_metadata(response)
         
         return GlossaryParseResult(metadata, entries)
@@ -37,3 +37,14 @@ def discover_glossary_spiders() -> list[type[BaseGlossarySpider | AutoGlossarySp
                 spiders.append(obj)
 
     return sorted(spiders, key=lambda cls: cls.__name__)
+
+
+def prewarm_glossary_parsers() -> None:
+    """Import and validate the parser of every glossary spider.
+
+    Call this at startup so that a missing or broken parser module fails
+    immediately, and so that no spider pays the import cost mid-crawl.
+    """
+    for spider in discover_glossary_spiders():
+        if issubclass(spider, AutoGlossarySpider):
+            _ = spider.parser()
@@ -14,7 +14,8 @@ class DOJGlossariesSpider(EnhancedAutoGlossarySpider):
     name       = "can_doj_glossary"
     start_urls = configured_urls()
 
-    def _resolve_parser_module(self) -> str:
+    @classmethod
+    def _resolve_parser_module(cls) -> str:
         """Override to use the doj_glossaries parser module."""
         return "public_law.glossaries.parsers.can.doj_glossaries"
 
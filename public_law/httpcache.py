@@ -0,0 +1,299 @@
+"""
+HTTP caching: a storage backend, a revalidating policy, and a middleware
+which counts revalidations.
+
+Enable the storage with:
+
+    HTTPCACHE_STORAGE = "public_law.httpcache.SqliteCacheStorage"
+
+All the spiders' responses go into one SQLite database,
+`HTTPCACHE_DIR/cache.sqlite3`, instead of a directory per request. Bodies
+are zlib-compressed and content-addressed: they're stored once per
+distinct SHA-256, however many requests returned them.
+
+The cache is bounded by `HTTPCACHE_MAX_BYTES` of compressed bodies (0 for
+no limit). When it grows past the limit, the least recently used
+responses are evicted until it's back under 90% of it.
+
+`HTTPCACHE_EXPIRATION_SECS` works as with Scrapy's own storages.
+
+`RevalidatingPolicy` is Scrapy's RFC 2616 policy, plus a max-age which
+spiders can set in their `custom_settings`:
+
+    custom_settings = {"HTTPCACHE_MAX_AGE": 7 * DAY}
+
+A cached response is used as is until it's that old; after that it's
+revalidated with If-None-Match / If-Modified-Since. A `304 Not Modified`
+counts as a cache hit in the crawl stats.
+"""
+
+import hashlib
+import logging
+import pickle
+import sqlite3
+import zlib
+from pathlib import Path
+from time import time
+from typing import Any
+
+from scrapy import Spider
+from scrapy.downloadermiddlewares.httpcache import HttpCacheMiddleware
+from scrapy.extensions.httpcache import RFC2616Policy
+from scrapy.http.headers import Headers
+from scrapy.http.request import Request
+from scrapy.http.response import Response
+from scrapy.responsetypes import responsetypes
+from scrapy.settings import BaseSettings
+from scrapy.utils.project import data_path
+
+logger = logging.getLogger(__name__)
+
+DB_FILE_NAME = "cache.sqlite3"
+
+DAY = 24 * 60 * 60
+
+# After an eviction, the cache is this fraction of HTTPCACHE_MAX_BYTES.
+EVICTION_TARGET = 0.9
+
+# The number of least recently used responses read at a time while evicting.
+EVICTION_BATCH_SIZE = 100
+
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS bodies (
+        hash BLOB PRIMARY KEY,
+        body BLOB NOT NULL,
+        size INTEGER NOT NULL
+    ) WITHOUT ROWID;
+
+    CREATE TABLE IF NOT EXISTS responses (
+        spider      TEXT NOT NULL,
+        fingerprint BLOB NOT NULL,
+        data        BLOB NOT NULL,
+        body_hash   BLOB NOT NULL,
+        stored      REAL NOT NULL,
+        accessed    REAL NOT NULL,
+        PRIMARY KEY (spider, fingerprint)
+    );
+
+    CREATE INDEX IF NOT EXISTS responses_by_access ON responses (accessed);
+    CREATE INDEX IF NOT EXISTS responses_by_body   ON responses (body_hash);
+
+    -- The total size of the bodies, kept up to date for every crawler
+    -- sharing the database.
+    CREATE TABLE IF NOT EXISTS totals (
+        id    INTEGER PRIMARY KEY CHECK (id = 0),
+        bytes INTEGER NOT NULL
+    );
+
+    INSERT OR IGNORE INTO totals SELECT 0, COALESCE(SUM(size), 0) FROM bodies;
+
+    CREATE TRIGGER IF NOT EXISTS body_added AFTER INSERT ON bodies BEGIN
+        UPDATE totals SET bytes = bytes + NEW.size;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS body_deleted AFTER DELETE ON bodies BEGIN
+        UPDATE totals SET bytes = bytes - OLD.size;
+    END;
+"""
+
+
+class SqliteCacheStorage:
+    """Responses in one SQLite database, with deduplicated, compressed bodies."""
+
+    def __init__(self, settings: BaseSettings):
+        super().__init__()
+        self.db_path         = Path(data_path(settings["HTTPCACHE_DIR"], createdir=True), DB_FILE_NAME)
+        self.expiration_secs = settings.getint("HTTPCACHE_EXPIRATION_SECS")
+        self.max_bytes       = settings.getint("HTTPCACHE_MAX_BYTES")
+        self.db: sqlite3.Connection | None = None
+
+    def open_spider(self, spider: Spider) -> None:
+        self.db = sqlite3.connect(self.db_path, timeout=30)
+        _ = self.db.execute("PRAGMA journal_mode = WAL")
+        _ = self.db.execute("PRAGMA synchronous = NORMAL")
+        _ = self.db.executescript(SCHEMA)
+
+        logger.debug(
+            "Using SQLite cache storage in %(db_path)s",
+            {"db_path": self.db_path},
+            extra={"spider": spider},
+        )
+
+        self._fingerprinter: Any = spider.crawler.request_fingerprinter  # type: ignore
+
+    def close_spider(self, spider: Spider) -> None:
+        if self.db is not None:
+            self.db.close()
+            self.db = None
+
+    @property
+    def total_bytes(self) -> int:
+        """The size of the compressed bodies in the database."""
+        return self._connection().execute("SELECT bytes FROM totals").fetchone()[0]
+
+    def retrieve_response(self, spider: Spider, request: Request) -> Response | None:
+        """Return the response if it's cached and not expired, or None otherwise."""
+        db  = self._connection()
+        key = (spider.name, self._fingerprint(request))
+
+        row = db.execute(
+            """
+            SELECT data, body, stored FROM responses
+            JOIN bodies ON bodies.hash = responses.body_hash
+            WHERE spider = ? AND fingerprint = ?
+            """,
+            key,
+        ).fetchone()
+
+        match row:
+            case None:
+                return None
+            case (_, _, stored) if 0 < self.expiration_secs < time() - stored:
+                return None
+            case (data, body, stored):
+                with db:
+                    _ = db.execute(
+                        "UPDATE responses SET accessed = ? WHERE spider = ? AND fingerprint = ?",
+                        (time(), *key),
+                    )
+
+                request.meta["cache_timestamp"] = stored
+                return _response(pickle.loads(data), zlib.decompress(body))
+            case _:
+                raise RuntimeError(f"Unexpected cache row: {row!r}")
+
+    def store_response(self, spider: Spider, request: Request, response: Response) -> None:
+        """Store the response, sharing its body with any identical one."""
+        db        = self._connection()
+        body      = response.body
+        body_hash = hashlib.sha256(body).digest()
+        key       = (spider.name, self._fingerprint(request))
+        now       = time()
+
+        data: dict[str, Any] = {"status": response.status, "url": response.url, "headers": dict(response.headers)}
+
+        with db:
+            compressed = zlib.compress(body)
+            inserted = db.execute(
+                "INSERT OR IGNORE INTO bodies (hash, body, size) VALUES (?, ?, ?)",
+                (body_hash, compressed, len(compressed)),
+            ).rowcount
+            replaced = db.execute(
+                "SELECT body_hash FROM responses WHERE spider = ? AND fingerprint = ?", key
+            ).fetchone()
+            _ = db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (*key, pickle.dumps(data, protocol=4), body_hash, now, now),
+            )
+
+            match replaced:
+                case (old_hash,) if old_hash != body_hash:
+                    self._delete_unused_body(db, old_hash)
+                case _:
+                    pass
+
+        if inserted and 0 < self.max_bytes < self.total_bytes:
+            self.evict()
+
+    def evict(self) -> None:
+        """Delete the least recently used responses until the cache is small enough."""
+        db     = self._connection()
+        target = self.max_bytes * EVICTION_TARGET
+
+        with db:
+            while self.total_bytes > target:
+                oldest = db.execute(
+                    "SELECT rowid, body_hash FROM responses ORDER BY accessed LIMIT ?",
+                    (EVICTION_BATCH_SIZE,),
+                ).fetchall()
+                if not oldest:
+                    break
+
+                for rowid, body_hash in oldest:
+                    if self.total_bytes <= target:
+                        break
+                    _ = db.execute("DELETE FROM responses WHERE rowid = ?", (rowid,))
+                    self._delete_unused_body(db, body_hash)
+
+    def _delete_unused_body(self, db: sqlite3.Connection, body_hash: bytes) -> None:
+        """Delete the body, unless a response still uses it."""
+        _ = db.execute(
+            """
+            DELETE FROM bodies WHERE hash = ?
+            AND NOT EXISTS (SELECT 1 FROM responses WHERE body_hash = ?)
+            """,
+            (body_hash, body_hash),
+        )
+
+    def _fingerprint(self, request: Request) -> bytes:
+        return self._fingerprinter.fingerprint(request)
+
+    def _connection(self) -> sqlite3.Connection:
+        match self.db:
+            case None:
+                raise RuntimeError("The cache storage isn't open")
+            case db:
+                return db
+
+
+def _response(data: dict[str, Any], body: bytes) -> Response:
+    """Rebuild a stored response, of the class its headers and URL call for."""
+    headers = Headers(data["headers"])
+    respcls = responsetypes.from_args(headers=headers, url=data["url"], body=body)
+
+    return respcls(url=data["url"], headers=headers, status=data["status"], body=body)
+
+
+class RevalidatingPolicy(RFC2616Policy):
+    """
+    The RFC 2616 policy, with the freshness lifetime optionally fixed by the
+    `HTTPCACHE_MAX_AGE` setting, in seconds. With it, responses are cached
+    even when they have neither expiration info nor validators; they're
+    then simply downloaded again once they're too old.
+    """
+
+    CACHEABLE_STATUSES = {200, 203, 300, 301, 308, 401}
+
+    def __init__(self, settings: BaseSettings):
+        super().__init__(settings)
+        self.max_age = settings.getint("HTTPCACHE_MAX_AGE")
+
+    def should_cache_response(self, response: Response, request: Request) -> bool:
+        if super().should_cache_response(response, request):
+            return True
+
+        return (
+            self.max_age > 0
+            and response.status in self.CACHEABLE_STATUSES
+            and b"no-store" not in self._parse_cachecontrol(response)
+        )
+
+    def _compute_freshness_lifetime(self, response: Response, request: Request, now: float) -> float:
+        if self.max_age > 0:
+            return self.max_age
+
+        return super()._compute_freshness_lifetime(response, request, now)
+
+
+class RevalidatingCacheMiddleware(HttpCacheMiddleware):
+    """
+    Scrapy's HttpCacheMiddleware, which also counts a cached response
+    revalidated by a `304 Not Modified` as a hit. The crawl stats then have:
+
+    - `httpcache/hit`: responses served from the cache, fresh or revalidated.
+    - `httpcache/miss`: requests with no cached response.
+    - `httpcache/revalidate`: stale responses which were still valid.
+    - `httpcache/not_modified`: those revalidated by a 304.
+    - `httpcache/invalidate`: stale responses which had changed.
+    """
+
+    def process_response(self, request: Request, response: Response, spider: Spider | None = None) -> Request | Response:
+        # Scrapy 2.13 needs the spider; later versions warn when it's given.
+        args   = () if spider is None else (spider,)
+        result = super().process_response(request, response, *args)
+
+        if response.status == 304 and result is not response:
+            self.stats.inc_value("httpcache/hit")
+            self.stats.inc_value("httpcache/not_modified")
+
+        return result
@@ -1,14 +1,46 @@
 import re
 from dataclasses import dataclass, field
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, TypeVar, cast
 
 from public_law.shared.utils.text import NonemptyString, titleize, remove_trailing_period, normalize_whitespace, URL
 
 #
 # Items for the Colorado Revised Statutes.
 #
+# Sections and Articles repeat the same few structural values (title
+# number, article number, kind, ...) thousands of times. These are
+# interned, so that every copy shares one string object.
+#
 
-@dataclass(frozen=True)
+_S = TypeVar("_S", bound=str)
+
+# The number of distinct structural values to keep interned.
+INTERN_CACHE_SIZE = 4096
+
+
+def _intern(value: _S | None) -> _S | None:
+    """The canonical copy of a (possibly str subclass) value."""
+    match value:
+        case None:
+            return None
+        case _:
+            return cast(_S, _canonical(value))
+
+
+@lru_cache(maxsize=INTERN_CACHE_SIZE, typed=True)
+def _canonical(value: str) -> str:
+    # The first value seen is cached, and returned for every equal value
+    # of the same type after it.
+    return value
+
+
+def _intern_fields(obj: object, *names: str) -> None:
+    for name in names:
+        object.__setattr__(obj, name, _intern(getattr(obj, name)))
+
+
+@dataclass(frozen=True, slots=True)
 class Section:
     """A CRS Section.
     
@@ -27,6 +59,27 @@ class Section:
     title_number:   NonemptyString
     kind:           str = 'Section'
 
+    def __post_init__(self):
+        _intern_fields(self, "article_number", "part_number", "title_number", "kind")
+
+    @classmethod
+    def from_parsed(cls, name: str, number: str, text: str) -> "Section":
+        """
+        Build a Section from strings found by a parser, taking the title
+        and article numbers from the section number. This is the fast
+        path for parsing thousands of sections.
+        """
+        title_number, article_number, *_ = number.split("-")
+
+        return cls(
+            name           = NonemptyString.from_str(name),
+            number         = NonemptyString.from_str(number),
+            text           = NonemptyString.from_str(text),
+            article_number = NonemptyString.from_str(article_number),
+            part_number    = None,
+            title_number   = NonemptyString.from_str(title_number),
+        )
+
 
 @dataclass(frozen=True)
 class Part:
@@ -38,7 +91,7 @@ class Part:
     kind:           str = "Part"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Article:
     """A CRS Article."""
     name: NonemptyString
@@ -49,6 +102,9 @@ class Article:
     subdivision_name: Optional[NonemptyString]
     kind:             str = "Article"
 
+    def __post_init__(self):
+        _intern_fields(self, "title_number", "division_name", "subdivision_name", "kind")
+
 
 @dataclass
 class Subdivision:
@@ -129,7 +185,7 @@ class Division:
 
         
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Title:
     """A CRS Title."""
     name:       NonemptyString
@@ -6,8 +6,7 @@ from scrapy.selector.unified import Selector
 
 from public_law.shared.utils.html import just_text
 from public_law.legal_texts.models.crs import Section
-from public_law.shared.utils.text import (NonemptyString, normalize_whitespace,
-                             remove_trailing_period)
+from public_law.shared.utils.text import normalize_whitespace, remove_trailing_period
 
 
 def parse_sections(dom: XmlResponse, logger: Any) -> list[Section]:
@@ -37,14 +36,7 @@ def parse_sections(dom: XmlResponse, logger: Any) -> list[Section]:
             logger.warn(f"Could not parse section text for {normalize_whitespace(node.get())} in {dom.url}")
             continue
 
-        sections.append(Section(
-            name           = NonemptyString(name),
-            number         = NonemptyString(number),
-            text           = NonemptyString(text),
-            article_number = NonemptyString(number.split('-')[1]),
-            part_number    = None,
-            title_number   = NonemptyString(number.split('-')[0])
-        ))
+        sections.append(Section.from_parsed(name, number, text))
 
     return sections
 
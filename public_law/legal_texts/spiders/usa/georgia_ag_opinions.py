@@ -29,6 +29,9 @@ class GeorgiaAgOpinions(Spider):
         "https://law.georgia.gov/opinions/unofficial",
     ]
 
+    # The index pages list new opinions, so revalidate them often.
+    custom_settings = {"HTTPCACHE_MAX_AGE": 60 * 60}
+
 
     def parse(self, response: Response, **kwargs: Dict[str, Any]):
         """Framework callback which begins the parsing."""
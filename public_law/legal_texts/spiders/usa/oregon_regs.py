@@ -10,7 +10,7 @@ from scrapy.http.response import Response
 from public_law.shared.utils.dates import todays_date
 from public_law.legal_texts.models.oar import OAR, Chapter, Division
 from public_law.legal_texts.parsers.usa.oregon_regs import DOMAIN, oar_url, parse_division
-from public_law.shared.utils.text import titleize
+from public_law.shared.utils.text import titleize_all
 
 
 class OregonRegs(Spider):
@@ -67,13 +67,10 @@ class OregonRegs(Spider):
         chapter: Chapter = cast(Chapter, self.oar["chapters"][response.meta["chapter_index"]])
 
         # Collect the Divisions
-        for anchor in response.css("#accordion > h3 > a"):
-            db_id = anchor.xpath("@href").get().split("selectedDivision=")[1] # pyright: ignore[reportOptionalMemberAccess]
-            raw_number, raw_name = map(
-                str.strip, anchor.xpath("text()").get().split("-", 1) # pyright: ignore[reportOptionalMemberAccess]
-            )
-            number: str = raw_number.split(" ")[1]
-            name: str = titleize(raw_name)
+        anchors = [_parse_division_anchor(anchor) for anchor in response.css("#accordion > h3 > a")]
+        names   = titleize_all(raw_name for _, _, raw_name in anchors)
+
+        for (db_id, number, _), name in zip(anchors, names):
             division = new_division(db_id, number, name)
 
             chapter["divisions"].append(division)
@@ -129,6 +126,14 @@ class OregonRegs(Spider):
         yield self.oar
 
 
+def _parse_division_anchor(anchor: Any) -> tuple[str, str, str]:
+    """A Division link's database ID, number, and raw name."""
+    db_id = anchor.xpath("@href").get().split("selectedDivision=")[1]
+    raw_number, raw_name = map(str.strip, anchor.xpath("text()").get().split("-", 1))
+
+    return db_id, raw_number.split(" ")[1], raw_name
+
+
 def new_chapter(db_id: str, number: str, name: str) -> Chapter:
     return Chapter(
         kind="Chapter",
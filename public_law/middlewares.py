@@ -9,107 +9,343 @@
 
 # -*- coding: utf-8 -*-
 
-# Define here the models for your spider middleware
+# Define here the models for your spider and downloader middleware
 #
 # See documentation in:
 # https://doc.scrapy.org/en/latest/topics/spider-middleware.html
+# https://doc.scrapy.org/en/latest/topics/downloader-middleware.html
+
+import cProfile
+import io
+import json
+import pstats
+from bisect import bisect_left
+from collections import defaultdict
+from dataclasses import asdict, dataclass, field
+from heapq import heappush, heappushpop
+from math import inf
+from pathlib import Path
+from time import perf_counter
+from typing import Any, AsyncIterable, Iterable
 
 from scrapy import Spider, signals
 from scrapy.crawler import Crawler
 from scrapy.http.request import Request
 from scrapy.http.response import Response
+from scrapy.utils.httpobj import urlparse_cached
+
+
+# Upper bounds of the latency histogram buckets, in seconds.
+HISTOGRAM_BOUNDS = (0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1.0, 2.0, 5.0, inf)
+
+
+@dataclass
+class LatencyHistogram:
+    """Counts of durations, in buckets growing roughly 1-2-5."""
+
+    counts:     list[int] = field(default_factory=lambda: [0] * len(HISTOGRAM_BOUNDS))
+    total_secs: float     = 0.0
+    max_secs:   float     = 0.0
+
+    def add(self, secs: float) -> None:
+        self.counts[bisect_left(HISTOGRAM_BOUNDS, secs)] += 1
+        self.total_secs += secs
+        self.max_secs    = max(self.max_secs, secs)
+
+    def report(self) -> dict[str, Any]:
+        return {
+            "count":      sum(self.counts),
+            "total_secs": round(self.total_secs, 6),
+            "max_secs":   round(self.max_secs, 6),
+            "buckets":    {
+                _bucket_label(bound): count
+                for bound, count in zip(HISTOGRAM_BOUNDS, self.counts)
+                if count
+            },
+        }
+
+
+def _bucket_label(bound: float) -> str:
+    return "slower" if bound == inf else f"<={bound * 1000:g}ms"
+
+
+@dataclass(order=True)
+class ProfiledResponse:
+    """A cProfile of one callback run, ordered by its duration."""
+
+    secs:     float
+    url:      str                = field(compare=False)
+    callback: str                = field(compare=False)
+    profile:  cProfile.Profile   = field(compare=False, repr=False)
 
 
-class OarSpiderMiddleware:
-    # Not all methods need to be defined. If a method is not defined,
-    # scrapy acts as if the spider middleware does not modify the
-    # passed objects.
+class ParseTimingMiddleware:
+    """
+    Time the spiders' callbacks, and each item they yield.
+
+    The time of a callback is the time spent inside it, i.e. producing
+    its output; not the time the engine spends on that output. For each
+    callback, by name, it keeps latency histograms of whole responses and
+    of single items. The totals go into the crawl stats under
+    `parse_timing/{callback}/...`.
+
+    When `PARSE_TIMING_REPORT` is set, the histograms are written to it as
+    JSON when the spider closes. `%(name)s` is replaced with the spider's
+    name. The keys are sorted, so reports diff well between releases.
+
+    When `PARSE_TIMING_PROFILE_SLOWEST` is N > 0, every synchronous
+    callback is run under cProfile, and the profiles of the slowest N
+    responses are kept. They're summarized in the report, and dumped next
+    to it as `.prof` files for `pstats` or `snakeviz`. This slows the crawl
+    down. Async callbacks are timed but not profiled: other callbacks run
+    while they wait, and only one profiler can be active at a time.
+
+    Install it next to the spider:
+
+        SPIDER_MIDDLEWARES = {"public_law.middlewares.ParseTimingMiddleware": 950}
+    """
+
+    def __init__(self, crawler: Crawler):
+        super().__init__()
+        self.crawler     = crawler
+        self.report_file = crawler.settings.get("PARSE_TIMING_REPORT")
+        self.slowest_n   = crawler.settings.getint("PARSE_TIMING_PROFILE_SLOWEST")
+
+        self.responses: dict[str, LatencyHistogram] = defaultdict(LatencyHistogram)
+        self.items:     dict[str, LatencyHistogram] = defaultdict(LatencyHistogram)
+        self.slowest:   list[ProfiledResponse]      = []
 
     @classmethod
     def from_crawler(cls, crawler: Crawler):
-        # This method is used by Scrapy to create your spiders.
-        the_class = cls()
-        crawler.signals.connect(the_class.spider_opened, signal=signals.spider_opened)
+        the_class = cls(crawler)
+        crawler.signals.connect(the_class.spider_closed, signal=signals.spider_closed)
         return the_class
 
-    def process_spider_input(self, _response: Response, _spider: Spider) -> None:
-        # Called for each response that goes through the spider
-        # middleware and into the spider.
+    def process_spider_output(self, response: Response, result: Iterable[Any], spider: Spider | None = None):
+        callback = _callback_name(response)
+        profile  = cProfile.Profile() if self.slowest_n else None
+        outputs  = iter(result)
+        elapsed  = 0.0
 
-        # Should return None or raise an exception.
-        return None
+        while True:
+            started = perf_counter()
+            if profile:
+                profile.enable()
+            try:
+                output = next(outputs)
+            except StopIteration:
+                break
+            finally:
+                if profile:
+                    profile.disable()
+                secs = perf_counter() - started
+                elapsed += secs
+
+            if not isinstance(output, Request):
+                self.items[callback].add(secs)
+            yield output
+
+        self._finish(response, callback, elapsed, profile)
+
+    async def process_spider_output_async(self, response: Response, result: AsyncIterable[Any], spider: Spider | None = None):
+        callback = _callback_name(response)
+        outputs  = aiter(result)
+        elapsed  = 0.0
+
+        while True:
+            started = perf_counter()
+            try:
+                output = await anext(outputs)
+            except StopAsyncIteration:
+                break
+            finally:
+                secs = perf_counter() - started
+                elapsed += secs
+
+            if not isinstance(output, Request):
+                self.items[callback].add(secs)
+            yield output
 
-    def process_spider_output(self, _response: Response, result, _spider: Spider):
-        # Called with the results returned from the Spider, after
-        # it has processed the response.
+        self._finish(response, callback, elapsed, None)
 
-        # Must return an iterable of Request, dict or Item objects.
-        for i in result:
-            yield i
+    def _finish(self, response: Response, callback: str, elapsed: float, profile: cProfile.Profile | None) -> None:
+        self.responses[callback].add(elapsed)
 
-    def process_spider_exception(self, response: Response, exception, _spider: Spider):
-        # Called when a spider or process_spider_input() method
-        # (from other spider middleware) raises an exception.
+        if profile:
+            profiled = ProfiledResponse(elapsed, response.url, callback, profile)
+            if len(self.slowest) < self.slowest_n:
+                heappush(self.slowest, profiled)
+            else:
+                _ = heappushpop(self.slowest, profiled)
 
-        # Should return either None or an iterable of Response, dict
-        # or Item objects.
-        pass
+    def spider_closed(self, spider: Spider):
+        stats = self.crawler.stats
+        assert stats is not None
 
-    def process_start_requests(self, start_requests, _spider: Spider):
-        # Called with the start requests of the spider, and works
-        # similarly to the process_spider_output() method, except
-        # that it doesn’t have a response associated.
+        for callback, histogram in self.responses.items():
+            stats.set_value(f"parse_timing/{callback}/count", sum(histogram.counts))
+            stats.set_value(f"parse_timing/{callback}/total_secs", histogram.total_secs)
+            stats.set_value(f"parse_timing/{callback}/max_secs", histogram.max_secs)
 
-        # Must return only requests (not items).
-        for req in start_requests:
-            yield req
+        if self.report_file:
+            self.write_report(Path(self.report_file % {"name": spider.name}), spider.name)
 
-    def spider_opened(self, spider: Spider):
-        spider.logger.info(f"Spider opened: {spider.name}")
+    def write_report(self, path: Path, spider_name: str) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
 
+        slowest: list[dict[str, Any]] = []
+        for rank, profiled in enumerate(sorted(self.slowest, reverse=True), start=1):
+            profile_file = path.with_name(f"{path.stem}-slowest-{rank}.prof")
+            profiled.profile.dump_stats(profile_file)
+            slowest.append({
+                "url":          profiled.url,
+                "callback":     profiled.callback,
+                "secs":         round(profiled.secs, 6),
+                "profile_file": profile_file.name,
+                "top_functions": _top_functions(profiled.profile),
+            })
 
-class OarDownloaderMiddleware:
-    # Not all methods need to be defined. If a method is not defined,
-    # scrapy acts as if the downloader middleware does not modify the
-    # passed objects.
+        report = {
+            "spider":    spider_name,
+            "callbacks": {
+                callback: {
+                    "responses": histogram.report(),
+                    "items":     self.items[callback].report(),
+                }
+                for callback, histogram in self.responses.items()
+            },
+            "slowest":   slowest,
+        }
+        _ = path.write_text(json.dumps(report, indent=2, sort_keys=True))
+
+
+def _callback_name(response: Response) -> str:
+    match response.request:
+        case Request(callback=callback) if callback is not None:
+            return getattr(callback, "__name__", str(callback))
+        case _:
+            return "parse"
+
+
+def _top_functions(profile: cProfile.Profile, count: int = 15) -> list[str]:
+    """The functions with the most cumulative time, as pstats prints them."""
+    output = io.StringIO()
+    pstats.Stats(profile, stream=output).sort_stats("cumulative").print_stats(count)
+
+    return [line for line in output.getvalue().splitlines() if line.strip()]
+
+
+@dataclass
+class DownloadTimes:
+    """Download totals for one host."""
+
+    requests:      int   = 0
+    errors:        int   = 0
+    bytes:         int   = 0
+    latency_secs:  float = 0.0
+    max_latency:   float = 0.0
+    total_secs:    float = 0.0
+    max_total:     float = 0.0
+
+    def add(self, latency: float, total: float, size: int) -> None:
+        self.requests     += 1
+        self.bytes        += size
+        self.latency_secs += latency
+        self.total_secs   += total
+        self.max_latency   = max(self.max_latency, latency)
+        self.max_total     = max(self.max_total, total)
+
+
+class DownloadTimingMiddleware:
+    """
+    Record, per host, how long downloads take and how many bytes they return.
+
+    For each request, it records:
+
+    - latency: Scrapy's `download_latency`, the time from sending the
+      request to receiving the response headers. This covers DNS, connect
+      and time to first byte; Scrapy's download handlers don't report
+      these separately.
+    - total: the time from this middleware passing the request on to it
+      getting the response back. This includes waiting for a download slot
+      (DOWNLOAD_DELAY, AutoThrottle) as well as the whole transfer.
+    - bytes: the size of the body as received, before decompression.
+
+    The totals go into the crawl stats under `download_timing/{host}/...`.
+    When the spider closes, they're also written as JSON to the
+    `DOWNLOAD_TIMING_REPORT` file, if set. `%(name)s` in it is replaced
+    with the spider's name.
+
+    Install it near the downloader, so that responses served from the
+    HTTP cache aren't counted:
+
+        DOWNLOADER_MIDDLEWARES = {"public_law.middlewares.DownloadTimingMiddleware": 950}
+    """
+
+    STARTED = "_download_timing_started"
+
+    def __init__(self, crawler: Crawler):
+        super().__init__()
+        self.crawler     = crawler
+        self.report_file = crawler.settings.get("DOWNLOAD_TIMING_REPORT")
+        self.hosts: dict[str, DownloadTimes] = defaultdict(DownloadTimes)
 
     @classmethod
     def from_crawler(cls, crawler: Crawler):
-        # This method is used by Scrapy to create your spiders.
-        the_class = cls()
-        crawler.signals.connect(the_class.spider_opened, signal=signals.spider_opened)
+        the_class = cls(crawler)
+        crawler.signals.connect(the_class.spider_closed, signal=signals.spider_closed)
         return the_class
 
-    def process_request(self, _request: Request, _spider: Spider):
-        # Called for each request that goes through the downloader
-        # middleware.
-
-        # Must either:
-        # - return None: continue processing this request
-        # - or return a Response object
-        # - or return a Request object
-        # - or raise IgnoreRequest: process_exception() methods of
-        #   installed downloader middleware will be called
+    def process_request(self, request: Request, spider: Spider | None = None):
+        request.meta[self.STARTED] = perf_counter()
         return None
 
-    def process_response(self, _request: Request, response: Response, _spider: Spider):
-        # Called with the response returned from the downloader.
+    def process_response(self, request: Request, response: Response, spider: Spider | None = None):
+        match request.meta.pop(self.STARTED, None):
+            case float(started):
+                self.hosts[_host(request)].add(
+                    latency = request.meta.get("download_latency", 0.0),
+                    total   = perf_counter() - started,
+                    size    = len(response.body),
+                )
+            case _:
+                pass
 
-        # Must either;
-        # - return a Response object
-        # - return a Request object
-        # - or raise IgnoreRequest
         return response
 
-    def process_exception(self, request: Request, exception, spider: Spider):
-        # Called when a download handler or a process_request()
-        # (from other downloader middleware) raises an exception.
+    def process_exception(self, request: Request, exception, spider: Spider | None = None):
+        match request.meta.pop(self.STARTED, None):
+            case float(started):
+                times = self.hosts[_host(request)]
+                times.errors     += 1
+                times.total_secs += perf_counter() - started
+            case _:
+                pass
+
+        return None
+
+    def spider_closed(self, spider: Spider):
+        stats = self.crawler.stats
+        assert stats is not None
+
+        for host, times in self.hosts.items():
+            for key, value in asdict(times).items():
+                stats.set_value(f"download_timing/{host}/{key}", value)
+
+        if self.report_file:
+            self.write_report(Path(self.report_file % {"name": spider.name}), spider.name)
+
+    def write_report(self, path: Path, spider_name: str) -> None:
+        """Write the totals as JSON, the slowest hosts first."""
+        hosts = sorted(self.hosts.items(), key=lambda item: item[1].total_secs, reverse=True)
+        report = {
+            "spider": spider_name,
+            "hosts":  {host: asdict(times) for host, times in hosts},
+        }
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _ = path.write_text(json.dumps(report, indent=2))
 
-        # Must either:
-        # - return None: continue processing this exception
-        # - return a Response object: stops process_exception() chain
-        # - return a Request object: stops process_exception() chain
-        pass
 
-    def spider_opened(self, spider: Spider):
-        spider.logger.info(f"Spider opened: {spider.name}")
+def _host(request: Request) -> str:
+    return urlparse_cached(request).hostname or ""
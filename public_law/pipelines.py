@@ -3,7 +3,960 @@
 # Don't forget to add your pipeline to the ITEM_PIPELINES setting
 # See: https://doc.scrapy.org/en/latest/topics/item-pipeline.html
 
+import hashlib
+import json
+import logging
+import os
+import queue
+import sqlite3
+import tempfile
+import threading
+from collections import deque
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, Callable, Iterable, Literal, Protocol, TypeAlias
+
+from scrapy import Spider
+from scrapy.crawler import Crawler
+from scrapy.exceptions import DropItem, NotConfigured
+from scrapy.utils.defer import maybe_deferred_to_future
+from scrapy.utils.misc import build_from_crawler
+from twisted.internet import threads
+from twisted.internet.defer import Deferred
+
+from public_law.exporters import JsonLinesStreamExporter, exporter_class
+from public_law.legal_texts.models import crs, oar
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+if TYPE_CHECKING:
+    from pyarrow import Schema
+    from pyarrow.parquet import ParquetWriter
+
+
+logger = logging.getLogger(__name__)
+
 
 class OarPipeline:
     def process_item(self, item, _spider):  # type: ignore
         return item  # type: ignore
+
+
+#
+# Deduplication.
+#
+
+Identity: TypeAlias = tuple[str, ...]
+DedupStorage: TypeAlias = Literal["memory", "disk"]
+
+
+def item_identity(item: Any) -> Identity | None:
+    """
+    What makes the item unique, starting with its kind; or None if it
+    has no identity and is never a duplicate.
+    """
+    match item:
+        case crs.Section(number=number) | crs.Title(number=number):
+            return (item.kind, number)
+        case crs.Article(title_number=title_number, number=number):
+            return (item.kind, title_number, number)
+        case oar.Rule():
+            match item.get("number"):
+                case str(number):
+                    return ("Rule", number)
+                case _:
+                    return None
+        case {"metadata": {"dcterms:source": str(url)}, "entries": list()}:
+            return ("Glossary", url)
+        case {"source_url": str(url)} | {"url": str(url)}:
+            return ("Page", url)
+        case _:
+            return None
+
+
+def digest(identity: Identity) -> int:
+    """
+    A 64-bit hash of the identity. The chance of two identities sharing one
+    is about 1 in 40 million for a million items.
+    """
+    key = "\x1f".join(map(str, identity)).encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "big", signed=True)
+
+
+class SeenSet(Protocol):
+    def add(self, digest: int) -> bool:
+        """Add the digest. Return whether it's new."""
+        ...
+
+    def close(self) -> None: ...
+
+
+class MemorySeenSet:
+    """Digests in a set of ints: about 60 bytes per item, whatever its size."""
+
+    def __init__(self):
+        super().__init__()
+        self.digests: set[int] = set()
+
+    def add(self, digest: int) -> bool:
+        if digest in self.digests:
+            return False
+        self.digests.add(digest)
+        return True
+
+    def close(self) -> None:
+        self.digests.clear()
+
+
+class DiskSeenSet:
+    """Digests in a temporary SQLite table, for crawls too big for memory."""
+
+    COMMIT_EVERY = 10_000
+
+    def __init__(self, directory: str | None = None):
+        super().__init__()
+        fd, path  = tempfile.mkstemp(prefix="dedup-", suffix=".sqlite3", dir=directory)
+        os.close(fd)
+
+        self.path = Path(path)
+        self.db   = sqlite3.connect(self.path)
+        _ = self.db.execute("PRAGMA journal_mode = OFF")
+        _ = self.db.execute("PRAGMA synchronous = OFF")
+        _ = self.db.execute("CREATE TABLE seen (digest INTEGER PRIMARY KEY)")
+        self.pending = 0
+
+    def add(self, digest: int) -> bool:
+        inserted = self.db.execute("INSERT OR IGNORE INTO seen VALUES (?)", (digest,)).rowcount
+
+        self.pending += 1
+        if self.pending >= self.COMMIT_EVERY:
+            self.db.commit()
+            self.pending = 0
+
+        return inserted == 1
+
+    def close(self) -> None:
+        self.db.close()
+        self.path.unlink(missing_ok=True)
+
+
+class DedupPipeline:
+    """
+    Drop items which were already seen in this crawl.
+
+    Items are compared by `item_identity()`: e.g. a Section by its number,
+    or an opinion by its URL. Only a 64-bit digest of each identity is
+    kept, in memory, or with `DEDUP_STORAGE = "disk"` in a temporary
+    SQLite file in `DEDUP_DIR`.
+
+    Repeated phrases within a glossary are dropped too, keeping the first.
+
+    The crawl stats get `dedup/dropped` and `dedup/dropped/{kind}`, and
+    `dedup/dropped_entries` for glossary entries.
+    """
+
+    def __init__(self, crawler: Crawler, storage: DedupStorage = "memory", directory: str | None = None):
+        super().__init__()
+        self.crawler   = crawler
+        self.storage   = storage
+        self.directory = directory
+        self.seen: SeenSet = MemorySeenSet()
+
+    @classmethod
+    def from_crawler(cls, crawler: Crawler):
+        match crawler.settings.get("DEDUP_STORAGE", "memory"):
+            case "memory" | "disk" as storage:
+                return cls(crawler, storage, crawler.settings.get("DEDUP_DIR"))
+            case storage:
+                raise ValueError(f"Unknown DEDUP_STORAGE: {storage}")
+
+    def open_spider(self, spider: Spider | None = None) -> None:
+        self.seen = DiskSeenSet(self.directory) if self.storage == "disk" else MemorySeenSet()
+
+    def close_spider(self, spider: Spider | None = None) -> None:
+        self.seen.close()
+
+        match self._stats().get_value("dedup/dropped"):
+            case None:
+                pass
+            case dropped:
+                logger.info("Dropped %(dropped)d duplicate items", {"dropped": dropped})
+
+    def process_item(self, item: Any, spider: Spider | None = None) -> Any:
+        match item_identity(item):
+            case None:
+                pass
+            case identity if not self.seen.add(digest(identity)):
+                self._stats().inc_value("dedup/dropped")
+                self._stats().inc_value(f"dedup/dropped/{identity[0]}")
+                raise DropItem(f"Duplicate {identity[0]}: {identity[1:]}", log_level="DEBUG")
+            case _:
+                pass
+
+        match item:
+            case {"metadata": dict(), "entries": list()}:
+                return self._without_repeated_entries(item, item["entries"])
+            case _:
+                return item
+
+    def _without_repeated_entries(self, glossary: dict[str, Any], entries: list[dict[str, Any]]) -> dict[str, Any]:
+        """The glossary, as the spiders yield it, with only the first entry for each phrase."""
+        first_entries: dict[str, dict[str, Any]] = {}
+        for entry in entries:
+            _ = first_entries.setdefault(entry["phrase"], entry)
+
+        if len(first_entries) == len(entries):
+            return glossary
+
+        self._stats().inc_value("dedup/dropped_entries", len(entries) - len(first_entries))
+        return glossary | {"entries": list(first_entries.values())}
+
+    def _stats(self) -> Any:
+        assert self.crawler.stats is not None
+        return self.crawler.stats
+
+
+#
+# Columnar export of the legal texts.
+#
+
+DEFAULT_ROW_GROUP_SIZE = 10_000
+
+
+@dataclass(frozen=True)
+class ParquetTable:
+    """
+    The columns of one kind of item. All are strings, or lists of
+    strings. The dictionary columns repeat a few values many times.
+    """
+
+    name:               str
+    columns:            tuple[str, ...]
+    list_columns:       tuple[str, ...] = ()
+    dictionary_columns: tuple[str, ...] = ()
+
+    def schema(self) -> "Schema":
+        assert pa is not None
+        return pa.schema([
+            (column, pa.list_(pa.string()) if column in self.list_columns else pa.string())
+            for column in self.columns
+        ])
+
+
+SECTIONS = ParquetTable(
+    "sections",
+    columns            = ("number", "name", "text", "title_number", "article_number", "part_number", "kind"),
+    dictionary_columns = ("title_number", "article_number", "part_number", "kind"),
+)
+
+ARTICLES = ParquetTable(
+    "articles",
+    columns            = ("number", "name", "title_number", "division_name", "subdivision_name", "kind"),
+    dictionary_columns = ("title_number", "division_name", "subdivision_name", "kind"),
+)
+
+RULES = ParquetTable(
+    "rules",
+    columns            = ("number", "name", "text", "url", "internal_url", "chapter_number",
+                          "division_number", "authority", "implements", "history", "kind"),
+    list_columns       = ("authority", "implements"),
+    dictionary_columns = ("chapter_number", "division_number", "kind"),
+)
+
+
+class ParquetExportPipeline:
+    """
+    Write CRS Sections and Articles, and OAR Rules, to Parquet files:
+
+        PARQUET_EXPORT_DIR/{spider name}-{sections,articles,rules}.parquet
+
+    Articles are taken from the CRS Titles, and Rules from the OAR tree,
+    as well as from the items themselves. Rows are written in row groups
+    of `PARQUET_ROW_GROUP_SIZE`, so that only one group is held in memory
+    per file. Every item is passed on unchanged.
+
+    Disabled unless `PARQUET_EXPORT_DIR` is set. Needs the `pyarrow` package.
+    """
+
+    def __init__(self, crawler: Crawler, export_dir: Path, row_group_size: int = DEFAULT_ROW_GROUP_SIZE):
+        super().__init__()
+        if pq is None:
+            raise ImportError("The Parquet export needs the pyarrow package")
+
+        self.crawler        = crawler
+        self.export_dir     = export_dir
+        self.row_group_size = row_group_size
+        self.spider_name    = ""
+        self.rows:    dict[ParquetTable, list[dict[str, Any]]] = {}
+        self.writers: dict[ParquetTable, "ParquetWriter"] = {}
+
+    @classmethod
+    def from_crawler(cls, crawler: Crawler):
+        match crawler.settings.get("PARQUET_EXPORT_DIR"):
+            case None | "":
+                raise NotConfigured  # Off by default, so not worth a warning.
+            case export_dir:
+                return cls(
+                    crawler,
+                    Path(export_dir),
+                    crawler.settings.getint("PARQUET_ROW_GROUP_SIZE", DEFAULT_ROW_GROUP_SIZE),
+                )
+
+    def open_spider(self, spider: Spider | None = None) -> None:
+        self.spider_name = _spider_name(self.crawler, spider)
+
+    def process_item(self, item: Any, spider: Spider | None = None) -> Any:
+        for table, row in table_rows(item):
+            rows = self.rows.setdefault(table, [])
+            rows.append(row)
+            if len(rows) >= self.row_group_size:
+                self._write_row_group(table)
+
+        return item
+
+    def close_spider(self, spider: Spider | None = None) -> None:
+        for table in list(self.rows):
+            if self.rows[table]:
+                self._write_row_group(table)
+
+        for writer in self.writers.values():
+            writer.close()
+        self.writers.clear()
+
+    def path(self, table: ParquetTable) -> Path:
+        return self.export_dir / f"{self.spider_name}-{table.name}.parquet"
+
+    def _write_row_group(self, table: ParquetTable) -> None:
+        assert pa is not None and pq is not None
+
+        if table not in self.writers:
+            self.export_dir.mkdir(parents=True, exist_ok=True)
+            self.writers[table] = pq.ParquetWriter(
+                self.path(table),
+                table.schema(),
+                use_dictionary=list(table.dictionary_columns),
+                compression="zstd",
+            )
+
+        rows = self.rows.pop(table)
+        self.writers[table].write_table(
+            pa.Table.from_pylist(rows, schema=table.schema()),
+            row_group_size=self.row_group_size,
+        )
+
+
+def _spider_name(crawler: Crawler, spider: Spider | None) -> str:
+    """Newer Scrapy versions don't pass the spider to pipelines."""
+    match spider or crawler.spider:
+        case None:
+            return "items"
+        case running:
+            return running.name
+
+
+def table_rows(item: Any) -> Iterable[tuple[ParquetTable, dict[str, Any]]]:
+    """The rows which the item contributes, and their tables."""
+    match item:
+        case crs.Section():
+            yield SECTIONS, _fields(item, SECTIONS)
+        case crs.Article():
+            yield ARTICLES, _fields(item, ARTICLES)
+        case crs.Title() | crs.Division() | crs.Subdivision():
+            for article in _articles(item):
+                yield ARTICLES, _fields(article, ARTICLES)
+        case oar.OAR():
+            for chapter in item.get("chapters", []):
+                for division in chapter.get("divisions", []):
+                    for rule in division.get("rules", []):
+                        yield RULES, _rule_row(rule)
+        case oar.Rule():
+            yield RULES, _rule_row(item)
+        case _:
+            pass
+
+
+def _fields(obj: Any, table: ParquetTable) -> dict[str, Any]:
+    return {column: getattr(obj, column) for column in table.columns}
+
+
+def _articles(node: Any) -> Iterable[crs.Article]:
+    """All the Articles within a CRS Title, Division or Subdivision."""
+    match node:
+        case crs.Article():
+            yield node
+        case crs.Title(children=children) | crs.Division(children=children) | crs.Subdivision(articles=children):
+            for child in children:
+                yield from _articles(child)
+        case _:
+            pass
+
+
+def _rule_row(rule: Any) -> dict[str, Any]:
+    """
+    The rule's columns, with its chapter and division numbers taken from
+    its own number. The division is numbered as in the OAR tree, e.g. "1",
+    not zero-padded as in the rule's number, so that rules join their division.
+    """
+    number = rule.get("number")
+    parts  = number.split("-") if isinstance(number, str) else []
+
+    return {
+        **{column: rule.get(column) for column in RULES.columns},
+        "chapter_number":  parts[0] if parts else None,
+        "division_number": (parts[1].lstrip("0") or "0") if len(parts) > 1 else None,
+    }
+
+
+#
+# Output sharded by kind and title.
+#
+
+MANIFEST_FILE_NAME = "manifest.json"
+
+
+@dataclass
+class Shard:
+    """One output file, holding the items of one kind and title."""
+
+    kind:         str
+    title_number: str | None
+    file:         str
+    items:        int = 0
+    bytes:        int = 0
+
+
+def shard_key(item: Any) -> tuple[str, str | None]:
+    """The kind of the item, and the number of the title it's in, if any."""
+    match item:
+        case crs.Section(title_number=title_number) | crs.Article(title_number=title_number):
+            return (item.kind, title_number)
+        case crs.Title(number=number):
+            return (item.kind, number)
+        case {"kind": str(kind)}:
+            return (kind, None)
+        case _:
+            return (type(item).__name__, None)
+
+
+def shard_file(kind: str, title_number: str | None, suffix: str) -> str:
+    """
+    >>> shard_file("Section", "16", ".jsonl")
+    'Section/title-16.jsonl'
+    >>> shard_file("CRS", None, ".jsonl")
+    'CRS.jsonl'
+    """
+    match title_number:
+        case None:
+            return f"{kind}{suffix}"
+        case _:
+            return f"{kind}/title-{title_number}{suffix}"
+
+
+class ShardedOutputPipeline:
+    """
+    Write the items as JSON Lines into one file per kind and title, e.g.
+    `Section/title-16.jsonl`, so that one title's Sections can be read
+    without the rest.
+
+    The files go in `SHARDED_OUTPUT_DIR`, with `%(name)s` replaced by the
+    spider's name. `SHARDED_OUTPUT_SUFFIX` is `.jsonl`, `.jsonl.gz` or
+    `.jsonl.zst`. When the spider closes, `manifest.json` lists every file
+    with its kind, title number and item count.
+
+    Disabled unless `SHARDED_OUTPUT_DIR` is set.
+    """
+
+    def __init__(self, crawler: Crawler, dir_template: str, suffix: str = ".jsonl"):
+        super().__init__()
+        self.crawler      = crawler
+        self.dir_template = dir_template
+        self.suffix       = suffix
+        self.output_dir   = Path()
+        self.spider_name  = ""
+        self.shards:    dict[tuple[str, str | None], Shard] = {}
+        self.exporters: dict[tuple[str, str | None], tuple[IO[bytes], JsonLinesStreamExporter]] = {}
+
+    @classmethod
+    def from_crawler(cls, crawler: Crawler):
+        match crawler.settings.get("SHARDED_OUTPUT_DIR"):
+            case None | "":
+                raise NotConfigured  # Off by default, so not worth a warning.
+            case dir_template:
+                return cls(crawler, dir_template, crawler.settings.get("SHARDED_OUTPUT_SUFFIX", ".jsonl"))
+
+    def open_spider(self, spider: Spider | None = None) -> None:
+        self.spider_name = _spider_name(self.crawler, spider)
+        self.output_dir  = Path(self.dir_template % {"name": self.spider_name})
+
+    def process_item(self, item: Any, spider: Spider | None = None) -> Any:
+        key = shard_key(item)
+        if key not in self.exporters:
+            self._open_shard(key)
+
+        self.exporters[key][1].export_item(item)
+        self.shards[key].items += 1
+
+        return item
+
+    def close_spider(self, spider: Spider | None = None) -> None:
+        for key, (file, exporter) in self.exporters.items():
+            exporter.finish_exporting()
+            file.close()
+            self.shards[key].bytes = (self.output_dir / self.shards[key].file).stat().st_size
+        self.exporters.clear()
+
+        self.write_manifest()
+
+    def write_manifest(self) -> Path:
+        path = self.output_dir / MANIFEST_FILE_NAME
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        shards = sorted(self.shards.values(), key=lambda shard: (shard.kind, shard.title_number or ""))
+        manifest = {
+            "spider": self.spider_name,
+            "shards": [asdict(shard) for shard in shards],
+        }
+        _ = path.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+
+        return path
+
+    def _open_shard(self, key: tuple[str, str | None]) -> None:
+        shard = Shard(*key, file=shard_file(*key, self.suffix))
+        path  = self.output_dir / shard.file
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        file     = open(path, "wb")
+        exporter = build_from_crawler(exporter_class(path), self.crawler, file)
+        exporter.start_exporting()
+
+        self.shards[key]    = shard
+        self.exporters[key] = (file, exporter)
+
+
+#
+# A SQLite store of the legal texts.
+#
+
+DEFAULT_SQLITE_BATCH_SIZE = 1_000
+
+SQLITE_COLUMNS: dict[str, tuple[str, ...]] = {
+    "crs_titles":    ("number", "name", "source_url"),
+    "crs_divisions": ("title_number", "name"),
+    "crs_articles":  ("title_number", "number", "name", "division_name", "subdivision_name"),
+    "crs_sections":  ("number", "name", "text", "title_number", "article_number", "part_number"),
+    "oar_chapters":  ("number", "name", "url", "db_id"),
+    "oar_divisions": ("chapter_number", "number", "name", "url", "db_id"),
+    "oar_rules":     ("number", "name", "text", "url", "internal_url", "chapter_number",
+                      "division_number", "authority", "implements", "history"),
+    "ag_opinions":   ("source_url", "title", "is_official", "date", "summary", "full_text", "citations"),
+}
+
+SQLITE_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS crs_titles (
+        number     TEXT PRIMARY KEY,
+        name       TEXT NOT NULL,
+        source_url TEXT
+    );
+    CREATE TABLE IF NOT EXISTS crs_divisions (
+        title_number TEXT NOT NULL,
+        name         TEXT NOT NULL,
+        PRIMARY KEY (title_number, name)
+    );
+    CREATE TABLE IF NOT EXISTS crs_articles (
+        title_number     TEXT NOT NULL,
+        number           TEXT NOT NULL,
+        name             TEXT NOT NULL,
+        division_name    TEXT,
+        subdivision_name TEXT,
+        PRIMARY KEY (title_number, number)
+    );
+    CREATE TABLE IF NOT EXISTS crs_sections (
+        number         TEXT PRIMARY KEY,
+        name           TEXT NOT NULL,
+        text           TEXT NOT NULL,
+        title_number   TEXT NOT NULL,
+        article_number TEXT NOT NULL,
+        part_number    TEXT
+    );
+    CREATE INDEX IF NOT EXISTS crs_sections_by_article ON crs_sections (title_number, article_number);
+
+    CREATE TABLE IF NOT EXISTS oar_chapters (
+        number TEXT PRIMARY KEY,
+        name   TEXT,
+        url    TEXT,
+        db_id  TEXT
+    );
+    CREATE TABLE IF NOT EXISTS oar_divisions (
+        chapter_number TEXT NOT NULL,
+        number         TEXT NOT NULL,
+        name           TEXT,
+        url            TEXT,
+        db_id          TEXT,
+        PRIMARY KEY (chapter_number, number)
+    );
+    CREATE TABLE IF NOT EXISTS oar_rules (
+        number          TEXT PRIMARY KEY,
+        name            TEXT,
+        text            TEXT,
+        url             TEXT,
+        internal_url    TEXT,
+        chapter_number  TEXT,
+        division_number TEXT,
+        authority       TEXT, -- A JSON array
+        implements      TEXT, -- A JSON array
+        history         TEXT
+    );
+    CREATE INDEX IF NOT EXISTS oar_rules_by_division ON oar_rules (chapter_number, division_number);
+
+    CREATE TABLE IF NOT EXISTS ag_opinions (
+        source_url  TEXT PRIMARY KEY,
+        title       TEXT,
+        is_official INTEGER,
+        date        TEXT,
+        summary     TEXT,
+        full_text   TEXT,
+        citations   TEXT -- A JSON object
+    );
+    CREATE INDEX IF NOT EXISTS ag_opinions_by_date ON ag_opinions (date);
+
+    CREATE VIRTUAL TABLE IF NOT EXISTS crs_sections_fts USING fts5 (name, text, content = 'crs_sections');
+    CREATE VIRTUAL TABLE IF NOT EXISTS oar_rules_fts    USING fts5 (name, text, content = 'oar_rules');
+    CREATE VIRTUAL TABLE IF NOT EXISTS ag_opinions_fts  USING fts5 (title, summary, full_text, content = 'ag_opinions');
+"""
+
+FTS_TABLES = ("crs_sections_fts", "oar_rules_fts", "ag_opinions_fts")
+
+
+class SqliteOutputPipeline:
+    """
+    Store the legal texts in a SQLite database, for lookups without
+    loading a whole dataset: the CRS Titles, Divisions, Articles and
+    Sections, the OAR Chapters, Divisions and Rules, and AG opinions.
+
+    Rows are inserted in transactions of `SQLITE_OUTPUT_BATCH_SIZE` items,
+    replacing any with the same key, so the same file can be updated by
+    later crawls. Sections and Rules are keyed by their numbers.
+
+    The `*_fts` tables are FTS5 indexes of the texts, rebuilt when the
+    spider closes:
+
+        SELECT number, name FROM crs_sections
+        WHERE rowid IN (SELECT rowid FROM crs_sections_fts WHERE crs_sections_fts MATCH 'bail')
+
+    The file is `SQLITE_OUTPUT_FILE`, with `%(name)s` replaced by the
+    spider's name. Disabled unless it's set.
+    """
+
+    def __init__(self, crawler: Crawler, file_template: str, batch_size: int = DEFAULT_SQLITE_BATCH_SIZE):
+        super().__init__()
+        self.crawler       = crawler
+        self.file_template = file_template
+        self.batch_size    = batch_size
+        self.db: sqlite3.Connection | None = None
+        self.rows: dict[str, list[tuple[Any, ...]]] = {}
+        self.pending_items = 0
+
+    @classmethod
+    def from_crawler(cls, crawler: Crawler):
+        match crawler.settings.get("SQLITE_OUTPUT_FILE"):
+            case None | "":
+                raise NotConfigured  # Off by default, so not worth a warning.
+            case file_template:
+                return cls(
+                    crawler,
+                    file_template,
+                    crawler.settings.getint("SQLITE_OUTPUT_BATCH_SIZE", DEFAULT_SQLITE_BATCH_SIZE),
+                )
+
+    def open_spider(self, spider: Spider | None = None) -> None:
+        path = Path(self.file_template % {"name": _spider_name(self.crawler, spider)})
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.db = sqlite3.connect(path)
+        _ = self.db.execute("PRAGMA journal_mode = WAL")
+        _ = self.db.execute("PRAGMA synchronous = NORMAL")
+        _ = self.db.executescript(SQLITE_SCHEMA)
+
+    def process_item(self, item: Any, spider: Spider | None = None) -> Any:
+        for table, row in sqlite_rows(item):
+            self.rows.setdefault(table, []).append(row)
+
+        self.pending_items += 1
+        if self.pending_items >= self.batch_size:
+            self.flush()
+
+        return item
+
+    def close_spider(self, spider: Spider | None = None) -> None:
+        self.flush()
+
+        db = self._connection()
+        with db:
+            for fts_table in FTS_TABLES:
+                _ = db.execute(f"INSERT INTO {fts_table} ({fts_table}) VALUES ('rebuild')")
+        _ = db.execute("PRAGMA optimize")
+
+        db.close()
+        self.db = None
+
+    def flush(self) -> None:
+        """Insert the pending rows in one transaction."""
+        db = self._connection()
+
+        with db:
+            for table, rows in self.rows.items():
+                columns = SQLITE_COLUMNS[table]
+                _ = db.executemany(
+                    f"INSERT OR REPLACE INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+                    rows,
+                )
+
+        self.rows.clear()
+        self.pending_items = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        match self.db:
+            case None:
+                raise RuntimeError("The SQLite output isn't open")
+            case db:
+                return db
+
+
+def sqlite_rows(item: Any) -> Iterable[tuple[str, tuple[Any, ...]]]:
+    """The rows which the item contributes, and their tables."""
+    match item:
+        case crs.Section():
+            yield "crs_sections", _values(item, SQLITE_COLUMNS["crs_sections"])
+        case crs.Article():
+            yield "crs_articles", _values(item, SQLITE_COLUMNS["crs_articles"])
+        case crs.Title():
+            yield "crs_titles", _values(item, SQLITE_COLUMNS["crs_titles"])
+            for child in item.children:
+                yield from sqlite_rows(child)
+        case crs.Division():
+            yield "crs_divisions", (item.title_number, item.name)
+            for child in item.children:
+                yield from sqlite_rows(child)
+        case crs.Subdivision():
+            for article in item.articles:
+                yield from sqlite_rows(article)
+        case oar.OAR():
+            for chapter in item.get("chapters", []):
+                yield "oar_chapters", tuple(chapter.get(column) for column in SQLITE_COLUMNS["oar_chapters"])
+                for division in chapter.get("divisions", []):
+                    yield "oar_divisions", (
+                        chapter.get("number"),
+                        *(division.get(column) for column in SQLITE_COLUMNS["oar_divisions"][1:]),
+                    )
+                    for rule in division.get("rules", []):
+                        yield "oar_rules", _oar_rule_values(_rule_row(rule))
+        case oar.Rule():
+            yield "oar_rules", _oar_rule_values(_rule_row(item))
+        case {"source_url": str(), "full_text": str()}:
+            yield "ag_opinions", tuple(_sql_value(item.get(column)) for column in SQLITE_COLUMNS["ag_opinions"])
+        case _:
+            pass
+
+
+def _oar_rule_values(row: dict[str, Any]) -> tuple[Any, ...]:
+    return tuple(_sql_value(row[column]) for column in SQLITE_COLUMNS["oar_rules"])
+
+
+def _values(obj: Any, columns: tuple[str, ...]) -> tuple[Any, ...]:
+    return tuple(getattr(obj, column) for column in columns)
+
+
+ItemValue: TypeAlias = str | int | float | bytes | list[Any] | tuple[Any, ...] | dict[str, Any] | None
+
+
+def _sql_value(value: ItemValue) -> str | int | float | bytes | None:
+    """Store lists and named tuples as JSON."""
+    match value:
+        case tuple() if hasattr(value, "_asdict"):
+            return json.dumps(value._asdict())  # type: ignore
+        case list() | tuple() | dict():
+            return json.dumps(value)
+        case _:
+            return value
+
+
+#
+# Writing output off the reactor thread.
+#
+
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_QUEUE_SIZE = 8
+
+
+class BackgroundWriterPipeline:
+    """
+    Write the items as JSON Lines from a background thread.
+
+    Items are queued in batches of `BACKGROUND_WRITER_BATCH_SIZE`, and a
+    writer thread serializes, compresses and writes them, so that the
+    reactor can keep downloading and parsing meanwhile. When
+    `BACKGROUND_WRITER_QUEUE_SIZE` batches are waiting, the next batch's
+    items aren't passed on until the writer has made room for it: Scrapy
+    then holds back new responses until the writer catches up. Batches
+    are written in the order they were filled.
+
+    The output file is `BACKGROUND_WRITER_FILE`, with `%(name)s` replaced by
+    the spider's name. It's compressed if it ends in `.gz` or `.zst`, as
+    with the feed exporters in `public_law.exporters`, and their
+    `FEED_EXPORT_*` settings apply. Disabled unless the file is set.
+
+    Items are written some time after they pass through, so they mustn't
+    be changed afterwards.
+    """
+
+    def __init__(self, crawler: Crawler, file_template: str, batch_size: int = DEFAULT_BATCH_SIZE, queue_size: int = DEFAULT_QUEUE_SIZE):
+        super().__init__()
+        self.crawler       = crawler
+        self.file_template = file_template
+        self.batch_size    = batch_size
+        self.batch: list[Any] = []
+
+        # Batches go into the queue for the writer thread, or, while it's
+        # full, wait their turn in `pending`. Both are guarded by the lock.
+        self.queue:   queue.Queue[list[Any] | None] = queue.Queue(maxsize=queue_size)
+        self.pending: deque[tuple[list[Any], Deferred[None]]] = deque()
+        self.lock     = threading.Lock()
+
+        self.error:    BaseException | None = None
+        self.thread:   threading.Thread | None = None
+        self.file:     IO[bytes] | None = None
+        self.exporter: JsonLinesStreamExporter | None = None
+
+    @classmethod
+    def from_crawler(cls, crawler: Crawler):
+        settings = crawler.settings
+
+        match settings.get("BACKGROUND_WRITER_FILE"):
+            case None | "":
+                raise NotConfigured  # Off by default, so not worth a warning.
+            case file_template:
+                return cls(
+                    crawler,
+                    file_template,
+                    settings.getint("BACKGROUND_WRITER_BATCH_SIZE", DEFAULT_BATCH_SIZE),
+                    settings.getint("BACKGROUND_WRITER_QUEUE_SIZE", DEFAULT_QUEUE_SIZE),
+                )
+
+    def open_spider(self, spider: Spider | None = None) -> None:
+        path = Path(self.file_template % {"name": _spider_name(self.crawler, spider)})
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.file     = open(path, "wb")
+        self.exporter = build_from_crawler(exporter_class(path), self.crawler, self.file)
+        self.exporter.start_exporting()
+
+        self.thread = threading.Thread(target=self._write_batches, name="background-writer", daemon=True)
+        self.thread.start()
+
+    async def process_item(self, item: Any, spider: Spider | None = None) -> Any:
+        self._raise_writer_error()
+
+        self.batch.append(item)
+        if len(self.batch) < self.batch_size:
+            return item
+
+        batch, self.batch = self.batch, []
+        self._stats().inc_value("background_writer/batches")
+
+        match self.enqueue(batch):
+            case None:
+                pass
+            case queued:
+                self._stats().inc_value("background_writer/waits")
+                await maybe_deferred_to_future(queued)
+
+        return item
+
+    def close_spider(self, spider: Spider | None = None) -> Deferred[None]:
+        # A Deferred, not a coroutine: Scrapy 2.13 calls this as a Deferred
+        # callback, which wouldn't await one.
+        return threads.deferToThread(self.finish)
+
+    def enqueue(self, batch: list[Any]) -> Deferred[None] | None:
+        """
+        Queue the batch for the writer. If the queue is full, return a
+        Deferred which fires once it's been queued.
+        """
+        with self.lock:
+            if not self.pending:
+                try:
+                    self.queue.put_nowait(batch)
+                    return None
+                except queue.Full:
+                    pass
+
+            queued: Deferred[None] = Deferred()
+            self.pending.append((batch, queued))
+            return queued
+
+    def queue_pending(self) -> None:
+        """Move waiting batches into the queue while there's room. Runs in the reactor."""
+        queued: list[Deferred[None]] = []
+
+        with self.lock:
+            while self.pending:
+                try:
+                    self.queue.put_nowait(self.pending[0][0])
+                except queue.Full:
+                    break
+                queued.append(self.pending.popleft()[1])
+
+        for deferred in queued:
+            deferred.callback(None)
+
+    def finish(self) -> None:
+        """Write the last batch and wait for the writer. Blocks."""
+        if self.batch:
+            self.queue.put(self.batch)
+            self.batch = []
+        self.queue.put(None)
+
+        if self.thread:
+            self.thread.join()
+        if self.exporter and not self.error:
+            self.exporter.finish_exporting()
+        if self.file:
+            self.file.close()
+
+        self._raise_writer_error()
+
+    def _write_batches(self) -> None:
+        """The writer thread. After an error, keep emptying the queue so nothing blocks."""
+        assert self.exporter is not None
+
+        while (batch := self.queue.get()) is not None:
+            with self.lock:
+                has_room_for_pending = bool(self.pending)
+            if has_room_for_pending:
+                _call_in_reactor(self.queue_pending)
+
+            if self.error:
+                continue
+            try:
+                for item in batch:
+                    self.exporter.export_item(item)
+            except BaseException as error:
+                self.error = error
+
+    def _raise_writer_error(self) -> None:
+        if self.error:
+            raise RuntimeError("The background writer failed") from self.error
+
+    def _stats(self) -> Any:
+        assert self.crawler.stats is not None
+        return self.crawler.stats
+
+
+def _call_in_reactor(f: Callable[[], None]) -> None:
+    from twisted.internet import reactor
+
+    reactor.callFromThread(f)  # type: ignore
@@ -69,18 +69,30 @@ TELNETCONSOLE_ENABLED = False
 
 # Enable or disable spider middlewares
 # See https://doc.scrapy.org/en/latest/topics/spider-middleware.html
-# SPIDER_MIDDLEWARES = {
-#    'public_law.middlewares.OarSpiderMiddleware': 543,
-# }
+SPIDER_MIDDLEWARES = {
+    "public_law.middlewares.ParseTimingMiddleware": 950,
+}
+
+# Where ParseTimingMiddleware writes its callback timing report, if
+# anywhere, and how many of the slowest responses it profiles.
+# %(name)s is replaced with the spider's name.
+# PARSE_TIMING_REPORT = "reports/%(name)s-parse-timing.json"
+# PARSE_TIMING_PROFILE_SLOWEST = 5
 
 # Enable or disable downloader middlewares
 # See https://doc.scrapy.org/en/latest/topics/downloader-middleware.html
 DOWNLOADER_MIDDLEWARES = {
-    #   'public_law.middlewares.OarDownloaderMiddleware': 543,
-    "scrapy.downloadermiddlewares.httpcache.HttpCacheMiddleware": 1,
+    "public_law.middlewares.DownloadTimingMiddleware": 950,
+    "scrapy.downloadermiddlewares.httpcache.HttpCacheMiddleware": None,
+    "public_law.httpcache.RevalidatingCacheMiddleware": 1,
 }
 
 
+# Where DownloadTimingMiddleware writes its per-host report, if anywhere.
+# %(name)s is replaced with the spider's name.
+# DOWNLOAD_TIMING_REPORT = "reports/%(name)s-download-timing.json"
+
+
 # Enable or disable extensions
 # See https://doc.scrapy.org/en/latest/topics/extensions.html
 # EXTENSIONS = {
@@ -88,12 +100,60 @@ DOWNLOADER_MIDDLEWARES = {
 # }
 EXTENSIONS = {
     # "spidermon.contrib.scrapy.extensions.Spidermon": 500,
+    "public_law.extensions.RunClock": 0,
 }
 
+# The timezone of the run's date, which every item is stamped with.
+TIMEZONE = "US/Mountain"
+
 
 # Configure item pipelines
 # See https://doc.scrapy.org/en/latest/topics/item-pipeline.html
-# ITEM_PIPELINES = {"public_law.pipelines.OarPipeline": 300}
+ITEM_PIPELINES = {
+    "public_law.pipelines.DedupPipeline": 100,
+    "public_law.pipelines.ParquetExportPipeline": 800,
+    "public_law.pipelines.ShardedOutputPipeline": 850,
+    "public_law.pipelines.SqliteOutputPipeline": 860,
+    "public_law.pipelines.BackgroundWriterPipeline": 900,
+}
+
+# Where DedupPipeline keeps the identities of the items it has seen:
+# "memory", or "disk" for crawls too big for memory. The disk set is a
+# temporary file in DEDUP_DIR (default: the system's temporary directory).
+DEDUP_STORAGE = "memory"
+# DEDUP_DIR = "tmp"
+
+# Set to also write the CRS Sections and Articles, and the OAR Rules,
+# to Parquet files in this directory. Needs pyarrow.
+# PARQUET_EXPORT_DIR = "tmp/parquet"
+PARQUET_ROW_GROUP_SIZE = 10_000
+
+# Set to also write the items into one JSON Lines file per kind and
+# title, with a manifest.json. %(name)s is replaced with the spider's name.
+# SHARDED_OUTPUT_DIR = "tmp/%(name)s"
+SHARDED_OUTPUT_SUFFIX = ".jsonl"
+
+# Set to also store the legal texts in a SQLite database, with FTS5
+# indexes. %(name)s is replaced with the spider's name.
+# SQLITE_OUTPUT_FILE = "tmp/%(name)s.sqlite3"
+SQLITE_OUTPUT_BATCH_SIZE = 1_000
+
+# Set to write the items as JSON Lines from a background thread, instead
+# of with a feed export on the reactor thread. %(name)s is replaced with
+# the spider's name; a .gz or .zst suffix compresses the file.
+# BACKGROUND_WRITER_FILE = "tmp/%(name)s.jsonl.gz"
+BACKGROUND_WRITER_BATCH_SIZE = 100
+BACKGROUND_WRITER_QUEUE_SIZE = 8
+
+# Feed formats which stream, one item per line: jsonl, jsonl.gz and
+# jsonl.zst. See public_law/exporters.py.
+FEED_EXPORTERS = {
+    "jsonl":     "public_law.exporters.JsonLinesStreamExporter",
+    "jsonl.gz":  "public_law.exporters.GzipJsonLinesExporter",
+    "jsonl.zst": "public_law.exporters.ZstdJsonLinesExporter",
+}
+FEED_EXPORT_BUFFER_SIZE = 1024 * 1024
+FEED_EXPORT_FSYNC = "close"
 
 # Enable and configure the AutoThrottle extension (disabled by default)
 # See https://doc.scrapy.org/en/latest/topics/autothrottle.html
@@ -108,14 +168,36 @@ AUTOTHROTTLE_TARGET_CONCURRENCY = 4
 # Enable showing throttling stats for every response received:
 AUTOTHROTTLE_DEBUG = False
 
-# Enable and configure HTTP caching (disabled by default)
+# Configure HTTP caching.
 # See https://doc.scrapy.org/en/latest/topics/downloader-middleware.html#httpcache-middleware-settings
-# Enabled for development:
-# HTTPCACHE_ENABLED = True
-# HTTPCACHE_EXPIRATION_SECS = 0
-# HTTPCACHE_DIR = "httpcache"
-# HTTPCACHE_STORAGE = "scrapy.extensions.httpcache.FilesystemCacheStorage"
-# HTTPCACHE_POLICY = "scrapy.extensions.httpcache.DummyPolicy"
+#
+# Responses are kept in one SQLite database with compressed, deduplicated
+# bodies (see public_law/httpcache.py). Choose a profile by setting
+# PUBLAW_SCRAPY_PROFILE:
+#
+#   development: Cache every response, and never expire them, so that
+#                repeated runs are served locally.
+#   production:  Follow the sources' caching headers, and revalidate stale
+#                pages with conditional requests. Spiders can set their own
+#                HTTPCACHE_MAX_AGE (seconds). This is the default.
+#
+# The cache is enabled in both profiles.
+HTTPCACHE_ENABLED = True
+HTTPCACHE_DIR = "httpcache"
+HTTPCACHE_STORAGE = "public_law.httpcache.SqliteCacheStorage"
+HTTPCACHE_MAX_BYTES = 2 * 1024**3
+HTTPCACHE_EXPIRATION_SECS = 0
+HTTPCACHE_MAX_AGE = 0
+
+match os.environ.get("PUBLAW_SCRAPY_PROFILE", "production"):
+    case "development":
+        cache_policy = "scrapy.extensions.httpcache.DummyPolicy"
+    case "production":
+        cache_policy = "public_law.httpcache.RevalidatingPolicy"
+    case profile:
+        raise ValueError(f"Unknown PUBLAW_SCRAPY_PROFILE: {profile}")
+
+HTTPCACHE_POLICY = cache_policy
 
 
 #
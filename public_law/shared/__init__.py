@@ -11,7 +11,7 @@ This package contains:
 # Expose key shared models and utilities
 from .models.metadata import Metadata, Subject
 from .models.result import Result
-from .utils.text import NonemptyString, titleize, truncate_words
+from .utils.text import NonemptyString, titleize, titleize_all, truncate_words
 from .utils.dates import today, todays_date
 from .utils.html import just_text, xpath
 
@@ -21,6 +21,7 @@ __all__ = [
     "Result",
     "NonemptyString",
     "titleize", 
+    "titleize_all",
     "truncate_words",
     "today",
     "todays_date", 
@@ -1,10 +1,15 @@
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, field, fields, is_dataclass
 from datetime import date
-from typing import Any, Literal
+from functools import cache, cached_property
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Literal
 
 from public_law.shared.utils.dates import today
 from public_law.shared.utils.text import URI, NonemptyString
 
+if TYPE_CHECKING:
+    from _typeshed import DataclassInstance
+
 
 @dataclass(frozen=True)
 class Subject:
@@ -74,7 +79,7 @@ class Metadata:
     # This JSON dataset.
     dcterms_creator: str = "https://public.law"
     dcterms_type: str = "Dataset"
-    dcterms_modified: date = today()
+    dcterms_modified: date = field(default_factory=today)
     dcterms_license: str = "https://creativecommons.org/licenses/by/4.0/"
     dcterms_format: str = "application/json"
 
@@ -86,46 +91,80 @@ class Metadata:
         naming syntax. Instead of keys such as `dc_title`, they should be
         in the form, `dc:title`."""
 
-        return asdict(self, dict_factory=_make_dc_dict)
+        return _dc_dict(self)
+
+    @cached_property
+    def _dublin_core(self) -> MappingProxyType[str, Any]:
+        """
+        The Dublin Core dict, built once per instance. The mapping
+        methods below share it, so don't modify its nested values;
+        `as_dublin_core_dict()` and `copy()` build private copies.
+        """
+        return MappingProxyType(_dc_dict(self))
 
     def __len__(self):
-        return self.asdict().__len__()
+        return self._dublin_core.__len__()
 
     def __repr__(self) -> str:
         return asdict(self).__repr__()
 
     def __contains__(self, item: Any) -> bool:
-        return self.asdict().__contains__(item)
+        return self._dublin_core.__contains__(item)
 
     def __getitem__(self, item: Any) -> Any:
-        return self.asdict().__getitem__(item)
+        return self._dublin_core.__getitem__(item)
 
     def __eq__(self, __t: Any):
-        return self.asdict().__eq__(__t)
+        return self._dublin_core.__eq__(__t)
 
     def __ne__(self, __t: Any):
-        return self.asdict().__ne__(__t)
+        return self._dublin_core.__ne__(__t)
 
     def __iter__(self):
-        return self.asdict().__iter__()
+        return self._dublin_core.__iter__()
 
     def get(self, item: Any, default: Any = None):
-        return self.asdict().get(item, default)
+        return self._dublin_core.get(item, default)
 
     def items(self):
-        return self.asdict().items()
+        return self._dublin_core.items()
 
     def keys(self):
-        return self.asdict().keys()
+        return self._dublin_core.keys()
 
     def values(self):
-        return self.asdict().values()
+        return self._dublin_core.values()
 
     def copy(self):
-        return self.asdict().copy()
+        return self.as_dublin_core_dict()
+
+
+def _dc_dict(obj: "DataclassInstance") -> dict[str, Any]:
+    """
+    Like `dataclasses.asdict()` with underscores in the keys replaced by
+    colons, but without deep-copying the leaf values, and with the key
+    names worked out once per class.
+    """
+    return {
+        dc_name: _dc_value(getattr(obj, name))
+        for name, dc_name in _dc_field_names(type(obj))
+    }
+
+
+def _dc_value(value: Any) -> Any:
+    match value:
+        case _ if is_dataclass(value) and not isinstance(value, type):
+            return _dc_dict(value)
+        case tuple():
+            return tuple(_dc_value(v) for v in value)  # type: ignore
+        case list():
+            return [_dc_value(v) for v in value]  # type: ignore
+        case _:
+            return value
+
 
+@cache
+def _dc_field_names(cls: "type[DataclassInstance]") -> tuple[tuple[str, str], ...]:
+    """Each field's name, paired with its Dublin Core name."""
+    return tuple((f.name, f.name.replace("_", ":")) for f in fields(cls))
 
-def _make_dc_dict(item_list: list[tuple[str, Any]]) -> dict[str, Any]:
-    """Transform the keys in the items by converting underscores
-    to colons."""
-    return {k.replace("_", ":"): v for k, v in item_list}
@@ -1,16 +1,63 @@
-"""Provide date-related functions."""
+"""
+Provide date-related functions.
 
-from datetime import date, datetime
-from typing import Protocol
+All dates come from one `Clock` for the whole run, so every item of a crawl
+is stamped with the same date. The clock's timezone is the `TIMEZONE`
+Scrapy setting (see `public_law.extensions.RunClock`). Tests and benchmarks
+can install their own clock with `use_clock()`.
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime, tzinfo
+from functools import cached_property
+from typing import Callable
 
 import pytz
 
+DEFAULT_TIMEZONE = "US/Mountain"
+
+
+@dataclass(frozen=True)
+class Clock:
+    """
+    The date of one run, in the given timezone. It's computed once,
+    when first used. `now` is called with the timezone, like
+    `datetime.now`, and can be replaced to fix the date.
+    """
+
+    timezone: str = DEFAULT_TIMEZONE
+    now:      Callable[[tzinfo], datetime] = datetime.now
+
+    @cached_property
+    def today(self) -> date:
+        return self.now(pytz.timezone(self.timezone)).date()
+
+
+_clock = Clock()
 
-class SimpleTimezone(Protocol):
-    """Help out the type checker."""
 
-    def localize(self, a_date: datetime) -> datetime:
-        ...  # pragma: no cover
+def clock() -> Clock:
+    """The clock in use."""
+    return _clock
+
+
+def use_clock(new_clock: Clock) -> Clock:
+    """Install a clock for the rest of the run. Return the previous one."""
+    global _clock
+    previous, _clock = _clock, new_clock
+
+    return previous
+
+
+def use_timezone(timezone: str) -> Clock:
+    """
+    Make sure the clock is in the timezone. The clock, and so the run's
+    date, is only replaced if its timezone differs.
+    """
+    if _clock.timezone != timezone:
+        _ = use_clock(Clock(timezone))
+
+    return _clock
 
 
 def todays_date() -> str:
@@ -26,15 +73,9 @@ def current_year() -> int:
 
 
 def today() -> date:
-    """Provide today's date in the given timezone."""
-
-    # TODO: Refactor the timezone to a config setting.
-    #       But the Scrapy settings don't seem to be
-    #       available in this context.
-    #       See https://doc.scrapy.org/en/latest/topics/settings.html.
-    tz = pytz.timezone("US/Mountain")
+    """Provide today's date in the clock's timezone."""
 
-    return tz.localize(datetime.now()).date()
+    return _clock.today
 
 
 def iso_8601(a_date: date) -> str:
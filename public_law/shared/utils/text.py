@@ -7,7 +7,9 @@ String functions and types.
 """
 
 import re
-from typing import Any, Callable, cast
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from typing import Any, Callable, Iterable, cast
 
 import titlecase
 from bs4 import BeautifulSoup
@@ -39,6 +41,18 @@ class NonemptyString(str):
                 raise ValueError(
                     f"Content is empty or not a string: {content}")
 
+    @staticmethod
+    def from_str(content: str) -> "NonemptyString":
+        """
+        A faster constructor for content which is already known to be a
+        `str`, e.g. text from a parser. It's still checked to be nonempty.
+        Subclasses' own validation is not run, so it always returns a
+        plain NonemptyString.
+        """
+        if not content:
+            raise ValueError(f"Content is empty: {content!r}")
+        return str.__new__(NonemptyString, content)
+
 
 class URI(NonemptyString):
     """
@@ -54,40 +68,59 @@ class URL(URI):
     """
 
 
-class LoCSubject(URL):
+class SubjectURL(URL):
     """
-    A Library of Congress subject heading URI.
+    A subject heading URL, which can be created from either its bare ID
+    or its full URL.
+
+    Subclasses set the patterns. The same few subjects are created over and
+    over, so instances are interned: a repeated ID returns the same object.
     """
 
+    URL_PATTERN: re.Pattern[str]
+    ID_PATTERN:  re.Pattern[str]
+    URL_PREFIX:  str
+
     def __new__(cls, id: str):
-        # Accept a fully formed URI.
-        # This is needed by the dataclasses deepcopy process.
-        if re.match(r"^http://id.loc.gov/authorities/subjects/sh[0-9]+$", id):
-            return super().__new__(cls, id)
+        return _subject_url(cls, id)
+
 
-        # Accept a bare ID.
-        if re.match(r"^sh\d+$", id):
-            return super().__new__(cls, f"http://id.loc.gov/authorities/subjects/{id}")
+# The number of distinct subjects to keep interned.
+SUBJECT_CACHE_SIZE = 1024
 
-        raise ValueError(f"Invalid subject ID: {id}")
 
+@lru_cache(maxsize=SUBJECT_CACHE_SIZE)
+def _subject_url(cls: type[SubjectURL], id: str) -> Any:
+    # Accept a fully formed URI, as the same instance as its bare ID.
+    # This is needed by the dataclasses deepcopy process.
+    if cls.URL_PATTERN.match(id):
+        return _subject_url(cls, id.removeprefix(cls.URL_PREFIX))
 
-class WikidataTopic(URL):
+    # Accept a bare ID.
+    if cls.ID_PATTERN.match(id):
+        return str.__new__(cls, f"{cls.URL_PREFIX}{id}")
+
+    raise ValueError(f"Invalid subject ID: {id}")
+
+
+class LoCSubject(SubjectURL):
     """
-    A wikidata subject.
+    A Library of Congress subject heading URI.
     """
 
-    def __new__(cls, id: str):
-        # Accept a fully formed URI.
-        # This is needed by the dataclasses deepcopy process.
-        if re.match(r"^https://www.wikidata.org/wiki/Q[0-9]+$", id):
-            return super().__new__(cls, id)
+    URL_PATTERN = re.compile(r"^http://id.loc.gov/authorities/subjects/sh[0-9]+$")
+    ID_PATTERN  = re.compile(r"^sh\d+$")
+    URL_PREFIX  = "http://id.loc.gov/authorities/subjects/"
+
 
-        # Accept a bare ID.
-        if re.match(r"^Q[0-9]+$", id):
-            return super().__new__(cls, f"https://www.wikidata.org/wiki/{id}")
+class WikidataTopic(SubjectURL):
+    """
+    A wikidata subject.
+    """
 
-        raise ValueError(f"Invalid subject ID: {id}")
+    URL_PATTERN = re.compile(r"^https://www.wikidata.org/wiki/Q[0-9]+$")
+    ID_PATTERN  = re.compile(r"^Q[0-9]+$")
+    URL_PREFIX  = "https://www.wikidata.org/wiki/"
 
 
 class Sentence(NonemptyString):
@@ -173,12 +206,15 @@ def ensure_starts_with_capital(text: str) -> str:
             return NonemptyString(s[0].upper() + s[1:])
 
 
-def make_soup(html: HtmlResponse) -> BeautifulSoup:
+def make_soup(html: HtmlResponse, features: str = "lxml") -> BeautifulSoup:
     """
     Create a BeautifulSoup object from the Response body.
+
+    Uses the lxml parser, which is much faster than the pure-Python
+    "html.parser". Pass `features="html.parser"` to get the old tree.
     """
     return BeautifulSoup(
-        cast(str, html.body), "html.parser"
+        cast(str, html.body), features
     )
 
 
@@ -250,6 +286,97 @@ def cleanup(text: str|TypedSoup) -> NonemptyString:
     return NonemptyString(normalize_whitespace(text))
 
 
+@dataclass(frozen=True)
+class Normalizer:
+    """
+    A cleanup chain fused into a single function, which makes one
+    translation and one whitespace pass over the string, and builds
+    its result without re-validating it.
+
+    The rules are always applied in this order:
+
+    1. Typographical quotes and apostrophes are straightened.
+    2. Whitespace is normalized, as by `cleanup()`.
+    3. The `lstrip` and `rstrip` characters are removed from the ends,
+       along with any whitespace this uncovers.
+    4. The first character is capitalized.
+    5. A period is added, as by `ensure_ends_with_period()`.
+
+    The result is a `Sentence` when `sentence` is set (which implies
+    `period`), and otherwise a `NonemptyString`. `to_sentence()` always
+    makes a `Sentence`, and is typed as one. Like `cleanup()`, they
+    raise a ValueError if nothing is left.
+
+    Normalizers combine with `|`, and can be used as a step in a `pipe`:
+
+    >>> definition = Normalizer(lstrip=":", apostrophes=True) | Normalizer(capitalize=True, sentence=True)
+    >>> definition("  :  the   court’s decision ")
+    "The court's decision."
+    """
+
+    quotes:      bool = False
+    apostrophes: bool = False
+    lstrip:      str  = ""
+    rstrip:      str  = ""
+    capitalize:  bool = False
+    period:      bool = False
+    sentence:    bool = False
+
+    def __or__(self, other: "Normalizer") -> "Normalizer":
+        return Normalizer(
+            quotes      = self.quotes or other.quotes,
+            apostrophes = self.apostrophes or other.apostrophes,
+            lstrip      = self.lstrip + other.lstrip,
+            rstrip      = self.rstrip + other.rstrip,
+            capitalize  = self.capitalize or other.capitalize,
+            period      = self.period or other.period,
+            sentence    = self.sentence or other.sentence,
+        )
+
+    def __call__(self, text: str | TypedSoup) -> NonemptyString:
+        text = self._normalize(text, period=self.period or self.sentence)
+        return str.__new__(Sentence if self.sentence else NonemptyString, text)
+
+    def to_sentence(self, text: str | TypedSoup) -> Sentence:
+        return str.__new__(Sentence, self._normalize(text, period=True))
+
+    def _normalize(self, text: str | TypedSoup, period: bool) -> str:
+        if isinstance(text, TypedSoup):
+            text = text.get_text()
+
+        table = self._translation
+        if table:
+            text = text.translate(table)
+
+        text = " ".join(text.split())
+        if self.lstrip or self.rstrip:
+            text = text.lstrip(self.lstrip).rstrip(self.rstrip).strip()
+
+        if not text:
+            raise ValueError("Content is empty")
+
+        if self.capitalize:
+            text = text[0].upper() + text[1:]
+
+        if period and not text.endswith(_SENTENCE_ENDINGS):
+            text += "."
+
+        return text
+
+    @cached_property
+    def _translation(self) -> dict[int, str]:
+        table: dict[int, str] = {}
+        if self.quotes:
+            table |= str.maketrans({"“": '"', "”": '"'})
+        if self.apostrophes:
+            table |= str.maketrans({"’": "'", "‘": "'"})
+        return table
+
+
+# The endings which `ensure_ends_with_period()` accepts.
+_SENTENCE_ENDINGS = (".", '."', "</p>")
+
+
 def capitalize_first_char(text: str) -> str:
     """
     Capitalize the first character of the string
@@ -297,11 +424,19 @@ lstrip: Callable[[str, str], str] = curry(flip(str.lstrip))  # type: ignore
 rstrip: Callable[[str, str], str] = curry(flip(str.rstrip))  # type: ignore
 
 
+# The number of distinct titleized strings to remember.
+TITLEIZE_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=TITLEIZE_CACHE_SIZE)
 def titleize(text: str) -> str:
     """
     Capitalize the first letter of each word in a string.
     This is a wrapper around the `titlecase` library.
 
+    Results are memoized, because the same names (of CRS divisions,
+    OAR divisions, etc.) are titleized over and over.
+
     >>> titleize("hello world")
     'Hello World'
 
@@ -311,9 +446,28 @@ def titleize(text: str) -> str:
     >>> titleize("CORPORATIONS - Continued")
     'Corporations - Continued'
     """
-    def titlecase_special_cases(word: str, **kwargs) -> str | None:  # type: ignore
-        if re.fullmatch(r'[IVXC]+', word, re.IGNORECASE):
-            return word.upper()
-
     # Needs text.lower() because titlecase incorrectly sees all caps as an acronym.
-    return titlecase.titlecase(text.lower(), callback=titlecase_special_cases)
+    return titlecase.titlecase(text.lower(), callback=_titlecase_special_cases)
+
+
+def titleize_all(texts: Iterable[str]) -> list[str]:
+    """
+    Titleize each of the strings. Each distinct string is only
+    titleized once.
+
+    >>> titleize_all(["title iii", "GENERAL PROVISIONS", "title iii"])
+    ['Title III', 'General Provisions', 'Title III']
+    """
+    texts  = list(texts)
+    titles = {text: titleize(text) for text in dict.fromkeys(texts)}
+
+    return [titles[text] for text in texts]
+
+
+_ROMAN_NUMERAL = re.compile(r"[IVXC]+", re.IGNORECASE)
+
+
+def _titlecase_special_cases(word: str, **kwargs: Any) -> str | None:
+    if _ROMAN_NUMERAL.fullmatch(word):
+        return word.upper()
+    return None
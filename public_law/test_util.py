@@ -1,5 +1,49 @@
+from functools import cache
+from pathlib import Path
+
+from scrapy.http.response.html import HtmlResponse
+from scrapy.http.response.xml import XmlResponse
+
+FIXTURES_DIR = "tests/fixtures"
+
+
 def fixture(country: str, subdiv: str, filename: str) -> str:
-    return open(f"tests/fixtures/{country}/{subdiv}/{filename}", encoding="utf8").read()
+    return fixture_text(f"{country}/{subdiv}/{filename}")
+
+
+@cache
+def fixture_bytes(path: str) -> bytes:
+    """
+    The raw contents of a file under tests/fixtures.
+
+    The file is read once per test session; every later call returns
+    the same bytes object.
+    """
+    return Path(FIXTURES_DIR, path).read_bytes()
+
+
+@cache
+def fixture_text(path: str) -> str:
+    """The decoded contents of a file under tests/fixtures."""
+    return fixture_bytes(path).decode("utf8")
+
+
+@cache
+def html_fixture(path: str, url: str) -> HtmlResponse:
+    """
+    A shared HtmlResponse for a file under tests/fixtures.
+
+    Responses are cached per (path, url), so their lazily built
+    selectors, and the lxml trees behind them, are shared too.
+    Parsers must treat the response as read-only.
+    """
+    return HtmlResponse(url=url, body=fixture_bytes(path), encoding="utf-8")
+
+
+@cache
+def xml_fixture(path: str, url: str) -> XmlResponse:
+    """A shared XmlResponse for a file under tests/fixtures."""
+    return XmlResponse(url=url, body=fixture_bytes(path), encoding="utf-8")
 
 
 class NullLogger:
@@ -0,0 +1,92 @@
+import gzip
+import io
+import json
+from pathlib import Path
+
+import pytest
+from scrapy import Spider
+from scrapy.utils.test import get_crawler
+
+from public_law.exporters import (GzipJsonLinesExporter,
+                                  JsonLinesStreamExporter,
+                                  ZstdJsonLinesExporter)
+
+ITEMS = [{"name": "Section 1", "text": "Café"}, {"name": "Section 2", "text": "Text"}]
+
+
+def export(exporter: JsonLinesStreamExporter, items: list[dict[str, str]] = ITEMS) -> None:
+    exporter.start_exporting()
+    for item in items:
+        exporter.export_item(item)
+    exporter.finish_exporting()
+
+
+def lines(data: bytes) -> list[dict[str, str]]:
+    return [json.loads(line) for line in data.decode("utf-8").splitlines()]
+
+
+class TestJsonLinesStreamExporter:
+    def test_writes_one_object_per_line(self):
+        output = io.BytesIO()
+        export(JsonLinesStreamExporter(output))
+
+        assert lines(output.getvalue()) == ITEMS
+
+    def test_buffers_until_the_buffer_is_full(self):
+        output   = io.BytesIO()
+        exporter = JsonLinesStreamExporter(output, buffer_size=1000)
+        exporter.start_exporting()
+        exporter.export_item(ITEMS[0])
+
+        assert output.getvalue() == b""
+
+        exporter.finish_exporting()
+        assert lines(output.getvalue()) == ITEMS[:1]
+
+    def test_writes_out_a_full_buffer(self):
+        output   = io.BytesIO()
+        exporter = JsonLinesStreamExporter(output, buffer_size=1)
+        exporter.export_item(ITEMS[0])
+
+        assert lines(output.getvalue()) == ITEMS[:1]
+
+    def test_syncs_a_real_file(self, tmp_path: Path):
+        path = tmp_path / "items.jsonl"
+        with open(path, "wb") as f:
+            export(JsonLinesStreamExporter(f, buffer_size=1, fsync="flush"))
+
+        assert lines(path.read_bytes()) == ITEMS
+
+    def test_rejects_an_unknown_fsync_policy(self):
+        with pytest.raises(ValueError):
+            _ = JsonLinesStreamExporter(io.BytesIO(), fsync="always")  # type: ignore
+
+    def test_takes_its_defaults_from_the_settings(self):
+        crawler  = get_crawler(Spider, {"FEED_EXPORT_BUFFER_SIZE": 10, "FEED_EXPORT_FSYNC": "never"})
+        exporter = JsonLinesStreamExporter.from_crawler(crawler, io.BytesIO())
+
+        assert (exporter.buffer_size, exporter.fsync) == (10, "never")
+
+
+class TestCompression:
+    def test_gzip(self):
+        output = io.BytesIO()
+        export(GzipJsonLinesExporter(output))
+
+        assert lines(gzip.decompress(output.getvalue())) == ITEMS
+        assert not output.closed
+
+    def test_gzip_output_is_reproducible(self):
+        first, second = io.BytesIO(), io.BytesIO()
+        export(GzipJsonLinesExporter(first))
+        export(GzipJsonLinesExporter(second))
+
+        assert first.getvalue() == second.getvalue()
+
+    def test_zstd(self):
+        zstandard = pytest.importorskip("zstandard")
+        output    = io.BytesIO()
+        export(ZstdJsonLinesExporter(output))
+
+        decompressed = zstandard.ZstdDecompressor().stream_reader(io.BytesIO(output.getvalue())).read()
+        assert lines(decompressed) == ITEMS
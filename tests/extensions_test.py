@@ -0,0 +1,15 @@
+from scrapy import Spider
+from scrapy.utils.test import get_crawler
+
+from public_law.extensions import RunClock
+from public_law.shared.utils import dates
+
+
+class TestRunClock:
+    def test_uses_the_timezone_setting(self):
+        previous = dates.clock()
+        try:
+            _ = RunClock.from_crawler(get_crawler(Spider, {"TIMEZONE": "Europe/Dublin"}))
+            assert dates.clock().timezone == "Europe/Dublin"
+        finally:
+            _ = dates.use_clock(previous)
@@ -35,3 +35,35 @@ class TestAsDict:
 
     def test_has_renamed_metadata_key(self, glossary):
         assert "dcterms:subject" in glossary.asdict()["metadata"]
+
+
+class TestMapping:
+    def test_converts_once(self, glossary):
+        assert glossary["entries"] is glossary["entries"]
+
+    def test_is_read_only(self, glossary):
+        with pytest.raises(TypeError):
+            glossary._mapping["entries"] = []
+
+    def test_copy_is_a_private_dict(self, glossary):
+        copy = glossary.copy()
+        copy["entries"] = []
+
+        assert glossary["entries"]
+
+    def test_copy_is_deep(self, glossary):
+        copy   = glossary.copy()
+        phrase = glossary["entries"][0]["phrase"]
+        copy["entries"][0]["phrase"] = "Changed"
+
+        assert glossary["entries"][0]["phrase"] == phrase
+
+    def test_merging_is_deep(self, glossary):
+        merged = glossary | {}
+        merged["entries"].clear()
+
+        assert glossary["entries"]
+
+    def test_compares_with_dicts(self, glossary):
+        assert glossary == glossary.asdict()
+        assert not glossary != glossary.asdict()
@@ -147,3 +147,41 @@ class TestParseEntries:
         entry = list(p18_entries)[3]
         assert entry.phrase == "Child of the marriage"
         assert entry.definition[-4:] == "</p>"
+
+
+def _dl_response(dl_body: str) -> HtmlResponse:
+    return HtmlResponse(
+        url="https://example.com/can_doj_glossary",
+        body=f"<html><body><main><dl>{dl_body}</dl></main></body></html>".encode(),
+        encoding="utf-8",
+    )
+
+
+class TestDefinitionListPairing:
+    def test_joins_several_definitions_of_a_term(self):
+        entries = parse_entries(_dl_response(
+            "<dt>Access</dt><dd>First meaning.</dd><dd>Second meaning.</dd>"
+            "<dt>Adjournment</dt><dd>Postponement.</dd>"
+        ))
+
+        assert [(e.phrase, e.definition) for e in entries] == [
+            ("Access", "First meaning. Second meaning."),
+            ("Adjournment", "Postponement."),
+        ]
+
+    def test_terms_in_a_row_share_the_definition(self):
+        entries = parse_entries(_dl_response(
+            "<dt>Alimony</dt><dt>Spousal support</dt><dd>Money paid to a former spouse.</dd>"
+        ))
+
+        assert [(e.phrase, e.definition) for e in entries] == [
+            ("Alimony", "Money paid to a former spouse."),
+            ("Spousal support", "Money paid to a former spouse."),
+        ]
+
+    def test_keeps_the_inner_html(self):
+        entries = parse_entries(_dl_response(
+            '<dt>Act</dt><dd class="x">See the <em>Divorce Act</em></dd>'
+        ))
+
+        assert entries[0].definition == "See the <em>Divorce Act</em>."
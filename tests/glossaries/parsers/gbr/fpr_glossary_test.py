@@ -47,3 +47,13 @@ class TestParseEntries:
         last_entry = entries[-1]
         assert last_entry.phrase == "Without prejudice"
         assert last_entry.definition == "Negotiations with a view to settlement are usually conducted \"without prejudice\" which means that the circumstances in which the content of those negotiations may be revealed to the court are very restricted."
+
+    def test_gives_no_entries_when_terms_and_definitions_dont_pair_up(self):
+        html = b"""
+            <dl class="wp-block-simple-definition-list-blocks-list">
+              <dt>Term</dt>      <dd>Definition</dd>
+              <dt>Affidavit</dt> <dd>A written, sworn, statement of evidence.</dd>
+              <dt>Orphan</dt>
+            </dl>
+        """
+        assert parse_entries(HtmlResponse(url=ORIG_URL, body=html, encoding="utf-8")) == ()
@@ -0,0 +1,67 @@
+import pytest
+from scrapy.http.response.html import HtmlResponse
+
+from public_law.glossaries.parsers._base.glossary_spec import GlossarySpec, compile_glossary
+from public_law.shared.exceptions import ParseException
+
+
+def response(body: str) -> HtmlResponse:
+    return HtmlResponse(url="https://example.com/glossary", body=body, encoding="utf-8")
+
+
+DEFINITION_LIST = response("""
+    <dl>
+      <dt> Acquittal </dt> <dd>A verdict of <em>not guilty</em></dd>
+      <dt>Bail</dt>        <dd>Security for release.</dd>
+      <dt>Empty</dt>       <dd>   </dd>
+    </dl>
+""")
+
+TABLE = response("""
+    <table>
+      <tr><th>Term</th><th>Definition</th></tr>
+      <tr><td>Adjourn</td><td> To close a court session </td></tr>
+      <tr><td>Lonely</td></tr>
+    </table>
+""")
+
+
+class TestZipPairing:
+    ENTRIES = compile_glossary(GlossarySpec(terms="//dt", definitions="//dd"))(DEFINITION_LIST)
+
+    def test_pairs_terms_with_definitions_in_order(self):
+        assert [e.phrase for e in self.ENTRIES] == ["Acquittal", "Bail"]
+
+    def test_reads_all_the_text_inside_a_node(self):
+        assert self.ENTRIES[0].definition == "A verdict of not guilty."
+
+    def test_skips_pairs_with_blank_text(self):
+        assert len(self.ENTRIES) == 2
+
+    def test_can_raise_on_unequal_counts(self):
+        parse = compile_glossary(GlossarySpec(terms="//dt", definitions="//dd[1]", on_mismatch="raise"))
+        with pytest.raises(ParseException):
+            parse(DEFINITION_LIST)
+
+    def test_can_give_no_entries_on_unequal_counts(self):
+        parse = compile_glossary(GlossarySpec(terms="//dt", definitions="//dd[1]", on_mismatch="empty"))
+        assert parse(DEFINITION_LIST) == ()
+
+
+class TestRowPairing:
+    SPEC = GlossarySpec(pairing="row", rows="//tr", terms="td[1]", definitions="td[2]", text="stripped")
+
+    def test_reads_one_entry_per_complete_row(self):
+        [entry] = compile_glossary(self.SPEC)(TABLE)
+        assert (entry.phrase, entry.definition) == ("Adjourn", "To close a court session.")
+
+    def test_requires_a_rows_selector(self):
+        with pytest.raises(ValueError):
+            GlossarySpec(pairing="row", terms="td[1]", definitions="td[2]")
+
+
+def test_text_selectors_pick_the_node_to_read():
+    spec = GlossarySpec(terms="//dt", definitions="//dd", definition_text=".//em")
+    [entry] = compile_glossary(spec)(DEFINITION_LIST)
+
+    assert (entry.phrase, entry.definition) == ("Acquittal", "not guilty.")
@@ -47,3 +47,12 @@ class TestParseEntries:
         for entry in entries:
             assert isinstance(entry.phrase, NonemptyString)
             assert hasattr(entry, 'definition')
+
+    def test_strips_a_colon_only_at_the_very_end_of_a_phrase(self):
+        html = HtmlResponse(
+            url="https://www.courts.ie/glossary",
+            body=b"<p><strong>Affidavit:</strong>: A statement.</p><p><strong>Bail : </strong>A bond.</p>",
+            encoding="utf-8",
+        )
+
+        assert [e.phrase for e in parse_entries(html)] == ["Affidavit", "Bail :"]
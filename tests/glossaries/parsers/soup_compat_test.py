@@ -0,0 +1,39 @@
+"""
+The lxml-backed make_soup() must produce exactly the same entries as
+the html.parser tree which the parsers were written against.
+"""
+
+import importlib
+from functools import partial
+from types import ModuleType
+
+import pytest
+
+from public_law.shared.utils import text
+from public_law.test_util import html_fixture
+
+# Each parser which uses make_soup(), with its fixture.
+SOUP_PARSERS = [
+    ("aus.designip_glossary", "aus/designip-glossary.html"),
+    ("usa.uscis_glossary",    "usa/uscis-glossary.html"),
+]
+
+
+def parser_module(name: str) -> ModuleType:
+    return importlib.import_module(f"public_law.glossaries.parsers.{name}")
+
+
+@pytest.mark.parametrize("module_name, fixture_path", SOUP_PARSERS)
+def test_lxml_entries_match_html_parser_entries(monkeypatch: pytest.MonkeyPatch, module_name: str, fixture_path: str):
+    module   = parser_module(module_name)
+    response = html_fixture(fixture_path, "https://example.com/glossary")
+
+    lxml_entries = module.parse_entries(response)
+
+    html_parser_soup = partial(text.make_soup, features="html.parser")
+    monkeypatch.setattr(text, "make_soup", html_parser_soup)
+    if hasattr(module, "make_soup"):
+        monkeypatch.setattr(module, "make_soup", html_parser_soup)
+
+    assert lxml_entries
+    assert lxml_entries == module.parse_entries(response)
@@ -0,0 +1,71 @@
+import json
+from pathlib import Path
+
+import pytest
+from scrapy.utils.test import get_crawler
+
+from public_law.glossaries.corpus import archive_response, archived_pages
+from public_law.glossaries.reparse import reparse_all
+from public_law.glossaries.spiders.usa.courts_glossary import CourtsGlossary
+from public_law.glossaries.spiders.nzl.justice_glossary import JusticeGlossarySpider
+from public_law.test_util import html_fixture
+
+COURTS_URL  = "https://www.uscourts.gov/glossary"
+JUSTICE_URL = "https://www.justice.govt.nz/about/glossary/"
+
+
+@pytest.fixture
+def corpus_dir(tmp_path: Path) -> Path:
+    corpus = tmp_path / "corpus"
+    archive_response(corpus, "usa_courts_glossary", html_fixture("usa/courts-glossary.html", COURTS_URL))
+    archive_response(corpus, "nzl_justice_glossary", html_fixture("nzl/justice-glossary.html", JUSTICE_URL))
+    return corpus
+
+
+class TestArchivedPages:
+    def test_round_trips_the_url(self, corpus_dir: Path):
+        [page] = archived_pages(corpus_dir, "usa_courts_glossary")
+        assert page.url == COURTS_URL
+
+    def test_round_trips_the_content(self, corpus_dir: Path):
+        [page] = archived_pages(corpus_dir, "usa_courts_glossary")
+        original = html_fixture("usa/courts-glossary.html", COURTS_URL)
+        assert page.response().text == original.text
+
+    def test_missing_spider_has_no_pages(self, corpus_dir: Path):
+        assert archived_pages(corpus_dir, "usa_uscis_glossary") == []
+
+
+class TestReparseAll:
+    def test_writes_one_file_per_archived_spider(self, corpus_dir: Path, tmp_path: Path):
+        files = reparse_all(corpus_dir, tmp_path / "out", max_workers=2)
+        assert sorted(f.name for f in files) == ["nzl_justice_glossary.json", "usa_courts_glossary.json"]
+
+    def test_output_matches_the_spider(self, corpus_dir: Path, tmp_path: Path):
+        reparse_all(corpus_dir, tmp_path / "out", max_workers=2)
+        [item] = json.loads((tmp_path / "out" / "usa_courts_glossary.json").read_text())
+
+        expected = CourtsGlossary().parse_glossary(html_fixture("usa/courts-glossary.html", COURTS_URL))
+        assert item["entries"] == expected["entries"]
+        assert item["metadata"]["dcterms:source"] == COURTS_URL
+
+    def test_writes_the_format_of_scrapy_crawl_output(self, corpus_dir: Path, tmp_path: Path):
+        reparse_all(corpus_dir, tmp_path / "out", max_workers=2)
+        text = (tmp_path / "out" / "usa_courts_glossary.json").read_text()
+
+        assert text.startswith("[\n{") and text.endswith("}\n]")
+
+    def test_parses_each_spider_with_its_own_parser(self, corpus_dir: Path, tmp_path: Path):
+        reparse_all(corpus_dir, tmp_path / "out", max_workers=2)
+        [item] = json.loads((tmp_path / "out" / "nzl_justice_glossary.json").read_text())
+
+        expected = JusticeGlossarySpider().parse_glossary(html_fixture("nzl/justice-glossary.html", JUSTICE_URL))
+        assert item["entries"] == expected["entries"]
+
+
+def test_spiders_archive_responses_with_the_corpus_setting(tmp_path: Path):
+    crawler = get_crawler(CourtsGlossary, {"GLOSSARY_CORPUS_DIR": str(tmp_path)})
+    spider  = CourtsGlossary.from_crawler(crawler)
+    _ = next(spider.parse(html_fixture("usa/courts-glossary.html", COURTS_URL)))
+
+    assert [p.url for p in archived_pages(tmp_path, "usa_courts_glossary")] == [COURTS_URL]
@@ -0,0 +1,20 @@
+from pathlib import Path
+
+from public_law.glossaries.run_spiders import output_file, pending_spiders
+from public_law.glossaries.spiders._base.utils import discover_glossary_spiders
+
+
+class TestPendingSpiders:
+    def test_all_spiders_are_pending_in_an_empty_dir(self, tmp_path: Path):
+        assert pending_spiders(tmp_path) == discover_glossary_spiders()
+
+    def test_skips_spiders_with_existing_output(self, tmp_path: Path):
+        output_file(tmp_path, "usa_courts_glossary").write_text("[]")
+        names = [s.name for s in pending_spiders(tmp_path)]
+
+        assert "usa_courts_glossary" not in names
+        assert len(names) == len(discover_glossary_spiders()) - 1
+
+
+def test_output_file_is_named_after_the_spider():
+    assert output_file(Path("out"), "aus_dv_glossary") == Path("out/aus_dv_glossary.json")
@@ -8,7 +8,9 @@ from typing import Any
 import pytest
 from scrapy.http.response.html import HtmlResponse
 
-from public_law.glossaries.spiders._base.utils import discover_glossary_spiders
+from public_law.glossaries.spiders._base.enhanced_base import EnhancedAutoGlossarySpider
+from public_law.glossaries.spiders._base.utils import discover_glossary_spiders, prewarm_glossary_parsers
+from public_law.test_util import html_fixture
 
 # List of all glossary spiders to test (auto-generated)
 GLOSSARY_SPIDERS = discover_glossary_spiders()
@@ -16,9 +18,12 @@ GLOSSARY_SPIDERS = discover_glossary_spiders()
 assert GLOSSARY_SPIDERS, "No glossary spiders were discovered."
 
 
+FIXTURES_PATH = Path(__file__).parent.parent.parent / "fixtures"
+
+
 def get_fixture_path(spider_name: str) -> Path:
     """Get the path to the fixture file for a given spider."""
-    return Path(__file__).parent.parent.parent / "fixtures" / spider_name.split("_")[0] / f"{spider_name.split('_')[1]}-glossary.html"
+    return FIXTURES_PATH / spider_name.split("_")[0] / f"{spider_name.split('_')[1]}-glossary.html"
 
 
 @pytest.fixture
@@ -31,13 +36,9 @@ def mock_response(spider_class: Any) -> HtmlResponse:
         raise RuntimeError(
             f"Fixture file not found for {spider_name}: {fixture_path}")
 
-    with open(fixture_path, "rb") as f:
-        html_content = f.read()
-
-    return HtmlResponse(
-        url=f"https://example.com/{spider_name}",
-        body=html_content,
-        encoding="utf-8",
+    return html_fixture(
+        str(fixture_path.relative_to(FIXTURES_PATH)),
+        f"https://example.com/{spider_name}",
     )
 
 
@@ -56,3 +57,22 @@ def test_dublin_core_naming(spider_class: Any, mock_response: HtmlResponse):
 
     # Verify that no keys use underscore format
     assert all(f"dcterms_{key}" not in result["metadata"] for key in dc_keys)
+
+
+@pytest.mark.parametrize("spider_class", GLOSSARY_SPIDERS)
+def test_parser_is_resolved_once(spider_class: Any):
+    """The parser function is cached on the spider class."""
+    assert spider_class.parser() is spider_class.parser()
+
+
+def test_prewarm_glossary_parsers():
+    prewarm_glossary_parsers()
+
+
+def test_missing_parser_fails_when_the_spider_is_created():
+    class MissingParserSpider(EnhancedAutoGlossarySpider):
+        name       = "xyz_missing_glossary"
+        start_urls = ["https://example.com/glossary"]
+
+    with pytest.raises(ModuleNotFoundError):
+        MissingParserSpider()
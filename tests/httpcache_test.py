@@ -0,0 +1,178 @@
+import os
+from pathlib import Path
+
+import pytest
+from scrapy import Spider
+from scrapy.http.request import Request
+from scrapy.http.response.html import HtmlResponse
+from scrapy.utils.test import get_crawler
+
+from public_law.httpcache import RevalidatingCacheMiddleware, SqliteCacheStorage
+
+
+def make_storage(cache_dir: Path, **settings: object) -> tuple[SqliteCacheStorage, Spider]:
+    crawler = get_crawler(Spider, {"HTTPCACHE_DIR": str(cache_dir), **settings})
+    spider  = Spider.from_crawler(crawler, name="example")
+    storage = SqliteCacheStorage(crawler.settings)
+    storage.open_spider(spider)
+
+    return storage, spider
+
+
+def page(url: str, body: bytes) -> tuple[Request, HtmlResponse]:
+    request = Request(url)
+    return request, HtmlResponse(url=url, body=body, headers={"Content-Type": "text/html"}, request=request)
+
+
+@pytest.fixture
+def storage(tmp_path: Path):
+    storage, spider = make_storage(tmp_path)
+    yield storage, spider
+    storage.close_spider(spider)
+
+
+class TestSqliteCacheStorage:
+    def test_returns_a_stored_response(self, storage: tuple[SqliteCacheStorage, Spider]):
+        cache, spider = storage
+        request, response = page("https://example.com/a", b"<html>A</html>")
+        cache.store_response(spider, request, response)
+
+        cached = cache.retrieve_response(spider, Request("https://example.com/a"))
+
+        assert cached is not None
+        assert (type(cached), cached.url, cached.body) == (HtmlResponse, response.url, response.body)
+        assert cached.headers["Content-Type"] == b"text/html"
+
+    def test_misses_an_unknown_request(self, storage: tuple[SqliteCacheStorage, Spider]):
+        cache, spider = storage
+        assert cache.retrieve_response(spider, Request("https://example.com/missing")) is None
+
+    def test_stores_identical_bodies_once(self, storage: tuple[SqliteCacheStorage, Spider]):
+        cache, spider = storage
+        for url in ("https://example.com/a", "https://example.com/b"):
+            cache.store_response(spider, *page(url, b"<html>Same</html>" * 100))
+
+        assert cache._connection().execute("SELECT COUNT(*) FROM bodies").fetchone()[0] == 1
+        assert cache.retrieve_response(spider, Request("https://example.com/b")) is not None
+
+    def test_deletes_a_replaced_body(self, storage: tuple[SqliteCacheStorage, Spider]):
+        cache, spider = storage
+        cache.store_response(spider, *page("https://example.com/a", os.urandom(1000)))
+        cache.store_response(spider, *page("https://example.com/a", body := os.urandom(1000)))
+
+        [(count, size)] = cache._connection().execute("SELECT COUNT(*), SUM(size) FROM bodies").fetchall()
+        assert (count, cache.total_bytes) == (1, size)
+        assert cache.retrieve_response(spider, Request("https://example.com/a")).body == body  # type: ignore
+
+    def test_shares_its_total_with_other_crawlers(self, tmp_path: Path):
+        first, first_spider   = make_storage(tmp_path)
+        second, second_spider = make_storage(tmp_path)
+        first.store_response(first_spider, *page("https://example.com/a", os.urandom(1000)))
+        second.store_response(second_spider, *page("https://example.com/b", os.urandom(1000)))
+
+        assert first.total_bytes == second.total_bytes > 2000
+
+    def test_compresses_bodies(self, storage: tuple[SqliteCacheStorage, Spider]):
+        cache, spider = storage
+        body = b"<p>Repetitive text.</p>" * 1000
+        cache.store_response(spider, *page("https://example.com/a", body))
+
+        assert cache.total_bytes < len(body) / 10
+
+    def test_expires_old_responses(self, tmp_path: Path):
+        cache, spider = make_storage(tmp_path, HTTPCACHE_EXPIRATION_SECS=60)
+        cache.store_response(spider, *page("https://example.com/a", b"A"))
+        _ = cache._connection().execute("UPDATE responses SET stored = stored - 120")
+
+        assert cache.retrieve_response(spider, Request("https://example.com/a")) is None
+
+    def test_evicts_the_least_recently_used(self, tmp_path: Path):
+        cache, spider = make_storage(tmp_path, HTTPCACHE_MAX_BYTES=2500)
+        cache.store_response(spider, *page("https://example.com/1", os.urandom(1000)))
+        cache.store_response(spider, *page("https://example.com/2", os.urandom(1000)))
+        # Make the second response the least recently used.
+        _ = cache._connection().execute("UPDATE responses SET accessed = 0 WHERE rowid = 2")
+
+        cache.store_response(spider, *page("https://example.com/3", os.urandom(1000)))
+
+        assert cache.retrieve_response(spider, Request("https://example.com/2")) is None
+        assert cache.retrieve_response(spider, Request("https://example.com/1")) is not None
+        assert cache.retrieve_response(spider, Request("https://example.com/3")) is not None
+        assert cache.total_bytes <= 2500
+
+    def test_persists_across_runs(self, tmp_path: Path):
+        cache, spider = make_storage(tmp_path)
+        cache.store_response(spider, *page("https://example.com/a", b"A"))
+        cache.close_spider(spider)
+
+        cache, spider = make_storage(tmp_path)
+        assert cache.retrieve_response(spider, Request("https://example.com/a")) is not None
+
+
+def cache_middleware(cache_dir: Path, **settings: object) -> tuple[RevalidatingCacheMiddleware, Spider]:
+    crawler = get_crawler(Spider, {
+        "HTTPCACHE_ENABLED": True,
+        "HTTPCACHE_DIR":     str(cache_dir),
+        "HTTPCACHE_STORAGE": "public_law.httpcache.SqliteCacheStorage",
+        "HTTPCACHE_POLICY":  "public_law.httpcache.RevalidatingPolicy",
+        **settings,
+    })
+    crawler.spider = Spider.from_crawler(crawler, name="example")
+    middleware = RevalidatingCacheMiddleware.from_crawler(crawler)
+    middleware.spider_opened(crawler.spider)
+
+    return middleware, crawler.spider
+
+
+def fetch(
+    middleware: RevalidatingCacheMiddleware, spider: Spider, url: str, server_response: HtmlResponse
+) -> tuple[Request, object]:
+    """
+    Run a request through the middleware, with the server answering
+    `server_response`. The spider is passed, as Scrapy 2.13 does.
+    """
+    request = Request(url)
+    match middleware.process_request(request, spider):
+        case None:
+            return request, middleware.process_response(request, server_response.replace(request=request), spider)
+        case cached:
+            return request, cached
+
+
+class TestRevalidatingPolicy:
+    URL = "https://example.com/a"
+
+    def test_caches_without_validators_when_given_a_max_age(self, tmp_path: Path):
+        middleware, spider = cache_middleware(tmp_path, HTTPCACHE_MAX_AGE=3600)
+        _ = fetch(middleware, spider, self.URL, HtmlResponse(self.URL, body=b"A"))
+        _, response = fetch(middleware, spider, self.URL, HtmlResponse(self.URL, body=b"B"))
+
+        assert (response.body, middleware.stats.get_value("httpcache/hit")) == (b"A", 1)  # type: ignore
+
+    def test_revalidates_stale_responses(self, tmp_path: Path):
+        middleware, spider = cache_middleware(tmp_path)
+        etag = {"ETag": '"v1"', "Cache-Control": "max-age=0"}
+        _ = fetch(middleware, spider, self.URL, HtmlResponse(self.URL, body=b"A", headers=etag))
+
+        request, response = fetch(middleware, spider, self.URL, HtmlResponse(self.URL, status=304, headers=etag))
+
+        assert request.headers[b"If-None-Match"] == b'"v1"'
+        assert response.body == b"A"  # type: ignore
+
+    def test_counts_not_modified_as_a_hit(self, tmp_path: Path):
+        middleware, spider = cache_middleware(tmp_path)
+        etag = {"ETag": '"v1"', "Cache-Control": "max-age=0"}
+        _ = fetch(middleware, spider, self.URL, HtmlResponse(self.URL, body=b"A", headers=etag))
+        _ = fetch(middleware, spider, self.URL, HtmlResponse(self.URL, status=304, headers=etag))
+
+        stats = middleware.stats.get_stats()
+        assert (stats["httpcache/miss"], stats["httpcache/hit"], stats["httpcache/not_modified"]) == (1, 1, 1)
+
+    def test_downloads_changed_responses(self, tmp_path: Path):
+        middleware, spider = cache_middleware(tmp_path)
+        etag = {"ETag": '"v1"', "Cache-Control": "max-age=0"}
+        _ = fetch(middleware, spider, self.URL, HtmlResponse(self.URL, body=b"A", headers=etag))
+        _, response = fetch(middleware, spider, self.URL, HtmlResponse(self.URL, body=b"B", headers={"ETag": '"v2"'}))
+
+        assert response.body == b"B"  # type: ignore
+        assert middleware.stats.get_value("httpcache/invalidate") == 1
@@ -1,11 +1,10 @@
 from typing import cast
 
 import pytest
-from scrapy.http.response.xml import XmlResponse
 
 from public_law.legal_texts.models.crs import Article, Division, Subdivision, Title
 from public_law.legal_texts.parsers.usa.colorado.crs import parse_title_bang
-from public_law.test_util import fixture, null_logger
+from public_law.test_util import null_logger, xml_fixture
 
 
 class TestParseErrors:
@@ -13,7 +12,7 @@ class TestParseErrors:
     @pytest.fixture(scope="module")
     def parsed_title_1(self) -> Title:
         print(":fire: parsing title 1")
-        title_1 =  XmlResponse(body = fixture('usa', 'crs', "title01.xml"), url = "title01.xml", encoding = "utf-8")
+        title_1 =  xml_fixture("usa/crs/title01.xml", url="title01.xml")
         return parse_title_bang(title_1, null_logger)
 
 
@@ -34,7 +33,7 @@ class TestFromSubdivision:
     @pytest.fixture(scope="module")
     def parsed_title_7(self) -> Title:
         print(":fire: parsing title 7")
-        title_7 = XmlResponse(body = fixture('usa', 'crs', "title07.xml"), url = "title07.xml", encoding = "utf-8")
+        title_7 = xml_fixture("usa/crs/title07.xml", url="title07.xml")
         return parse_title_bang(title_7, null_logger)
 
 
@@ -129,7 +128,7 @@ class TestParseArticles:
     @pytest.fixture(scope="module")
     def parsed_title_16(self) -> Title:
         print(":fire: parsing title 16")
-        title_16 = XmlResponse(body = fixture('usa', 'crs', "title16.xml"), url = "title16.xml", encoding = "utf-8")
+        title_16 = xml_fixture("usa/crs/title16.xml", url="title16.xml")
         return parse_title_bang(title_16, null_logger)
 
 
@@ -177,7 +176,7 @@ class TestWithNoDivisions:
     @pytest.fixture(scope="module")
     def parsed_title_4(self) -> Title:
         print(":fire: parsing title 4")
-        title_4 =  XmlResponse(body = fixture('usa', 'crs', "title04.xml"), url = "title04.xml", encoding = "utf-8")
+        title_4 =  xml_fixture("usa/crs/title04.xml", url="title04.xml")
         return parse_title_bang(title_4, null_logger)
 
 
@@ -1,34 +1,27 @@
 from typing import cast
 
-from scrapy.http.response.xml import XmlResponse
-
 from public_law.legal_texts.models.crs import Division, Subdivision
 from public_law.legal_texts.parsers.usa.colorado.crs import parse_title_bang
-from public_law.test_util import fixture, null_logger
+from public_law.test_util import null_logger, xml_fixture
 
 # Divisions aren't parsing correctly.
-TITLE_1 = XmlResponse(body=fixture('usa', 'crs', "title01.xml"),
-                      url="title01.xml", encoding="utf-8")
+TITLE_1 = xml_fixture("usa/crs/title01.xml", url="title01.xml")
 PARSED_TITLE_1 = parse_title_bang(TITLE_1, null_logger)
 
 # A Title with no Divisions.
-TITLE_4 = XmlResponse(body=fixture('usa', 'crs', "title04.xml"),
-                      url="title04.xml", encoding="utf-8")
+TITLE_4 = xml_fixture("usa/crs/title04.xml", url="title04.xml")
 PARSED_TITLE_4 = parse_title_bang(TITLE_4, null_logger)
 
 # A Title with Divisions and Subdivisions.
-TITLE_07 = XmlResponse(body=fixture(
-    'usa', 'crs', "title07.xml"), url="title07.xml", encoding="utf-8")
+TITLE_07 = xml_fixture("usa/crs/title07.xml", url="title07.xml")
 PARSED_TITLE_07 = parse_title_bang(TITLE_07, null_logger)
 
 # A Title with an odd division title.
-TITLE_08 = XmlResponse(body=fixture(
-    'usa', 'crs', "title08.xml"), url="title08.xml", encoding="utf-8")
+TITLE_08 = xml_fixture("usa/crs/title08.xml", url="title08.xml")
 PARSED_TITLE_08 = parse_title_bang(TITLE_08, null_logger)
 
 # A Title which uses Divisions.
-TITLE_16 = XmlResponse(body=fixture(
-    'usa', 'crs', "title16.xml"), url="title16.xml", encoding="utf-8")
+TITLE_16 = xml_fixture("usa/crs/title16.xml", url="title16.xml")
 PARSED_TITLE_16 = parse_title_bang(TITLE_16, null_logger)
 
 
@@ -1,19 +1,18 @@
-from scrapy.http.response.xml import XmlResponse
-
+from public_law.legal_texts.models.crs import Section
 from public_law.legal_texts.parsers.usa.colorado.crs_sections import parse_sections
-from public_law.test_util import fixture, null_logger
+from public_law.test_util import null_logger, xml_fixture
 
 # A Title with no Divisions.
-TITLE_4 =  XmlResponse(body = fixture('usa', 'crs', "title04.xml"), url = "title04.xml", encoding = "utf-8")
+TITLE_4 =  xml_fixture("usa/crs/title04.xml", url="title04.xml")
 TITLE_4_SECTIONS = parse_sections(TITLE_4, null_logger)
 
 # A Title which uses Divisions.
-TITLE_16 = XmlResponse(body = fixture('usa', 'crs', "title16.xml"), url = "title16.xml", encoding = "utf-8")
+TITLE_16 = xml_fixture("usa/crs/title16.xml", url="title16.xml")
 TITLE_16_SECTIONS  = parse_sections(TITLE_16, null_logger)
 ARTICLE_1_SECTIONS = [s for s in TITLE_16_SECTIONS if s.article_number == "1"]
 
 # A Title which uses Divisions.
-TITLE_42 = XmlResponse(body = fixture('usa', 'crs', "title42.xml"), url = "title42.xml", encoding = "utf-8")
+TITLE_42 = xml_fixture("usa/crs/title42.xml", url="title42.xml")
 TITLE_42_SECTIONS = parse_sections(TITLE_42, null_logger)
 
 
@@ -34,6 +33,22 @@ class TestSectionsGenerally:
         assert len(ARTICLE_1_SECTIONS) == 10
 
 
+class TestSectionRepresentation:
+    def test_has_no_instance_dict(self):
+        assert not hasattr(TITLE_16_SECTIONS[0], "__dict__")
+
+    def test_shares_structural_values(self):
+        first, second = ARTICLE_1_SECTIONS[:2]
+
+        assert first.title_number is second.title_number
+        assert first.article_number is second.article_number
+
+    def test_takes_structure_from_the_number(self):
+        section = Section.from_parsed("Short title", "16-1-101", "<p>Text</p>")
+
+        assert (section.title_number, section.article_number) == ("16", "1")
+
+
 class TestParseFirstSection:
     SECTION = ARTICLE_1_SECTIONS[0]
 
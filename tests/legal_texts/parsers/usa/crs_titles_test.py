@@ -1,14 +1,12 @@
-from scrapy.http.response.xml import XmlResponse
-
 from public_law.legal_texts.parsers.usa.colorado.crs import parse_title_bang
-from public_law.test_util import fixture, null_logger
+from public_law.test_util import null_logger, xml_fixture
 
 # A Title with no Divisions.
-TITLE_4 =  XmlResponse(body = fixture('usa', 'crs', "title04.xml"), url = "title04.xml", encoding = "utf-8")
+TITLE_4 =  xml_fixture("usa/crs/title04.xml", url="title04.xml")
 PARSED_TITLE_4 = parse_title_bang(TITLE_4, null_logger)
 
 # A Title which uses Divisions.
-TITLE_16 = XmlResponse(body = fixture('usa', 'crs', "title16.xml"), url = "title16.xml", encoding = "utf-8")
+TITLE_16 = xml_fixture("usa/crs/title16.xml", url="title16.xml")
 PARSED_TITLE_16 = parse_title_bang(TITLE_16, null_logger)
 
 
@@ -0,0 +1,150 @@
+import asyncio
+import json
+from pathlib import Path
+
+from scrapy import Spider
+from scrapy.http.request import Request
+from scrapy.http.response.html import HtmlResponse
+from scrapy.utils.test import get_crawler
+
+from public_law.middlewares import (DownloadTimingMiddleware,
+                                    LatencyHistogram, ParseTimingMiddleware)
+
+
+def timing_middleware(**settings: object) -> tuple[DownloadTimingMiddleware, Spider]:
+    crawler = get_crawler(Spider, settings)
+    crawler.spider = Spider.from_crawler(crawler, name="example")
+
+    return DownloadTimingMiddleware.from_crawler(crawler), crawler.spider
+
+
+def download(middleware: DownloadTimingMiddleware, url: str, body: bytes, latency: float) -> None:
+    request = Request(url)
+    _ = middleware.process_request(request)
+    request.meta["download_latency"] = latency
+    _ = middleware.process_response(request, HtmlResponse(url, body=body, request=request))
+
+
+class TestDownloadTimingMiddleware:
+    def test_totals_each_host(self):
+        middleware, _ = timing_middleware()
+        download(middleware, "https://a.gov/1", b"x" * 100, latency=0.5)
+        download(middleware, "https://a.gov/2", b"x" * 50, latency=1.5)
+        download(middleware, "https://b.gov/1", b"x" * 10, latency=0.25)
+
+        a_gov = middleware.hosts["a.gov"]
+        assert (a_gov.requests, a_gov.bytes, a_gov.latency_secs, a_gov.max_latency) == (2, 150, 2.0, 1.5)
+        assert middleware.hosts["b.gov"].requests == 1
+
+    def test_counts_errors(self):
+        middleware, _ = timing_middleware()
+        request = Request("https://a.gov/1")
+        _ = middleware.process_request(request)
+        _ = middleware.process_exception(request, TimeoutError())
+
+        assert (middleware.hosts["a.gov"].requests, middleware.hosts["a.gov"].errors) == (0, 1)
+
+    def test_publishes_stats_at_close(self):
+        middleware, spider = timing_middleware()
+        download(middleware, "https://a.gov/1", b"x" * 100, latency=0.5)
+        middleware.spider_closed(spider)
+
+        assert middleware.crawler.stats.get_value("download_timing/a.gov/bytes") == 100  # type: ignore
+
+    def test_writes_a_report_slowest_host_first(self, tmp_path: Path):
+        middleware, spider = timing_middleware(DOWNLOAD_TIMING_REPORT=str(tmp_path / "%(name)s.json"))
+        download(middleware, "https://fast.gov/1", b"x", latency=0.0)
+        download(middleware, "https://slow.gov/1", b"x", latency=0.0)
+        middleware.hosts["slow.gov"].total_secs += 10
+        middleware.spider_closed(spider)
+
+        report = json.loads((tmp_path / "example.json").read_text())
+        assert report["spider"] == "example"
+        assert list(report["hosts"]) == ["slow.gov", "fast.gov"]
+
+
+def parse_timing_middleware(**settings: object) -> tuple[ParseTimingMiddleware, Spider]:
+    crawler = get_crawler(Spider, settings)
+    crawler.spider = Spider.from_crawler(crawler, name="example")
+
+    return ParseTimingMiddleware.from_crawler(crawler), crawler.spider
+
+
+def parse_glossary(response: HtmlResponse):
+    yield {"url": response.url}
+    yield Request(response.urljoin("next"))
+    yield {"url": response.url}
+
+
+def run_callback(middleware: ParseTimingMiddleware, url: str) -> list[object]:
+    request  = Request(url, callback=parse_glossary)
+    response = HtmlResponse(url, body=b"<html></html>", request=request)
+
+    return list(middleware.process_spider_output(response, parse_glossary(response)))
+
+
+class TestLatencyHistogram:
+    def test_buckets_durations(self):
+        histogram = LatencyHistogram()
+        for secs in (0.0005, 0.001, 0.003, 60.0):
+            histogram.add(secs)
+
+        report = histogram.report()
+        assert report["count"] == 4
+        assert report["max_secs"] == 60.0
+        assert report["buckets"] == {"<=1ms": 2, "<=5ms": 1, "slower": 1}
+
+
+class TestParseTimingMiddleware:
+    def test_passes_the_output_through(self):
+        middleware, _ = parse_timing_middleware()
+        output = run_callback(middleware, "https://a.gov/")
+
+        assert len(output) == 3
+        assert isinstance(output[1], Request)
+
+    def test_times_responses_and_items_per_callback(self):
+        middleware, _ = parse_timing_middleware()
+        _ = run_callback(middleware, "https://a.gov/1")
+        _ = run_callback(middleware, "https://a.gov/2")
+
+        assert sum(middleware.responses["parse_glossary"].counts) == 2
+        assert sum(middleware.items["parse_glossary"].counts) == 4
+
+    def test_publishes_stats_at_close(self):
+        middleware, spider = parse_timing_middleware()
+        _ = run_callback(middleware, "https://a.gov/")
+        middleware.spider_closed(spider)
+
+        assert middleware.crawler.stats.get_value("parse_timing/parse_glossary/count") == 1  # type: ignore
+
+    def test_writes_a_report_with_profiles_of_the_slowest(self, tmp_path: Path):
+        middleware, spider = parse_timing_middleware(
+            PARSE_TIMING_REPORT=str(tmp_path / "%(name)s.json"),
+            PARSE_TIMING_PROFILE_SLOWEST=2,
+        )
+        for page in range(5):
+            _ = run_callback(middleware, f"https://a.gov/{page}")
+        middleware.spider_closed(spider)
+
+        report = json.loads((tmp_path / "example.json").read_text())
+        assert report["callbacks"]["parse_glossary"]["items"]["count"] == 10
+        assert len(report["slowest"]) == 2
+        assert report["slowest"][0]["secs"] >= report["slowest"][1]["secs"]
+        assert (tmp_path / report["slowest"][0]["profile_file"]).exists()
+
+    def test_times_async_callbacks_without_profiling_them(self):
+        async def parse_async(response: HtmlResponse):
+            yield {"url": response.url}
+
+        async def consume():
+            middleware, _ = parse_timing_middleware(PARSE_TIMING_PROFILE_SLOWEST=1)
+            request  = Request("https://a.gov/", callback=parse_async)
+            response = HtmlResponse("https://a.gov/", body=b"", request=request)
+            output   = [item async for item in middleware.process_spider_output_async(response, parse_async(response))]
+            return output, middleware
+
+        output, middleware = asyncio.run(consume())
+        assert output == [{"url": "https://a.gov/"}]
+        assert sum(middleware.items["parse_async"].counts) == 1
+        assert middleware.slowest == []
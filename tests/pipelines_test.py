@@ -0,0 +1,323 @@
+import asyncio
+import gzip
+import json
+import queue
+import sqlite3
+from pathlib import Path
+from typing import Any
+
+import pytest
+from scrapy import Spider
+from scrapy.exceptions import DropItem, NotConfigured
+from scrapy.http.response.html import HtmlResponse
+from scrapy.utils.test import get_crawler
+from twisted.internet import threads
+from twisted.internet.defer import Deferred, maybeDeferred, succeed
+
+from public_law.glossaries.spiders.nzl.justice_glossary import \
+    JusticeGlossarySpider
+from public_law.legal_texts.models import crs, oar
+from public_law.pipelines import (ARTICLES, RULES, SECTIONS,
+                                  BackgroundWriterPipeline, DedupPipeline,
+                                  ParquetExportPipeline, ShardedOutputPipeline,
+                                  SqliteOutputPipeline, item_identity,
+                                  shard_key, table_rows)
+from public_law.shared.utils.text import URL, NonemptyString
+
+S = NonemptyString
+
+
+def article(number: str) -> crs.Article:
+    return crs.Article(S(f"Article {number}"), S(number), S("16"), None, None)
+
+
+def title() -> crs.Title:
+    division = crs.Division(S("GENERAL PROVISIONS"), [article("1"), article("2")], S("16"))
+    return crs.Title(S("Criminal Proceedings"), S("16"), [division], URL("https://leg.colorado.gov/"))
+
+
+def rule(number: str) -> oar.Rule:
+    return oar.Rule(number=number, name="Definitions", text="Text", authority=["ORS 1"], implements=[], history="H", kind="Rule")
+
+
+def dedup_pipeline(**settings: object) -> DedupPipeline:
+    pipeline = DedupPipeline.from_crawler(get_crawler(Spider, settings))
+    pipeline.open_spider()
+    return pipeline
+
+
+def glossary() -> dict[str, Any]:
+    """The item the spider yields, as the pipelines get it."""
+    with open("tests/fixtures/nzl/justice-glossary.html", "rb") as f:
+        response = HtmlResponse(url="https://www.justice.govt.nz/about/glossary/", body=f.read(), encoding="utf-8")
+
+    [item] = JusticeGlossarySpider().parse(response)
+    return item
+
+
+class TestItemIdentity:
+    def test_articles_are_numbered_within_their_title(self):
+        assert item_identity(article("1")) == ("Article", "16", "1")
+
+    def test_pages_are_identified_by_url(self):
+        assert item_identity({"source_url": "https://law.georgia.gov/opinions/1"}) == (
+            "Page", "https://law.georgia.gov/opinions/1"
+        )
+
+    def test_glossaries_are_identified_by_source(self):
+        assert item_identity(glossary()) == ("Glossary", "https://www.justice.govt.nz/about/glossary/")
+
+    def test_rules_without_a_number_have_none(self):
+        assert item_identity(oar.Rule(name="Untitled")) is None
+
+    def test_other_items_have_none(self):
+        assert item_identity({"kind": "CRS", "edition": 2024}) is None
+
+
+class TestDedupPipeline:
+    @pytest.mark.parametrize("storage", ["memory", "disk"])
+    def test_drops_repeated_items(self, storage: str, tmp_path: Path):
+        pipeline = dedup_pipeline(DEDUP_STORAGE=storage, DEDUP_DIR=str(tmp_path))
+        opinion  = {"source_url": "https://law.georgia.gov/opinions/1", "title": "An opinion"}
+
+        assert pipeline.process_item(opinion) is opinion
+        assert pipeline.process_item(rule("137-001-0005")) is not None
+        with pytest.raises(DropItem):
+            _ = pipeline.process_item(dict(opinion))
+
+        pipeline.close_spider()
+        assert pipeline.crawler.stats.get_value("dedup/dropped/Page") == 1  # type: ignore
+        assert list(tmp_path.iterdir()) == []
+
+    def test_passes_items_without_identity(self):
+        pipeline = dedup_pipeline()
+        item     = {"kind": "CRS", "edition": 2024}
+
+        assert pipeline.process_item(item) is item
+        assert pipeline.process_item(item) is item
+
+    def test_drops_repeated_glossaries(self):
+        pipeline = dedup_pipeline()
+        _ = pipeline.process_item(glossary())
+
+        with pytest.raises(DropItem):
+            _ = pipeline.process_item(glossary())
+
+    def test_drops_repeated_glossary_phrases(self):
+        pipeline = dedup_pipeline()
+        item     = glossary()
+        repeated = item | {"entries": item["entries"] + item["entries"][:2]}
+
+        assert pipeline.process_item(repeated)["entries"] == item["entries"]
+        assert pipeline.crawler.stats.get_value("dedup/dropped_entries") == 2  # type: ignore
+
+    def test_rejects_an_unknown_storage(self):
+        with pytest.raises(ValueError):
+            _ = DedupPipeline.from_crawler(get_crawler(Spider, {"DEDUP_STORAGE": "redis"}))
+
+
+class TestTableRows:
+    def test_a_section_is_one_row(self):
+        section = crs.Section.from_parsed("Definitions", "16-1-101", "The text.")
+
+        assert list(table_rows(section)) == [(SECTIONS, {
+            "number": "16-1-101", "name": "Definitions", "text": "The text.",
+            "title_number": "16", "article_number": "1", "part_number": None, "kind": "Section",
+        })]
+
+    def test_a_title_gives_its_articles(self):
+        rows = list(table_rows(title()))
+
+        assert [table for table, _ in rows] == [ARTICLES, ARTICLES]
+        assert [row["number"] for _, row in rows] == ["1", "2"]
+
+    def test_the_oar_tree_gives_its_rules(self):
+        tree = oar.OAR(chapters=[oar.Chapter(divisions=[oar.Division(rules=[rule("137-001-0005")])])])
+
+        match list(table_rows(tree)):
+            case [(table, row)]:
+                assert table is RULES
+                assert (row["chapter_number"], row["division_number"]) == ("137", "1")
+                assert row["authority"] == ["ORS 1"]
+            case rows:
+                pytest.fail(f"Expected one rule, got {rows}")
+
+    def test_other_items_give_nothing(self):
+        assert list(table_rows({"kind": "CRS", "edition": 2024})) == []
+
+
+class TestParquetExportPipeline:
+    def test_is_disabled_without_an_export_dir(self):
+        with pytest.raises(NotConfigured):
+            _ = ParquetExportPipeline.from_crawler(get_crawler(Spider))
+
+    def test_writes_typed_row_groups(self, tmp_path: Path):
+        pq = pytest.importorskip("pyarrow.parquet")
+        crawler  = get_crawler(Spider, {"PARQUET_EXPORT_DIR": str(tmp_path), "PARQUET_ROW_GROUP_SIZE": 2})
+        pipeline = ParquetExportPipeline.from_crawler(crawler)
+        pipeline.open_spider(Spider(name="usa_colorado_crs"))
+
+        sections = [crs.Section.from_parsed("Name", f"16-1-{n}", "Text") for n in range(101, 106)]
+        for item in [*sections, title()]:
+            assert pipeline.process_item(item) is item
+        pipeline.close_spider()
+
+        file = pq.ParquetFile(tmp_path / "usa_colorado_crs-sections.parquet")
+        assert file.metadata.num_rows == 5
+        assert file.metadata.num_row_groups == 3
+        assert file.read().column("title_number").to_pylist() == ["16"] * 5
+        assert pq.read_table(tmp_path / "usa_colorado_crs-articles.parquet").num_rows == 2
+
+
+def writer_pipeline(tmp_path: Path, **settings: object) -> BackgroundWriterPipeline:
+    crawler  = get_crawler(Spider, {"BACKGROUND_WRITER_FILE": str(tmp_path / "%(name)s.jsonl.gz"), **settings})
+    pipeline = BackgroundWriterPipeline.from_crawler(crawler)
+    pipeline.open_spider(Spider(name="example"))
+    return pipeline
+
+
+def written(tmp_path: Path) -> list[dict[str, object]]:
+    return [json.loads(line) for line in gzip.decompress((tmp_path / "example.jsonl.gz").read_bytes()).splitlines()]
+
+
+def queue_is_full(_: object) -> None:
+    raise queue.Full
+
+
+class TestBackgroundWriterPipeline:
+    def test_is_disabled_without_a_file(self):
+        with pytest.raises(NotConfigured):
+            _ = BackgroundWriterPipeline.from_crawler(get_crawler(Spider))
+
+    def test_writes_every_item_in_order(self, tmp_path: Path):
+        pipeline = writer_pipeline(tmp_path, BACKGROUND_WRITER_BATCH_SIZE=3)
+        items    = [{"number": n} for n in range(10)]
+
+        for item in items:
+            assert asyncio.run(pipeline.process_item(item)) is item
+        pipeline.finish()
+
+        assert written(tmp_path) == items
+        assert pipeline.crawler.stats.get_value("background_writer/batches") == 3  # type: ignore
+
+    def test_serializes_dataclass_items(self, tmp_path: Path):
+        pipeline = writer_pipeline(tmp_path)
+        _ = asyncio.run(pipeline.process_item(crs.Section.from_parsed("Definitions", "16-1-101", "The text.")))
+        pipeline.finish()
+
+        assert written(tmp_path)[0]["number"] == "16-1-101"
+
+    def test_holds_batches_back_in_order_while_the_queue_is_full(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        pipeline = writer_pipeline(tmp_path, BACKGROUND_WRITER_QUEUE_SIZE=2)
+        monkeypatch.setattr(pipeline.queue, "put_nowait", queue_is_full)
+
+        first  = pipeline.enqueue([{"number": 1}])
+        second = pipeline.enqueue([{"number": 2}])
+        assert isinstance(first, Deferred) and isinstance(second, Deferred)
+        assert not first.called
+
+        monkeypatch.undo()
+        pipeline.queue_pending()
+        assert first.called and second.called
+
+        pipeline.finish()
+        assert written(tmp_path) == [{"number": 1}, {"number": 2}]
+
+    def test_finishes_when_scrapy_closes_it(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        # Without a running reactor, finish in this thread.
+        monkeypatch.setattr(threads, "deferToThread", maybeDeferred)
+        pipeline = writer_pipeline(tmp_path)
+        _ = asyncio.run(pipeline.process_item({"number": 1}))
+
+        # As Scrapy 2.13 calls it.
+        closed = succeed(Spider(name="example")).addCallback(pipeline.close_spider)
+
+        assert closed.called
+        assert written(tmp_path) == [{"number": 1}]
+
+    def test_reports_a_writer_error(self, tmp_path: Path):
+        pipeline = writer_pipeline(tmp_path, BACKGROUND_WRITER_BATCH_SIZE=1)
+        _ = asyncio.run(pipeline.process_item({"unserializable": object()}))
+
+        with pytest.raises(RuntimeError):
+            pipeline.finish()
+
+
+class TestShardedOutputPipeline:
+    def test_keys_items_by_kind_and_title(self):
+        assert shard_key(crs.Section.from_parsed("Name", "16-1-101", "Text")) == ("Section", "16")
+        assert shard_key(title()) == ("Title", "16")
+        assert shard_key({"kind": "CRS", "edition": 2024}) == ("CRS", None)
+
+    def test_writes_a_file_per_shard_and_a_manifest(self, tmp_path: Path):
+        crawler  = get_crawler(Spider, {"SHARDED_OUTPUT_DIR": str(tmp_path / "%(name)s")})
+        pipeline = ShardedOutputPipeline.from_crawler(crawler)
+        pipeline.open_spider(Spider(name="usa_colorado_crs"))
+
+        items = [
+            {"kind": "CRS", "edition": 2024},
+            crs.Section.from_parsed("Name", "16-1-101", "Text"),
+            crs.Section.from_parsed("Name", "17-1-101", "Text"),
+            crs.Section.from_parsed("Name", "16-1-102", "Text"),
+        ]
+        for item in items:
+            assert pipeline.process_item(item) is item
+        pipeline.close_spider()
+
+        output   = tmp_path / "usa_colorado_crs"
+        sections = [json.loads(line) for line in (output / "Section/title-16.jsonl").read_text().splitlines()]
+        assert [s["number"] for s in sections] == ["16-1-101", "16-1-102"]
+
+        manifest = json.loads((output / "manifest.json").read_text())
+        assert [(s["kind"], s["title_number"], s["items"]) for s in manifest["shards"]] == [
+            ("CRS", None, 1), ("Section", "16", 2), ("Section", "17", 1),
+        ]
+        assert manifest["shards"][1]["bytes"] == (output / "Section/title-16.jsonl").stat().st_size
+
+
+class TestSqliteOutputPipeline:
+    def test_is_disabled_without_a_file(self):
+        with pytest.raises(NotConfigured):
+            _ = SqliteOutputPipeline.from_crawler(get_crawler(Spider))
+
+    def test_stores_and_indexes_the_legal_texts(self, tmp_path: Path):
+        crawler  = get_crawler(Spider, {"SQLITE_OUTPUT_FILE": str(tmp_path / "%(name)s.sqlite3"), "SQLITE_OUTPUT_BATCH_SIZE": 2})
+        pipeline = SqliteOutputPipeline.from_crawler(crawler)
+        pipeline.open_spider(Spider(name="example"))
+
+        tree = oar.OAR(chapters=[oar.Chapter(number="137", name="Department of Justice", divisions=[
+            oar.Division(number="1", name="Procedural Rules", rules=[rule("137-001-0005")]),
+        ])])
+        opinion = {
+            "source_url": "https://law.georgia.gov/opinions/1", "title": "An opinion", "is_official": True,
+            "date": "2024-01-01", "summary": "About bail", "full_text": "The text.", "citations": {"ocga": ["16-1-1"]},
+        }
+        items = [
+            title(),
+            crs.Section.from_parsed("Bail", "16-4-101", "Bail may be granted."),
+            crs.Section.from_parsed("Definitions", "16-4-102", "In this article:"),
+            tree,
+            opinion,
+        ]
+        for item in items:
+            assert pipeline.process_item(item) is item
+        pipeline.close_spider()
+
+        db = sqlite3.connect(tmp_path / "example.sqlite3")
+        assert db.execute("SELECT name FROM crs_sections WHERE number = '16-4-102'").fetchall() == [("Definitions",)]
+        assert db.execute("SELECT count(*) FROM crs_articles").fetchone() == (2,)
+        assert db.execute("SELECT title_number, name FROM crs_divisions").fetchall() == [("16", "General Provisions")]
+        assert db.execute("SELECT chapter_number, division_number, authority FROM oar_rules").fetchall() == [
+            ("137", "1", '["ORS 1"]'),
+        ]
+        assert db.execute("SELECT chapter_number, number FROM oar_divisions").fetchall() == [("137", "1")]
+        assert db.execute(
+            "SELECT oar_rules.number, oar_divisions.name FROM oar_rules JOIN oar_divisions "
+            "ON oar_divisions.chapter_number = oar_rules.chapter_number AND oar_divisions.number = oar_rules.division_number"
+        ).fetchall() == [("137-001-0005", "Procedural Rules")]
+        assert db.execute("SELECT citations FROM ag_opinions").fetchone() == ('{"ocga": ["16-1-1"]}',)
+        assert db.execute(
+            "SELECT number FROM crs_sections WHERE rowid IN "
+            "(SELECT rowid FROM crs_sections_fts WHERE crs_sections_fts MATCH 'bail')"
+        ).fetchall() == [("16-4-101",)]
+        assert db.execute("PRAGMA journal_mode").fetchone() == ("wal",)
@@ -59,3 +59,21 @@ def it_creates_a_dict_via_core_func(simple_input, simple_output): # type: ignore
     generated_dict = dict(simple_input) # type: ignore
 
     assert generated_dict == simple_output
+
+
+def it_builds_the_dict_once(simple_input): # type: ignore
+    assert simple_input["dcterms:subject"] is simple_input["dcterms:subject"] # type: ignore
+
+
+def it_returns_a_new_dict_each_time(simple_input): # type: ignore
+    first = simple_input.as_dublin_core_dict() # type: ignore
+    first["dcterms:title"] = "Changed"
+
+    assert simple_input["dcterms:title"] == "The Title"
+
+
+def it_returns_new_subjects_each_time(simple_input): # type: ignore
+    first = simple_input.as_dublin_core_dict() # type: ignore
+    first["dcterms:subject"][0]["rdfs:label"] = "Changed"
+
+    assert simple_input["dcterms:subject"][0]["rdfs:label"] == "taxation" # type: ignore
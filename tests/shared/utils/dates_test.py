@@ -1,7 +1,14 @@
+import os
 import re
+from datetime import date, datetime, timezone, tzinfo
 from subprocess import check_output
 
-from public_law.shared.utils.dates import todays_date
+import pytest
+
+from public_law.shared.models.metadata import Metadata
+from public_law.shared.utils.dates import (DEFAULT_TIMEZONE, Clock, clock, current_year,
+                                           today, todays_date, use_clock, use_timezone)
+from public_law.shared.utils.text import NonemptyString as S
 
 
 class TestTodaysDate:
@@ -9,5 +16,57 @@ class TestTodaysDate:
         assert re.match(r"^\d\d\d\d-\d\d-\d\d$", todays_date())
 
     def test_matches_unix_date_cmd(self):
-        unix_date = check_output(["date", "+%Y-%m-%d"], encoding="utf8").strip()
+        unix_date = check_output(
+            ["date", "+%Y-%m-%d"], encoding="utf8", env=os.environ | {"TZ": clock().timezone}
+        ).strip()
         assert todays_date() == unix_date
+
+
+@pytest.fixture
+def fixed_clock():
+    previous = use_clock(Clock(now=lambda tz: datetime(2024, 2, 29, 23, 30, tzinfo=tz)))
+    yield clock()
+    _ = use_clock(previous)
+
+
+class TestClock:
+    def test_can_be_fixed(self, fixed_clock: Clock):
+        assert (today(), todays_date(), current_year()) == (date(2024, 2, 29), "2024-02-29", 2024)
+
+    def test_computes_the_date_once(self):
+        calls: list[datetime] = []
+
+        def now(tz: tzinfo) -> datetime:
+            calls.append(datetime(2024, 1, 1))
+            return calls[-1]
+
+        run_clock = Clock(now=now)
+        assert run_clock.today == run_clock.today
+        assert len(calls) == 1
+
+    def test_gives_the_date_in_its_timezone(self):
+        utc = datetime(2026, 10, 19, 14, 38, tzinfo=timezone.utc)
+
+        def now(tz: tzinfo) -> datetime:
+            return utc.astimezone(tz)
+
+        assert Clock("Pacific/Kiritimati", now).today == date(2026, 10, 20)
+        assert Clock("US/Mountain", now).today == date(2026, 10, 19)
+
+    def test_keeps_the_clock_for_the_same_timezone(self, fixed_clock: Clock):
+        assert use_timezone(DEFAULT_TIMEZONE) is fixed_clock
+
+    def test_replaces_the_clock_for_another_timezone(self, fixed_clock: Clock):
+        assert use_timezone("Australia/Sydney").timezone == "Australia/Sydney"
+
+    def test_stamps_metadata_with_the_run_date(self, fixed_clock: Clock):
+        metadata = Metadata(
+            dcterms_title=S("Title"),
+            dcterms_language="en",
+            dcterms_coverage="USA",
+            dcterms_subject=(),
+            dcterms_source=S("https://example.com"),
+            publiclaw_sourceModified="unknown",
+            publiclaw_sourceCreator=S("Creator"),
+        )
+        assert metadata.dcterms_modified == date(2024, 2, 29)
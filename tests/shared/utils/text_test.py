@@ -1,6 +1,9 @@
 import pytest
 
-from public_law.shared.utils.text import NonemptyString, titleize, truncate_words
+from public_law.shared.utils.text import (LoCSubject, NonemptyString, Normalizer,
+                                          Sentence, WikidataTopic, titleize,
+                                          truncate_words)
+from public_law.shared.utils import text
 
 
 class TestTitleize:
@@ -33,6 +36,74 @@ class TestNonemptyString:
         with pytest.raises(ValueError):
             _ = NonemptyString(123)
 
+    def test_from_str_makes_a_nonempty_string(self):
+        ns = NonemptyString.from_str("hello")
+        assert (type(ns), ns) == (NonemptyString, "hello")
+
+    def test_from_str_rejects_an_empty_string(self):
+        with pytest.raises(ValueError, match="empty"):
+            _ = NonemptyString.from_str("")
+
+
+class TestSubjectURL:
+    def test_repeated_id_is_the_same_instance(self):
+        assert LoCSubject("sh85034952") is LoCSubject("sh85034952")
+
+    def test_full_url_is_the_same_instance_as_its_id(self):
+        assert WikidataTopic("https://www.wikidata.org/wiki/Q638532") is WikidataTopic("Q638532")
+
+    def test_kinds_are_interned_separately(self):
+        wikidata, loc = WikidataTopic("Q1"), LoCSubject("sh1")
+
+        assert WikidataTopic("Q1") is wikidata
+        assert LoCSubject("sh1") is loc
+        assert type(wikidata) is WikidataTopic
+        assert type(loc) is LoCSubject
+
+    def test_raises_error_for_invalid_id(self):
+        with pytest.raises(ValueError, match="Invalid subject ID"):
+            _ = LoCSubject("Q638532")
+
+
+class TestNormalizer:
+    SAMPLES = [
+        "  plain   text ",
+        "ends with a period.",
+        'ends with a quote."',
+        "<p>a paragraph</p>",
+        "\n  multi\nline\ttext",
+    ]
+
+    @pytest.mark.parametrize("sample", SAMPLES)
+    def test_matches_the_pipe_chain(self, sample: str):
+        chain = Sentence(text.capitalize_first_char(text.cleanup(sample)))
+
+        assert Normalizer(capitalize=True, sentence=True)(sample) == chain
+
+    def test_makes_a_sentence(self):
+        assert type(Normalizer(sentence=True)("x")) is Sentence
+
+    def test_to_sentence_makes_a_sentence(self):
+        sentence = Normalizer(capitalize=True).to_sentence("a  word")
+
+        assert sentence == "A word."
+        assert type(sentence) is Sentence
+
+    def test_makes_a_nonempty_string(self):
+        assert type(Normalizer()("x")) is NonemptyString
+
+    def test_straightens_quotes_and_apostrophes(self):
+        normalize = Normalizer(quotes=True) | Normalizer(apostrophes=True)
+
+        assert normalize("“it’s”") == '"it\'s"'
+
+    def test_strips_characters_and_uncovered_whitespace(self):
+        assert Normalizer(lstrip=":", rstrip=":")(" : term : ") == "term"
+
+    def test_raises_error_if_nothing_is_left(self):
+        with pytest.raises(ValueError, match="empty"):
+            _ = Normalizer(lstrip=":")(" : ")
+
 
 class TestTruncateWords:
     def test_truncates_words_to_length_1(self):
@@ -0,0 +1,19 @@
+"""
+The parts of lxml.etree which the parsers use. lxml is a compiled module
+without type information.
+"""
+
+from typing import Any, Literal, overload
+
+class XPath:
+    def __init__(self, path: str, *, namespaces: dict[str, str] | None = ..., smart_strings: bool = ...) -> None: ...
+    def __call__(self, _etree_or_element: Any, /, **_variables: Any) -> Any: ...
+
+@overload
+def tostring(
+    element_or_tree: Any, *, encoding: Literal["unicode"] | type[str], method: str = ..., with_tail: bool = ...
+) -> str: ...
+@overload
+def tostring(
+    element_or_tree: Any, *, encoding: str | None = ..., method: str = ..., with_tail: bool = ...
+) -> bytes: ...
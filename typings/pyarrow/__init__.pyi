@@ -0,0 +1,17 @@
+"""
+The parts of pyarrow which the Parquet export uses. It's an optional
+dependency, so it isn't always installed when type checking.
+"""
+from typing import Any, Iterable
+
+class DataType: ...
+
+class Schema: ...
+
+class Table:
+    @staticmethod
+    def from_pylist(mapping: list[dict[str, Any]], schema: Schema | None = ...) -> Table: ...
+
+def schema(fields: Iterable[tuple[str, DataType]]) -> Schema: ...
+def list_(value_type: DataType) -> DataType: ...
+def string() -> DataType: ...
@@ -0,0 +1,17 @@
+from os import PathLike
+from typing import Any
+
+from pyarrow import Schema, Table
+
+class ParquetWriter:
+    def __init__(
+        self,
+        where: str | PathLike[str],
+        schema: Schema,
+        *,
+        use_dictionary: bool | list[str] = ...,
+        compression: str = ...,
+        **options: Any,
+    ) -> None: ...
+    def write_table(self, table: Table, row_group_size: int | None = ...) -> None: ...
+    def close(self) -> None: ...
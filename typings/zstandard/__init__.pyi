@@ -0,0 +1,16 @@
+"""
+The parts of zstandard which the exporters use. It's an optional
+dependency, so it isn't always installed when type checking.
+"""
+from typing import IO
+
+class ZstdCompressionWriter:
+    def write(self, data: bytes, /) -> int: ...
+    def flush(self, flush_mode: int = ...) -> int: ...
+    def close(self) -> None: ...
+
+class ZstdCompressor:
+    def __init__(self, level: int = ...) -> None: ...
+    def stream_writer(
+        self, writer: IO[bytes], size: int = ..., write_size: int = ..., *, closefd: bool = ...
+    ) -> ZstdCompressionWriter: ...